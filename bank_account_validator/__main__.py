@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Streams CSV or JSON Lines records through the validator, writing accepted and rejected rows to separate outputs.
+
+    python -m bank_account_validator accounts.csv.gz --accepted ok.csv --rejected rejected.csv \
+        --columns bank_code=banco,branch=agencia,branch_digit=dv_agencia,account=conta,account_digit=dv_conta
+"""
+from __future__ import print_function
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+import time
+from itertools import islice
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import RECORD_FIELDS, validate_chunk
+from bank_account_validator.cache import PersistentCache, ResultCache
+from bank_account_validator.dedup import Deduplicator
+from bank_account_validator.report import ValidationReport
+from bank_account_validator.suggestions import suggest
+
+GZIP_MAGIC = b'\x1f\x8b'
+FORMATS = ('csv', 'jsonl')
+
+
+def _binary_stream(stream):
+    return getattr(stream, 'buffer', stream)
+
+
+def open_input(path):
+    # Binary input (file or stdin), transparently gunzipped when it starts with the gzip magic number.
+    raw = io.open(path, 'rb') if path != '-' else _binary_stream(sys.stdin)
+    if not isinstance(raw, io.BufferedReader):
+        raw = io.BufferedReader(raw)
+
+    if raw.peek(2)[:2] == GZIP_MAGIC:
+        raw = gzip.GzipFile(fileobj=raw, mode='rb')
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='')
+
+
+def open_output(path):
+    if path == '-':
+        return io.TextIOWrapper(_binary_stream(sys.stdout), encoding='utf-8', newline='', write_through=True)
+
+    raw = gzip.open(path, 'wb') if path.endswith('.gz') else io.open(path, 'wb')
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='')
+
+
+def guess_format(path):
+    name = path[:-3] if path.endswith('.gz') else path
+    return 'jsonl' if name.endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+
+
+def parse_columns(value):
+    # 'bank_code=banco,branch=agencia' -> {'bank_code': 'banco', 'branch': 'agencia', ...}, other fields keep their names.
+    columns = dict((field, field) for field in RECORD_FIELDS)
+    for item in filter(None, (value or '').split(',')):
+        field, _, column = item.partition('=')
+        if field not in columns or not column:
+            raise argparse.ArgumentTypeError('Invalid column mapping: "{}".'.format(item))
+        columns[field] = column
+    return columns
+
+
+class CSVFormat(object):
+    def __init__(self, stream):
+        self.reader = csv.DictReader(stream)
+        self.fieldnames = self.reader.fieldnames or []
+
+    def rows(self):
+        return self.reader
+
+    def writer(self, stream, extra_fields=()):
+        # Extra fields may already be there when re-running over a rejected-records file.
+        fieldnames = list(self.fieldnames) + [field for field in extra_fields if field not in self.fieldnames]
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        writer.writeheader()
+        return writer.writerow
+
+
+class JSONLinesFormat(object):
+    fieldnames = None
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def rows(self):
+        for line in self.stream:
+            if line.strip():
+                yield json.loads(line)
+
+    def writer(self, stream, extra_fields=()):
+        def write(row):
+            stream.write(json.dumps(row))
+            stream.write('\n')
+        return write
+
+
+def validate_rows(rows, columns, country='BR', chunk_size=1000, cache=None, dedup=None):
+    # Yields (row, reason) pairs, holding at most `chunk_size` rows in memory.
+    fields = [columns[field] for field in RECORD_FIELDS]
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+
+        records = [tuple(row.get(field, '') for field in fields) for row in chunk]
+        for row, reason in zip(chunk, validate_chunk(records, country, cache, dedup)):
+            yield row, reason
+
+
+def format_suggestions(row, columns, country='BR'):
+    # '1769-8/0200040-7 1769-8/0200041-5': branch[-digit]/account[-digit] of each suggestion, space separated.
+    record = [row.get(columns[field], '') for field in RECORD_FIELDS]
+    return ' '.join(
+        '/'.join('-'.join(filter(None, pair)) for pair in ((x.branch, x.branch_digit), (x.account, x.account_digit)))
+        for x in suggest(*record, country=country)
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m bank_account_validator',
+                                     description='Validates bank accounts from a CSV or JSON Lines file (optionally gzipped).')
+    parser.add_argument('input', nargs='?', default='-', help='input file; "-" (default) reads from stdin')
+    parser.add_argument('--format', choices=FORMATS, help='input format; guessed from the file name when omitted (default: csv)')
+    parser.add_argument('--columns', type=parse_columns, default=parse_columns(None),
+                        help='column mapping, e.g. "bank_code=banco,branch=agencia,account=conta"')
+    parser.add_argument('--country', default='BR', help='country of every record (default: BR)')
+    parser.add_argument('--accepted', default='-', help='output for valid rows; "-" (default) writes to stdout')
+    parser.add_argument('--rejected', help='output for invalid rows, with "reason" and "reason_code" columns')
+    parser.add_argument('--suggest', action='store_true',
+                        help='add a "suggestions" column to rejected rows: valid accounts one typo away, as branch/account')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='records validated at a time (default: 1000)')
+    caches = parser.add_mutually_exclusive_group()
+    caches.add_argument('--cache-size', type=int, default=0, help='remember the outcome of this many accounts (default: 0, off)')
+    caches.add_argument('--cache-file', help='remember outcomes across runs in this SQLite database, created if missing')
+    parser.add_argument('--dedup', action='store_true', help='check the accounts repeated inside each chunk only once')
+    parser.add_argument('--report', help='write a JSON summary here: counts per reason and bank, most failing branches')
+    parser.add_argument('--quiet', action='store_true', help="don't report throughput on stderr")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    input_format = args.format or guess_format(args.input)
+    source = open_input(args.input)
+    reader = CSVFormat(source) if input_format == 'csv' else JSONLinesFormat(source)
+
+    if reader.fieldnames is not None:
+        missing = [column for field, column in args.columns.items()
+                   if column not in reader.fieldnames and field in ('bank_code', 'branch', 'account')]
+        if missing:
+            parser.error('Missing input columns: {}.'.format(', '.join(sorted(missing))))
+
+    outputs = []
+    accepted_stream = open_output(args.accepted)
+    outputs.append(accepted_stream)
+    write_accepted = reader.writer(accepted_stream)
+
+    write_rejected = None
+    if args.rejected:
+        rejected_stream = open_output(args.rejected)
+        outputs.append(rejected_stream)
+        extra_fields = ('reason', 'reason_code', 'suggestions') if args.suggest else ('reason', 'reason_code')
+        write_rejected = reader.writer(rejected_stream, extra_fields=extra_fields)
+
+    cache = ResultCache(args.cache_size) if args.cache_size > 0 else None
+    if args.cache_file:
+        cache = PersistentCache(args.cache_file)
+    dedup = Deduplicator() if args.dedup else None
+    report = ValidationReport() if args.report else None
+    accepted = rejected = 0
+    started = time.time()
+    try:
+        for row, reason in validate_rows(reader.rows(), args.columns, args.country, args.chunk_size, cache, dedup):
+            if report is not None:
+                report.add(row.get(args.columns['bank_code']), row.get(args.columns['branch']), reason)
+            if reason == reasons.OK:
+                accepted += 1
+                write_accepted(row)
+            else:
+                rejected += 1
+                if write_rejected is not None:
+                    row['reason'] = reasons.NAMES[reason]
+                    row['reason_code'] = reason
+                    if args.suggest:
+                        row['suggestions'] = format_suggestions(row, args.columns, args.country)
+                    write_rejected(row)
+    finally:
+        source.close()
+        if args.cache_file:
+            cache.flush()
+        for stream in outputs:
+            if stream.buffer is _binary_stream(sys.stdout):
+                stream.flush()
+                stream.detach()  # leave stdout open
+            else:
+                stream.close()
+
+    if report is not None:
+        with io.open(args.report, 'w', encoding='utf-8') as f:
+            f.write(report.to_json(indent=2, sort_keys=True))
+
+    if not args.quiet:
+        elapsed = max(time.time() - started, 1e-9)
+        total = accepted + rejected
+        print('{} rows ({} accepted, {} rejected) in {:.2f}s: {:.0f} rows/s'.format(
+            total, accepted, rejected, elapsed, total / elapsed), file=sys.stderr)
+        if cache is not None:
+            print('cache: {hits} hits, {misses} misses, {evictions} evictions'.format(**cache.stats()), file=sys.stderr)
+        if dedup is not None:
+            print('dedup: {duplicates} of {records} rows were duplicates ({ratio:.1%})'.format(**dedup.stats()), file=sys.stderr)
+
+    if args.cache_file:
+        cache.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+from collections import deque
+from functools import partial
+from itertools import islice
+
+from bank_account_validator import reasons
+from bank_account_validator.core import Bank
+
+RECORD_FIELDS = ('bank_code', 'branch', 'branch_digit', 'account', 'account_digit')
+EXECUTORS = ('threads', 'processes')
+
+
+def _as_tuple(record):
+    if isinstance(record, dict):
+        return (record['bank_code'], record['branch'], record.get('branch_digit', ''), record['account'],
+                record.get('account_digit', ''))
+    return record
+
+
+def _check_group(bank_class, rows, cache=None, dedup=None):
+    validator = bank_class.validator
+    if dedup is not None and dedup.active:
+        check_digits_many = partial(cache.check_digits_many, validator) if cache is not None else None
+        for item in dedup.check_rows(validator, rows, check_digits_many):
+            yield item
+        return
+
+    if cache is not None:
+        for (index, _), reason in zip(rows, cache.check_many(validator, [record[1:] for _, record in rows])):
+            yield index, reason
+        return
+
+    check = validator.check
+    for index, (_, branch, branch_digit, account, account_digit) in rows:
+        yield index, check(branch, branch_digit, account, account_digit)
+
+
+def validate_chunk(records, country='BR', cache=None, dedup=None):
+    records = [_as_tuple(record) for record in records]
+
+    groups = {}
+    for index, record in enumerate(records):
+        groups.setdefault(record[0], []).append((index, record))
+
+    results = [reasons.BANK_NOT_IMPLEMENTED] * len(records)
+    for bank_class, rows in zip(Bank.get_many(list(groups), country), groups.values()):
+        if bank_class is None:
+            continue
+
+        for index, reason in _check_group(bank_class, rows, cache, dedup):
+            results[index] = reason
+
+    return results
+
+
+def _chunks(records, chunk_size):
+    # Lists of up to `chunk_size` records, as tuples (which, unlike dicts, travel cheaply to worker processes).
+    records = iter(records)
+    while True:
+        chunk = [_as_tuple(record) for record in islice(records, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def _validate_threaded(records, country, chunk_size, cache, dedup, workers, max_pending):
+    # Validators, kernels and the registry are read-only once built (and safe to build concurrently), so chunks are
+    # validated by plain threads sharing them; the GIL, where there is one, is the only limit to scaling.
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = workers or multiprocessing.cpu_count()
+    max_pending = max_pending or 2 * workers
+    pending = deque()
+    with ThreadPoolExecutor(workers) as executor:
+        try:
+            for chunk in _chunks(records, chunk_size):
+                pending.append(executor.submit(validate_chunk, chunk, country, cache, dedup))
+
+                while len(pending) >= max_pending:
+                    for reason in pending.popleft().result():
+                        yield reason
+
+            while pending:
+                for reason in pending.popleft().result():
+                    yield reason
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def validate_many(records, country='BR', chunk_size=1000, cache=None, executor=None, workers=None, max_pending=None,
+                  dedup=None):
+    """
+    Validates an iterable of records - (bank_code, branch, branch_digit, account, account_digit) tuples or dicts
+    with those keys - yielding one reason code per record, in input order. reasons.OK means a valid account.
+    Records are consumed `chunk_size` at a time and grouped by bank inside each chunk; nothing is raised per record.
+    Pass a cache.ResultCache (or PersistentCache) as `cache` to skip the checks of accounts already seen, and a
+    dedup.Deduplicator as `dedup` to check the accounts repeated inside a chunk only once.
+
+    With `executor='threads'` chunks are validated by a pool of `workers` threads (default: one per CPU), which is
+    expected to scale across cores on free-threaded Python builds (not measured yet); 'processes' uses
+    parallel.validate_parallel() instead, which can't share a cache or a deduplicator. Either way at most
+    `max_pending` chunks (default: twice the workers) are held in memory.
+    """
+    if executor is not None and executor not in EXECUTORS:
+        raise ValueError('Invalid executor: {!r}. Use one of: {}.'.format(executor, ', '.join(EXECUTORS)))
+
+    if executor == 'threads':
+        return _validate_threaded(records, country, chunk_size, cache, dedup, workers, max_pending)
+
+    if executor == 'processes':
+        if cache is not None or dedup is not None:
+            raise ValueError('Caches and deduplicators are per process, so they can\'t be used with executor="processes".')
+        from bank_account_validator.parallel import validate_parallel
+        return validate_parallel(records, country, workers=workers, chunk_size=chunk_size, max_pending=max_pending)
+
+    return _validate_sequential(records, country, chunk_size, cache, dedup)
+
+
+def _validate_sequential(records, country, chunk_size, cache, dedup):
+    for chunk in _chunks(records, chunk_size):
+        for reason in validate_chunk(chunk, country, cache, dedup):
+            yield reason
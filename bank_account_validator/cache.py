@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import OrderedDict
+
+from bank_account_validator.rules import rule_version
+
+# Most values bound in one SQLite statement; older SQLite builds allow 999.
+MAX_PARAMETERS = 900
+
+
+class ResultCache(object):
+    """
+    Bounded, thread-safe LRU memo of validation outcomes, for streams where the same accounts keep coming back.
+    Keys are the normalized (country, bank_code, branch, branch_digit, account, account_digit); values are reason codes,
+    so invalid accounts are remembered as well as valid ones. Opt-in: pass one to batch.validate_many(cache=...).
+
+    Only the checksum checks are saved - every record is still normalized and length-checked to build its key, and
+    rows failing those are never cached.
+    """
+
+    def __init__(self, maxsize=100000):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key):
+        # The cached reason for `key` (marking it as most recently used), or None.
+        with self._lock:
+            try:
+                reason = self._results.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            self._results[key] = reason
+            self.hits += 1
+            return reason
+
+    def put(self, key, reason):
+        with self._lock:
+            self._results.pop(key, None)
+            self._results[key] = reason
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def check(self, validator, branch, branch_digit, account, account_digit):
+        # Same as validator.check(...), going through the cache.
+        fields = validator.screen(branch, branch_digit, account, account_digit)
+        if fields.__class__ is int:
+            return fields  # cheaper to reject again than to look up
+        return self.check_digits(validator, *fields)
+
+    def check_digits(self, validator, branch, branch_digit, account, account_digit):
+        # Same as validator.check_digits(...), for already normalized fields, going through the cache.
+        bank_class = validator.bank_class
+        key = (bank_class.country, bank_class.bank_code, branch, branch_digit, account, account_digit)
+        reason = self.get(key)
+        if reason is None:
+            reason = validator.check_digits(branch, branch_digit, account, account_digit)
+            self.put(key, reason)
+        return reason
+
+    def check_many(self, validator, records):
+        # check() for a list of raw (branch, branch_digit, account, account_digit) records, as a list of reasons.
+        return [self.check(validator, *record) for record in records]
+
+    def check_digits_many(self, validator, fields):
+        # check_digits() for a list of normalized (branch, branch_digit, account, account_digit) tuples.
+        return [self.check_digits(validator, *x) for x in fields]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._results),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class PersistentCache(object):
+    """
+    On-disk memo of validation outcomes in an SQLite database at `path`, for runs re-validating mostly the same accounts
+    day after day. Used like a ResultCache (batch.validate_many(cache=...)), but unbounded and kept across runs.
+
+    Each bank group of a chunk is looked up with a few bulk queries, and new outcomes are written `batch_size` at a time
+    in one transaction: call flush() - or close(), or use the cache as a context manager - to write the last ones.
+
+    Outcomes are stored per bank along with its rules.rule_version(). The first time a bank is used, its entries are
+    dropped if they were stored under another version, so changing one bank's rule invalidates that bank alone.
+    """
+
+    def __init__(self, path, batch_size=10000):
+        import sqlite3
+
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1.')
+
+        self.path = path
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # entries dropped because their bank's version changed
+        self._banks = {}  # bank class -> its key in the database, once its version was checked
+        self._pending = {}  # (bank key, account key) -> reason, not written yet
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.execute('PRAGMA synchronous = NORMAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS banks (bank TEXT PRIMARY KEY, version TEXT NOT NULL)')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS results '
+                '(bank TEXT NOT NULL, account TEXT NOT NULL, reason INTEGER NOT NULL, PRIMARY KEY (bank, account)) '
+                'WITHOUT ROWID'
+            )
+
+    def __len__(self):
+        with self._lock:
+            self._write()
+            return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _bank(self, bank_class):
+        # Key of `bank_class`'s entries, dropping them first if they were stored under another version. Locked.
+        bank = self._banks.get(bank_class)
+        if bank is not None:
+            return bank
+
+        bank = '{}:{}'.format(bank_class.country, bank_class.bank_code)
+        version = rule_version(bank_class)
+        row = self._connection.execute('SELECT version FROM banks WHERE bank = ?', (bank,)).fetchone()
+        if row is None or row[0] != version:
+            with self._connection:
+                self.evictions += self._connection.execute('DELETE FROM results WHERE bank = ?', (bank,)).rowcount
+                self._connection.execute('INSERT OR REPLACE INTO banks (bank, version) VALUES (?, ?)', (bank, version))
+        self._banks[bank_class] = bank
+        return bank
+
+    def _write(self):
+        # Writes the pending outcomes in one transaction. Locked.
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO results (bank, account, reason) VALUES (?, ?, ?)',
+                [(bank, account, reason) for (bank, account), reason in self._pending.items()]
+            )
+        self._pending.clear()
+
+    def check(self, validator, branch, branch_digit, account, account_digit):
+        return self.check_many(validator, [(branch, branch_digit, account, account_digit)])[0]
+
+    def check_digits(self, validator, branch, branch_digit, account, account_digit):
+        return self.check_digits_many(validator, [(branch, branch_digit, account, account_digit)])[0]
+
+    def check_many(self, validator, records):
+        # Same as validator.check(...) for each raw record, as a list of reasons; rows failing normalization or the
+        # length checks are rejected up front, without going through the cache.
+        screen = validator.screen
+        results = [screen(*record) for record in records]
+        indexes = [index for index, fields in enumerate(results) if fields.__class__ is not int]
+        if indexes:
+            for index, reason in zip(indexes, self.check_digits_many(validator, [results[index] for index in indexes])):
+                results[index] = reason
+        return results
+
+    def check_digits_many(self, validator, fields):
+        # Same as validator.check_digits(...) for each normalized (branch, branch_digit, account, account_digit) tuple.
+        keys = list(map('/'.join, fields))  # normalized fields are letters and digits only
+        with self._lock:
+            bank = self._bank(validator.bank_class)
+            pending = self._pending
+            found = dict((key, pending[bank, key]) for key in keys if (bank, key) in pending) if pending else {}
+            missing = list(set(keys).difference(found))
+            for start in range(0, len(missing), MAX_PARAMETERS - 1):
+                batch = missing[start:start + MAX_PARAMETERS - 1]
+                found.update(self._connection.execute(
+                    'SELECT account, reason FROM results WHERE bank = ? AND account IN ({})'.format(', '.join('?' * len(batch))),
+                    [bank] + batch
+                ))
+
+        results = list(map(found.get, keys))
+        if None not in results:
+            with self._lock:
+                self.hits += len(results)
+            return results
+
+        computed = {}
+        for index, reason in enumerate(results):
+            if reason is None:
+                key = keys[index]
+                reason = computed.get(key)
+                if reason is None:
+                    reason = computed[key] = validator.check_digits(*fields[index])
+                results[index] = reason
+
+        with self._lock:
+            self.hits += len(results) - len(computed)
+            self.misses += len(computed)
+            for key, reason in computed.items():
+                self._pending[bank, key] = reason
+            if len(self._pending) >= self.batch_size:
+                self._write()
+        return results
+
+    def flush(self):
+        with self._lock:
+            self._write()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0] + len(self._pending),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'pending': len(self._pending),
+            }
+
+    def clear(self):
+        with self._lock:
+            with self._connection:
+                self._connection.execute('DELETE FROM results')
+                self._connection.execute('DELETE FROM banks')
+            self._banks.clear()
+            self._pending.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self):
+        with self._lock:
+            self._write()
+            self._connection.close()
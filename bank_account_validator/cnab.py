@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Validates the favored accounts of CNAB 240 remittance files (FEBRABAN layout, segment A detail records).
+
+    python -m bank_account_validator.cnab remessa.rem
+
+The file is memory-mapped and only the first 43 bytes of each detail record - up to the account fields - are ever
+copied and decoded, so memory use doesn't depend on the file size. Records are 240 bytes, optionally followed by
+CRLF or LF, and are reported by line number.
+"""
+from __future__ import print_function
+
+import argparse
+import io
+import mmap
+import sys
+
+from bank_account_validator import reasons
+from bank_account_validator.core import get_bank_class
+
+RECORD_LENGTH = 240
+
+# Segment A, 0-based: record type (8), segment (14), favored bank (21-23), branch (24-28), branch digit (29), account
+# (30-41), account digit (42) and branch/account digit (43), in the 1-based positions of the layout.
+HEAD_LENGTH = 43
+RECORD_TYPE = slice(7, 8)
+SEGMENT = slice(13, 14)
+DETAIL = b'3'
+SEGMENT_A = b'A'
+
+PADDING = b' \r\n\x1a'
+
+
+def _record_stride(data):
+    if data[RECORD_LENGTH:RECORD_LENGTH + 2] == b'\r\n':
+        return RECORD_LENGTH + 2
+    if data[RECORD_LENGTH:RECORD_LENGTH + 1] == b'\n':
+        return RECORD_LENGTH + 1
+    return RECORD_LENGTH
+
+
+def _segment_a_records(data):
+    stride = _record_stride(data)
+    terminator = data[RECORD_LENGTH:stride]
+    size = len(data)
+    records = (size - RECORD_LENGTH) // stride + 1 if size >= RECORD_LENGTH else 0
+
+    # Whatever follows the last full record may only be its line break and padding (some systems append ^Z).
+    if data[(records - 1) * stride + RECORD_LENGTH if records else 0:].strip(PADDING):
+        raise ValueError('Line {}: records must be {} characters long.'.format(records + 1, RECORD_LENGTH))
+
+    for index in range(records):
+        start = index * stride
+        if terminator and data[start + RECORD_LENGTH:start + stride] != terminator and start + stride <= size:
+            raise ValueError('Line {}: records must be {} characters long.'.format(index + 1, RECORD_LENGTH))
+
+        head = data[start:start + HEAD_LENGTH]
+        if head[RECORD_TYPE] != DETAIL or head[SEGMENT] != SEGMENT_A:
+            continue
+
+        head = head.decode('latin-1')
+        # Some banks (Itau, for instance) leave position 42 blank and put the account digit in 43.
+        account_digit = head[41].strip() or head[42].strip()
+        yield index + 1, (head[20:23], head[23:28], head[28].strip(), head[29:41], account_digit)
+
+
+def read_accounts(path):
+    """
+    Yields (line_number, (bank_code, branch, branch_digit, account, account_digit)) for every segment A record of the
+    CNAB 240 file at `path`. Raises ValueError for a record that isn't 240 characters long.
+    """
+    with io.open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+
+        try:
+            for item in _segment_a_records(data):
+                yield item
+        finally:
+            data.close()
+
+
+def validate_file(path, country='BR'):
+    # Yields (line_number, record, reason) for every segment A record; reasons.OK means a valid account.
+    checks = {}
+    for line_number, record in read_accounts(path):
+        bank_code = record[0]
+        try:
+            check = checks[bank_code]
+        except KeyError:
+            bank_class = get_bank_class(bank_code, country)
+            check = checks[bank_code] = bank_class.validator.check if bank_class is not None else None
+
+        if check is None:
+            yield line_number, record, reasons.BANK_NOT_IMPLEMENTED
+        else:
+            yield line_number, record, check(record[1], record[2], record[3], record[4])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bank_account_validator.cnab',
+                                     description='Validates the favored accounts of CNAB 240 remittance files.')
+    parser.add_argument('files', nargs='+', help='CNAB 240 files')
+    parser.add_argument('--country', default='BR', help='country of the banks (default: BR)')
+    args = parser.parse_args(argv)
+
+    invalid = 0
+    for path in args.files:
+        total = 0
+        for line_number, record, reason in validate_file(path, args.country):
+            total += 1
+            if reason != reasons.OK:
+                invalid += 1
+                bank_code, branch, branch_digit, account, account_digit = record
+                print('{}:{}: {} (bank {}, branch {}-{}, account {}-{})'.format(
+                    path, line_number, reasons.NAMES[reason], bank_code, branch, branch_digit, account, account_digit))
+        print('{}: {} segment A records checked.'.format(path, total), file=sys.stderr)
+
+    return 1 if invalid else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
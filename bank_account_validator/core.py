@@ -1,16 +1,226 @@
 # -*- coding: utf-8 -*-
+import sys
+from itertools import product
+
+from bank_account_validator import reasons
 from bank_account_validator.exceptions import (
-    BankNotImplemented, InvalidAccount, InvalidAccountlength, InvalidBranch, InvalidBranchAndAccountCombination,
-    InvalidBranchlength, MissingAccountDigit, MissingBranchDigit, UnexpectedAccountDigit, UnexpectedBranchDigit
+    EXCEPTIONS_BY_REASON, BankNotImplemented, InvalidAccount, InvalidBranch, InvalidBranchAndAccountCombination
 )
-from bank_account_validator.utils import calculate_verifier_digit, smarter_zfill
+from bank_account_validator.normalize import normalize_field, normalize_fields
+from bank_account_validator.prefilter import Prefilter
+
+# Every digit a bank may use, tried in order by banks that can only check digits, not compute them.
+DIGIT_CANDIDATES = '0123456789X'
+
+# Country -> module defining its banks. Each one is imported the first time a bank of that country is looked up (or
+# defined), so importing this module doesn't build any bank.
+COUNTRY_MODULES = {
+    'BR': 'bank_account_validator.countries.br',
+    'IBAN': 'bank_account_validator.countries.iban',
+}
+
+_loaded_countries = set()
+
+
+def load_country(country):
+    # Concurrent first loads are safe: the import system makes other threads wait until the module is fully imported.
+    if country not in _loaded_countries:
+        if country in COUNTRY_MODULES:
+            __import__(COUNTRY_MODULES[country])
+        _loaded_countries.add(country)
+
+
+def get_bank_class(bank_code, country):
+    # The bank class registered for (country, bank_code), or None. Loads the country's banks on first use.
+    try:
+        bank_class = BankMeta.registry.get((country, bank_code))
+    except TypeError:  # unhashable bank_code
+        return None
+
+    if bank_class is None and country not in _loaded_countries:
+        load_country(country)
+        bank_class = BankMeta.registry.get((country, bank_code))
+    return bank_class
 
 
 def all_subclasses(cls):
     return cls.__subclasses__() + [g for s in cls.__subclasses__() for g in all_subclasses(s)]
 
 
-class Bank(object):
+class AccountRecord(object):
+    """
+    An already normalized account: branch and account zero-filled, digits as strings ('' when the bank has none).
+    See BankValidator.parse().
+    """
+    __slots__ = ('branch', 'branch_digit', 'account', 'account_digit')
+
+    def __init__(self, branch, branch_digit, account, account_digit):
+        self.branch = branch
+        self.branch_digit = branch_digit
+        self.account = account
+        self.account_digit = account_digit
+
+    def __eq__(self, other):
+        if not isinstance(other, AccountRecord):
+            return NotImplemented
+        return ((self.branch, self.branch_digit, self.account, self.account_digit) ==
+                (other.branch, other.branch_digit, other.account, other.account_digit))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'AccountRecord(branch={!r}, branch_digit={!r}, account={!r}, account_digit={!r})'.format(
+            self.branch, self.branch_digit, self.account, self.account_digit
+        )
+
+
+class BankValidator(object):
+    """
+    Stateless validation for one bank, shared by every record of that bank (see Bank.validator): it holds the bank's
+    lengths and compiled checks, so validating allocates nothing but the normalized strings.
+
+    parse() normalizes raw values into an AccountRecord and validate() checks one; check() does both without building
+    the record. All of them report through reason codes (bank_account_validator.reasons), nothing is raised.
+    """
+    __slots__ = ('bank_class', 'branch_length', 'branch_digit_length', 'account_length', 'account_digit_length',
+                 'branch_matches', 'account_matches', 'combination_matches', 'custom', 'prefilter')
+
+    def __init__(self, bank_class):
+        self.bank_class = bank_class
+        self.branch_length = bank_class.branch_length
+        self.branch_digit_length = bank_class.branch_digit_length
+        self.account_length = bank_class.account_length
+        self.account_digit_length = bank_class.account_digit_length
+        self.prefilter = Prefilter((self.branch_length, self.branch_digit_length, self.account_length,
+                                    self.account_digit_length)).check
+
+        self.branch_matches = self.account_matches = self.combination_matches = None
+        if bank_class.branch_digit_table is not None:
+            self.branch_matches = bank_class.branch_digit_table.matches
+        elif bank_class.branch_kernel is not None:
+            self.branch_matches = bank_class.branch_kernel.matches
+        if bank_class.account_kernel is not None:
+            self.account_matches = bank_class.account_kernel.matches
+        if bank_class.combination_kernel is not None:
+            self.combination_matches = bank_class.combination_kernel.matches
+
+        # Banks overriding the validate*() methods are checked through a Bank instance, so their code still runs.
+        self.custom = any(
+            name in vars(klass)
+            for klass in bank_class.__mro__[:bank_class.__mro__.index(Bank)]
+            for name in ('validate_branch_digit', 'validate_account_digit', 'validate')
+        )
+
+    def __repr__(self):
+        return 'BankValidator({})'.format(self.bank_class.__name__)
+
+    def normalize(self, branch, branch_digit='', account='', account_digit=''):
+        # The normalized (branch, branch_digit, account, account_digit) tuple; None if any field has invalid characters.
+        return normalize_fields(branch, branch_digit, account, account_digit,
+                                self.branch_length, self.branch_digit_length, self.account_length, self.account_digit_length)
+
+    def parse(self, branch, branch_digit='', account='', account_digit=''):
+        # The normalized AccountRecord; None if any field has invalid characters.
+        fields = self.normalize(branch, branch_digit, account, account_digit)
+        return None if fields is None else AccountRecord(*fields)
+
+    def check_lengths(self, branch, branch_digit, account, account_digit):
+        if len(branch) != self.branch_length:
+            return reasons.INVALID_BRANCH_LENGTH
+
+        if len(branch_digit) < self.branch_digit_length:
+            return reasons.MISSING_BRANCH_DIGIT
+
+        if len(branch_digit) > self.branch_digit_length:
+            return reasons.UNEXPECTED_BRANCH_DIGIT
+
+        if len(account) != self.account_length:
+            return reasons.INVALID_ACCOUNT_LENGTH
+
+        if len(account_digit) < self.account_digit_length:
+            return reasons.MISSING_ACCOUNT_DIGIT
+
+        if len(account_digit) > self.account_digit_length:
+            return reasons.UNEXPECTED_ACCOUNT_DIGIT
+
+        return reasons.OK
+
+    def check_digits(self, branch, branch_digit, account, account_digit):
+        if self.custom:
+            bank = self.bank_class.__new__(self.bank_class)
+            bank.branch, bank.branch_digit, bank.account, bank.account_digit = branch, branch_digit, account, account_digit
+            return bank._check_digits()
+
+        if self.branch_matches is not None and not self.branch_matches(branch, branch_digit):
+            return reasons.INVALID_BRANCH
+
+        if self.account_matches is not None and not self.account_matches(account, account_digit):
+            return reasons.INVALID_ACCOUNT
+
+        if self.combination_matches is not None and not self.combination_matches(branch + account, account_digit):
+            return reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION
+
+        return reasons.OK
+
+    def validate(self, record):
+        # `record` must already be normalized (an AccountRecord from parse(), or anything with the same attributes).
+        branch, branch_digit, account, account_digit = record.branch, record.branch_digit, record.account, record.account_digit
+        return (self.check_lengths(branch, branch_digit, account, account_digit) or
+                self.check_digits(branch, branch_digit, account, account_digit))
+
+    def screen(self, branch, branch_digit='', account='', account_digit=''):
+        # Normalization and length checks: the normalized fields tuple, or the reason code the row fails with.
+        fields = self.prefilter(branch, branch_digit, account, account_digit)
+        if fields is None:
+            fields = self.normalize(branch, branch_digit, account, account_digit)
+            if fields is None:
+                return reasons.INVALID_CHARACTERS
+            return self.check_lengths(*fields) or fields
+        return fields
+
+    def check(self, branch, branch_digit='', account='', account_digit=''):
+        fields = self.screen(branch, branch_digit, account, account_digit)
+        if fields.__class__ is int:
+            return fields
+        return self.check_digits(*fields)
+
+    def is_valid(self, branch, branch_digit='', account='', account_digit=''):
+        return self.check(branch, branch_digit, account, account_digit) == reasons.OK
+
+
+class BankMeta(type):
+    # (country, bank_code) -> bank class. Filled as subclasses are defined, so Bank.get() is a dict lookup.
+    registry = {}
+
+    @property
+    def validator(cls):
+        # The bank's BankValidator, built on first use. Concurrent first uses may build it twice; both are equivalent.
+        validator = cls.__dict__.get('_validator')
+        if validator is None:
+            if not all([cls.country, cls.bank_code]):
+                raise RuntimeError('Abstract banks have no validator. Use Bank.get(bank_code, country).validator instead.')
+            validator = cls.validator_class(cls)
+            setattr(cls, '_validator', validator)
+        return validator
+
+    def __init__(cls, name, bases, attrs):
+        super(BankMeta, cls).__init__(name, bases, attrs)
+
+        country = getattr(cls, 'country', None)
+        bank_code = getattr(cls, 'bank_code', None)
+        if country and bank_code:
+            # The first class defined for a code wins, as it did when the subclass tree was scanned; built-in banks
+            # are loaded beforehand so they keep winning over subclasses defined elsewhere.
+            if cls.__module__ != COUNTRY_MODULES.get(country):
+                load_country(country)
+            BankMeta.registry.setdefault((country, bank_code), cls)
+
+
+class Bank(BankMeta(str('BaseBank'), (object,), {})):
     country = None
     bank_code = None
 
@@ -20,226 +230,231 @@ class Bank(object):
     account_length = 10
     account_digit_length = 1
 
+    # Checksums compiled at class definition (see bank_account_validator.kernels): branch_kernel checks branch_digit
+    # against the branch, account_kernel checks account_digit against the account and combination_kernel checks
+    # account_digit against branch + account.
+    branch_kernel = None
+    account_kernel = None
+    combination_kernel = None
+
+    # Optional DigitTable of every branch's expected digit(s); takes precedence over branch_kernel.
+    branch_digit_table = None
+
+    # The declarative rule the class was compiled from, if any (see bank_account_validator.rules).
+    rule = None
+
+    # Builds Bank.validator; banks whose fields aren't branch/account digits (e.g. IBANs) bring their own.
+    validator_class = BankValidator
+
     def __init__(self, **kwargs):
         if not all([self.country, self.bank_code]):
             raise RuntimeError('Bank is an abstract class and must not be instantiated. '
                                'Use its subclasses instead - via Bank.get(bank_code, country).')
 
-        self.branch = smarter_zfill(kwargs['branch'], self.branch_length)
-        self.branch_digit = smarter_zfill(kwargs.get('branch_digit', ''), self.branch_digit_length)
-        self.account = smarter_zfill(kwargs['account'], self.account_length)
-        self.account_digit = smarter_zfill(kwargs.get('account_digit', ''), self.account_digit_length)
+        reason = self._load(kwargs['branch'], kwargs.get('branch_digit', ''), kwargs['account'], kwargs.get('account_digit', ''))
+        reason = reason or self._check_lengths()
+        if reason:
+            raise self._error(reason)
 
-        if len(self.branch) != self.branch_length:
-            raise InvalidBranchlength(self)
-
-        if len(self.branch_digit) < self.branch_digit_length:
-            raise MissingBranchDigit(self)
-
-        if len(self.branch_digit) > self.branch_digit_length:
-            raise UnexpectedBranchDigit(self)
+    @classmethod
+    def check(cls, **kwargs):
+        # Same arguments as the constructor, but nothing is raised: the outcome of both the constructor and execute()
+        # comes back as a reason code (see bank_account_validator.reasons), reasons.OK for a valid account.
+        return cls.validator.check(kwargs['branch'], kwargs.get('branch_digit', ''),
+                                   kwargs['account'], kwargs.get('account_digit', ''))
+
+    def _load(self, branch, branch_digit, account, account_digit):
+        fields = type(self).validator.screen(branch, branch_digit, account, account_digit)
+        if fields.__class__ is int:
+            # Raw values are kept for the error message.
+            self.branch, self.branch_digit, self.account, self.account_digit = branch, branch_digit, account, account_digit
+            return fields
+
+        self.branch, self.branch_digit, self.account, self.account_digit = fields
+        return reasons.OK
+
+    def _check_lengths(self):
+        return type(self).validator.check_lengths(self.branch, self.branch_digit, self.account, self.account_digit)
+
+    def _check_digits(self):
+        if not self.validate_branch_digit():
+            return reasons.INVALID_BRANCH
 
-        if len(self.account) != self.account_length:
-            raise InvalidAccountlength(self)
+        if not self.validate_account_digit():
+            return reasons.INVALID_ACCOUNT
 
-        if len(self.account_digit) < self.account_digit_length:
-            raise MissingAccountDigit(self)
+        if not self.validate():
+            return reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION
 
-        if len(self.account_digit) > self.account_digit_length:
-            raise UnexpectedAccountDigit(self)
+        return reasons.OK
 
     @classmethod
     def get(cls, bank_code, country=None):
         if not country:
             country = cls.country
 
-        subclasses = all_subclasses(cls)
-        bank_class = list(filter(lambda x: x.bank_code == bank_code and x.country == country, subclasses))
-
-        if bank_class:
-            return bank_class[0]
+        bank_class = get_bank_class(bank_code, country)
+        if bank_class is not None and issubclass(bank_class, cls):
+            return bank_class
         raise BankNotImplemented(bank_code, country)
 
-    def validate_branch_digit(self):
-        return True
-
-    def validate_account_digit(self):
-        return True
-
-    def validate(self):
-        return True
-
-    def execute(self):
-        if not self.validate_branch_digit():
-            raise InvalidBranch(self.branch, self.branch_digit)
-
-        if not self.validate_account_digit():
-            raise InvalidAccount(self.account, self.account_digit)
-
-        if not self.validate():
-            raise InvalidBranchAndAccountCombination(self.branch, self.branch_digit, self.account, self.account_digit)
-
-
-class BrazilianBank(Bank):
-    country = 'BR'
-
-
-class BancoDoBrasil(BrazilianBank):
-    bank_code = '001'
-    account_length = 8
-    branch_digit_length = 1
+    @classmethod
+    def get_many(cls, bank_codes, country=None):
+        # Resolves a whole column of bank codes at once: unknown codes resolve to None instead of raising, and
+        # each distinct code (misses included) is looked up only once.
+        if not country:
+            country = cls.country
 
-    def validate_branch_digit(self):
-        s = sum(int(x) * y for x, y in zip(list(self.branch), range(5, 1, -1)))
-        remaining_part = s % 11
+        resolved = {}
+        result = []
+        for bank_code in bank_codes:
+            try:
+                bank_class = resolved[bank_code]
+            except KeyError:
+                try:
+                    bank_class = cls.get(bank_code, country)
+                except BankNotImplemented:
+                    bank_class = None
+                resolved[bank_code] = bank_class
+            result.append(bank_class)
+        return result
 
-        dv = 11 - remaining_part
-        if remaining_part == 0:
-            dv = 0
-        elif remaining_part == 1:
-            dv = 'x'
+    @classmethod
+    def _normalize_argument(cls, name, value, length):
+        normalized = normalize_field(value, length)
+        if normalized is None or len(normalized) != length:
+            raise ValueError('Invalid {}: {!r}'.format(name, value))
+        return normalized
 
-        return self.branch_digit.lower() == str(dv).lower()
+    @classmethod
+    def _search_digit(cls, name, length, is_valid, **fields):
+        # Tries every candidate digit on a throwaway instance; only used for banks with their own validate*() methods.
+        bank = cls.__new__(cls)
+        bank.branch = bank.branch_digit = bank.account = bank.account_digit = ''
+        for field, value in fields.items():
+            setattr(bank, field, value)
+
+        for candidate in product(DIGIT_CANDIDATES, repeat=length):
+            setattr(bank, name, ''.join(candidate))
+            if is_valid(bank):
+                return ''.join(candidate)
+        return None
 
-    def validate_account_digit(self):
-        dv = calculate_verifier_digit(self.account, pivot='98765432')
-        dv = 'X' if dv == 10 else dv
-        dv = '0' if dv == 11 else dv
+    @classmethod
+    def compute_branch_digit(cls, branch):
+        # The branch digit(s) `branch` should have; None when this bank has no way of computing it.
+        branch = cls._normalize_argument('branch', branch, cls.branch_length)
 
-        return self.account_digit.lower() == str(dv).lower()
+        if cls.validator.custom:
+            if not cls.branch_digit_length:
+                return None
+            return cls._search_digit('branch_digit', cls.branch_digit_length, cls.validate_branch_digit, branch=branch)
 
+        if cls.branch_digit_table is not None:
+            return cls.branch_digit_table.lookup(branch)
 
-class Santander(BrazilianBank):
-    bank_code = '033'
-    account_length = 8
+        if cls.branch_kernel is not None:
+            return cls.branch_kernel.digit(branch)
 
-    def validate(self):
-        account_relevant_data = self.branch + '00' + self.account
-        dv = calculate_verifier_digit(account_relevant_data, pivot='97310097131973', method='mod10')
-        dv = '0' if dv == 10 else dv
+        return None
 
-        return self.account_digit.lower() == str(dv).lower()
+    @classmethod
+    def compute_account_digit(cls, branch, account):
+        # The account digit the (branch, account) pair should have; None when this bank has no way of computing it, or
+        # when no digit makes the pair valid.
+        branch = cls._normalize_argument('branch', branch, cls.branch_length)
+        account = cls._normalize_argument('account', account, cls.account_length)
+
+        if cls.validator.custom:
+            if not cls.account_digit_length:
+                return None
+            return cls._search_digit('account_digit', cls.account_digit_length,
+                                     lambda bank: bank.validate_account_digit() and bank.validate(), branch=branch, account=account)
+
+        if cls.account_kernel is not None:
+            digit = cls.account_kernel.digit(account)
+        elif cls.combination_kernel is not None:
+            digit = cls.combination_kernel.digit(branch + account)
+        else:
+            return None
+
+        if digit is not None and cls.combination_kernel is not None and not cls.combination_kernel.matches(branch + account, digit):
+            return None
+        return digit
 
+    @classmethod
+    def compute_branch_digits(cls, branches):
+        # compute_branch_digit() for a whole column; invalid branches get None instead of raising.
+        result = []
+        for branch in branches:
+            try:
+                result.append(cls.compute_branch_digit(branch))
+            except ValueError:
+                result.append(None)
+        return result
 
-class Banrisul(BrazilianBank):
-    bank_code = '041'
-    branch_digit_length = 2
-    account_length = 9
-    # TODO: tests for account validation
+    @classmethod
+    def compute_account_digits(cls, branches, accounts):
+        # compute_account_digit() for whole columns; invalid rows get None instead of raising.
+        result = []
+        for branch, account in zip(branches, accounts):
+            try:
+                result.append(cls.compute_account_digit(branch, account))
+            except ValueError:
+                result.append(None)
+        return result
 
     def validate_branch_digit(self):
-        def sum_digits(value):
-            return sum([int(x) for x in str(value)])
-
-        first_digit = 10 - ((sum_digits(int(self.branch[0]) * 1) +
-                             sum_digits(int(self.branch[1]) * 2) +
-                             sum_digits(int(self.branch[2]) * 1) +
-                             sum_digits(int(self.branch[3]) * 2)) % 10)
-
-        if first_digit == 10:
-            first_digit = 0
-
-        second_digit = 11 - ((int(self.branch[0]) * 6 +
-                              int(self.branch[1]) * 5 +
-                              int(self.branch[2]) * 4 +
-                              int(self.branch[3]) * 3 +
-                              first_digit * 2) % 11)
-
-        if second_digit == 11:
-            second_digit = 0
-        elif second_digit == 10:
-            first_digit = (first_digit + 1) % 10
-            second_digit = 11 - ((int(self.branch[0]) * 6 +
-                                  int(self.branch[1]) * 5 +
-                                  int(self.branch[2]) * 4 +
-                                  int(self.branch[3]) * 3 +
-                                  first_digit * 2) % 11)
-
-        return self.branch_digit.lower() == '{}{}'.format(first_digit, second_digit).lower()
-
-    def validate_account_digit(self):
-        dv = calculate_verifier_digit(self.account, pivot='324765432')
-        dv = '6' if dv == 10 else dv
-        dv = '0' if dv == 11 else dv
-
-        return self.account_digit.lower() == str(dv).lower()
+        if self.branch_digit_table is not None:
+            return self.branch_digit_table.matches(self.branch, self.branch_digit)
 
+        return self.branch_kernel is None or self.branch_kernel.matches(self.branch, self.branch_digit)
 
-class CaixaEconomicaFederal(BrazilianBank):
-    bank_code = '104'
-    account_length = 11
+    def validate_account_digit(self):
+        return self.account_kernel is None or self.account_kernel.matches(self.account, self.account_digit)
 
     def validate(self):
-        account_relevant_data = self.branch + self.account
-        pivot = '876543298765432'
-        dv = sum([int(x) * int(y) for x, y in zip(account_relevant_data.zfill(len(pivot)), pivot)])
-        dv *= 10
-        dv %= 11
-        dv = '0' if dv == 10 else dv
-
-        return self.account_digit.lower() == str(dv).lower()
-
-
-class Bradesco(BrazilianBank):
-    bank_code = '237'
-    account_length = 7
-    branch_digit_length = 1
-
-    def validate_branch_digit(self):
-        s = sum(int(x) * y for x, y in zip(list(self.branch), range(5, 1, -1)))
-        remaining_part = s % 11
+        return self.combination_kernel is None or self.combination_kernel.matches(self.branch + self.account, self.account_digit)
 
-        dv = 11 - remaining_part
-        if remaining_part == 0:
-            dv = 0
-        elif remaining_part == 1:
-            dv = 0
+    def _error(self, reason):
+        if reason == reasons.INVALID_BRANCH:
+            return InvalidBranch(self.branch, self.branch_digit)
 
-        return self.branch_digit.lower() == str(dv).lower()
+        if reason == reasons.INVALID_ACCOUNT:
+            return InvalidAccount(self.account, self.account_digit)
 
-    def validate_account_digit(self):
-        dv = calculate_verifier_digit(self.account, pivot='2765432')
-        dv = '0' if dv == 10 else dv  # according to documentation this one should be 'P', but I know this info is outdated
-        dv = '0' if dv == 11 else dv
-
-        return self.account_digit.lower() == str(dv).lower()
-
-
-class Itau(BrazilianBank):
-    bank_code = '341'
-    account_length = 5
+        if reason == reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION:
+            return InvalidBranchAndAccountCombination(self.branch, self.branch_digit, self.account, self.account_digit)
 
-    def validate(self):
-        account_relevant_data = self.branch + self.account
-        dv = calculate_verifier_digit(account_relevant_data, pivot='212121212', sum_digits=True, method='mod10')
-        dv = '0' if dv == 10 else dv
+        return EXCEPTIONS_BY_REASON[reason](self)
 
-        return self.account_digit.lower() == str(dv).lower()
+    def execute(self):
+        reason = self._check_digits()
+        if reason:
+            raise self._error(reason)
 
 
-class HSBC(BrazilianBank):
-    bank_code = '399'
-    account_length = 6
-    # TODO: tests
+def check(bank_code, branch, branch_digit, account, account_digit, country='BR'):
+    bank_class = get_bank_class(bank_code, country)
+    if bank_class is None:
+        return reasons.BANK_NOT_IMPLEMENTED
+    return bank_class.validator.check(branch, branch_digit, account, account_digit)
 
-    def validate(self):
-        account_relevant_data = self.branch + self.account
-        pivot = '8923456789'
-        dv = sum([int(x) * int(y) for x, y in zip(account_relevant_data.zfill(len(pivot)), pivot)])
-        dv %= 11
-        dv = '0' if dv == 10 else dv
 
-        return self.account_digit.lower() == str(dv).lower()
+def is_valid(bank_code, branch, branch_digit, account, account_digit, country='BR'):
+    return check(bank_code, branch, branch_digit, account, account_digit, country) == reasons.OK
 
 
-class Citibank(BrazilianBank):
-    bank_code = '745'
-    account_length = 7
-    # TODO: branch validation and tests
+def __getattr__(name):
+    # Banks live in bank_account_validator.countries; importing them from here (e.g. core.Bradesco) still works.
+    if not name.startswith('__'):
+        for country in COUNTRY_MODULES:
+            load_country(country)
+            module = sys.modules[COUNTRY_MODULES[country]]
+            if hasattr(module, name):
+                return getattr(module, name)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
-    def validate_account_digit(self):
-        dv = calculate_verifier_digit(self.account, pivot='8765432')
-        dv = '0' if dv == 10 else dv
-        dv = '0' if dv == 11 else dv
 
-        return self.account_digit.lower() == str(dv).lower()
+if sys.version_info < (3, 7):  # pragma: no cover - no module __getattr__ (PEP 562): load them eagerly instead
+    from bank_account_validator.countries.br import *  # noqa: F401,F403,E402
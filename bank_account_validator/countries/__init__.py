@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+# One module per country, holding its banks. bank_account_validator.core imports them on demand (see COUNTRY_MODULES),
+# the first time a bank of that country is asked for.
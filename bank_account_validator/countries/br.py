@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from bank_account_validator.core import Bank
+from bank_account_validator.rules import compile_rules
+
+
+class BrazilianBank(Bank):
+    country = 'BR'
+
+
+def banrisul_branch_digits(branch):
+    def sum_digits(value):
+        return sum([int(x) for x in str(value)])
+
+    first_digit = 10 - ((sum_digits(int(branch[0]) * 1) +
+                         sum_digits(int(branch[1]) * 2) +
+                         sum_digits(int(branch[2]) * 1) +
+                         sum_digits(int(branch[3]) * 2)) % 10)
+
+    if first_digit == 10:
+        first_digit = 0
+
+    second_digit = 11 - ((int(branch[0]) * 6 +
+                          int(branch[1]) * 5 +
+                          int(branch[2]) * 4 +
+                          int(branch[3]) * 3 +
+                          first_digit * 2) % 11)
+
+    if second_digit == 11:
+        second_digit = 0
+    elif second_digit == 10:
+        first_digit = (first_digit + 1) % 10
+        second_digit = 11 - ((int(branch[0]) * 6 +
+                              int(branch[1]) * 5 +
+                              int(branch[2]) * 4 +
+                              int(branch[3]) * 3 +
+                              first_digit * 2) % 11)
+
+    return '{}{}'.format(first_digit, second_digit)
+
+
+# See bank_account_validator.rules for the format. Banks without checks only have their lengths validated.
+RULES = (
+    {
+        'name': 'BancoDoBrasil',
+        'bank_code': '001',
+        'branch_digit_length': 1,
+        'account_length': 8,
+        'checks': (
+            {'fields': ('branch',), 'pivot': '5432', 'remap': {10: 'X', 11: '0'}},
+            {'fields': ('account',), 'pivot': '98765432', 'remap': {10: 'X', 11: '0'}},
+        ),
+    },
+    {
+        'name': 'Santander',
+        'bank_code': '033',
+        'account_length': 8,
+        'checks': (
+            # Santander's pivot is '9731' + '00' + '97131973' over branch + '00' + account: the zero weights are dropped.
+            {'fields': ('branch', 'account'), 'pivot': '973197131973', 'method': 'mod10', 'remap': {10: '0'}},
+        ),
+    },
+    {
+        'name': 'Banrisul',
+        'bank_code': '041',
+        'branch_digit_length': 2,
+        'account_length': 9,
+        # TODO: tests for account validation
+        'checks': (
+            {'fields': ('branch',), 'compute': banrisul_branch_digits},
+            {'fields': ('account',), 'pivot': '324765432', 'remap': {10: '6', 11: '0'}},
+        ),
+    },
+    {
+        'name': 'CaixaEconomicaFederal',
+        'bank_code': '104',
+        'account_length': 11,
+        'checks': (
+            # Caixa's (sum * 10) % 11 is the usual 11 - (sum % 11), with 11 (sum % 11 == 0) standing for 0.
+            {'fields': ('branch', 'account'), 'pivot': '876543298765432', 'remap': {10: '0', 11: '0'}},
+        ),
+    },
+    {
+        'name': 'Bradesco',
+        'bank_code': '237',
+        'branch_digit_length': 1,
+        'account_length': 7,
+        'checks': (
+            {'fields': ('branch',), 'pivot': '5432', 'remap': {10: '0', 11: '0'}},
+            # according to documentation 10 should be 'P', but I know this info is outdated
+            {'fields': ('account',), 'pivot': '2765432', 'remap': {10: '0', 11: '0'}},
+        ),
+    },
+    {
+        'name': 'Itau',
+        'bank_code': '341',
+        'account_length': 5,
+        'checks': (
+            {'fields': ('branch', 'account'), 'pivot': '212121212', 'method': 'mod10', 'sum_digits': True, 'remap': {10: '0'}},
+        ),
+    },
+    {
+        'name': 'HSBC',
+        'bank_code': '399',
+        'account_length': 6,
+        # TODO: tests
+        'checks': (
+            {'fields': ('branch', 'account'), 'pivot': '8923456789', 'method': 'remainder11', 'remap': {10: '0'}},
+        ),
+    },
+    {
+        'name': 'Citibank',
+        'bank_code': '745',
+        'account_length': 7,
+        # TODO: branch validation and tests
+        'checks': (
+            {'fields': ('account',), 'pivot': '8765432', 'remap': {10: '0', 11: '0'}},
+        ),
+    },
+)
+
+globals().update((bank_class.__name__, bank_class) for bank_class in compile_rules(RULES, BrazilianBank))
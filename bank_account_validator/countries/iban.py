@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+IBANs (ISO 13616), as the 'IBAN' country: each IBAN country is a bank whose code is the ISO country code, and the whole
+IBAN goes in the account field - spaces and lowercase letters are fine.
+
+    Bank.get('DE', 'IBAN').check(branch='', account='DE89 3704 0044 0532 0130 00')
+    check_iban('DE89 3704 0044 0532 0130 00')
+    check_ibans(column)  # one reason code per IBAN, NumPy-backed when available
+
+Only the length and the mod-97 check digits are validated, not each country's BBAN format.
+"""
+from bank_account_validator import reasons
+from bank_account_validator.core import Bank, BankValidator, get_bank_class
+from bank_account_validator.normalize import TEXT, is_ascii, normalize_field
+from bank_account_validator.prefilter import Prefilter
+from bank_account_validator.rules import compile_rules
+
+ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Character -> the remainder (mod 97) that follows each remainder 0..96 once the character's value is appended: digits
+# shift one decimal place, letters (10..35) two. The mod-97 check is then one table step per character, without ever
+# building the 30-70 digit integer the IBAN stands for.
+REMAINDER_STEPS = dict(
+    (character, tuple((remainder * (10 if value < 10 else 100) + value) % 97 for remainder in range(97)))
+    for value, character in enumerate(ALPHABET)
+)
+
+# IBAN length of every country in the SWIFT IBAN registry, as of its 2024 releases. Countries joining later are
+# reported as BANK_NOT_IMPLEMENTED until added here.
+LENGTHS = {
+    'AD': 24, 'AE': 23, 'AL': 28, 'AT': 20, 'AZ': 28, 'BA': 20, 'BE': 16, 'BG': 22, 'BH': 22, 'BI': 27, 'BR': 29,
+    'BY': 28, 'CH': 21, 'CR': 22, 'CY': 28, 'CZ': 24, 'DE': 22, 'DJ': 27, 'DK': 18, 'DO': 28, 'EE': 20, 'EG': 29,
+    'ES': 24, 'FI': 18, 'FK': 18, 'FO': 18, 'FR': 27, 'GB': 22, 'GE': 22, 'GI': 23, 'GL': 18, 'GR': 27, 'GT': 28,
+    'HN': 28, 'HR': 21, 'HU': 28, 'IE': 22, 'IL': 23, 'IQ': 23, 'IS': 26, 'IT': 27, 'JO': 30, 'KW': 30, 'KZ': 20,
+    'LB': 28, 'LC': 32, 'LI': 21, 'LT': 20, 'LU': 20, 'LV': 21, 'LY': 25, 'MC': 27, 'MD': 24, 'ME': 22, 'MK': 19,
+    'MN': 20, 'MR': 27, 'MT': 31, 'MU': 30, 'NI': 28, 'NL': 18, 'NO': 15, 'OM': 23, 'PK': 24, 'PL': 28, 'PS': 29,
+    'PT': 25, 'QA': 29, 'RO': 24, 'RS': 22, 'RU': 33, 'SA': 24, 'SC': 31, 'SD': 18, 'SE': 24, 'SI': 19, 'SK': 24,
+    'SM': 27, 'SO': 23, 'ST': 25, 'SV': 28, 'TL': 23, 'TN': 24, 'TR': 26, 'UA': 29, 'VA': 22, 'VG': 24, 'XK': 20,
+    'YE': 30,
+}
+
+
+def normalize_iban(value):
+    # Uppercase, without spaces; None when anything but ASCII letters and digits is left.
+    if value.__class__ is not str:
+        if isinstance(value, bytes):
+            try:
+                value = value.decode('ascii')
+            except UnicodeDecodeError:
+                return None
+        if not isinstance(value, TEXT):
+            return None
+
+    iban = value.replace(' ', '').upper()
+    if iban and not (iban.isalnum() and is_ascii(iban)):
+        return None
+    return iban
+
+
+def remainder(iban):
+    # The IBAN's value mod 97, with its first four characters moved to the end; 1 for valid IBANs.
+    result = 0
+    for steps in map(REMAINDER_STEPS.__getitem__, iban[4:] + iban[:4]):
+        result = steps[result]
+    return result
+
+
+def compute_check_digits(country_code, bban):
+    # The two check digits of the IBAN made of `country_code` and `bban` (a normalized BBAN).
+    return '{:02d}'.format(98 - remainder(country_code + '00' + bban))
+
+
+class IBANValidator(BankValidator):
+    __slots__ = ()
+
+    def __init__(self, bank_class):
+        super(IBANValidator, self).__init__(bank_class)
+        self.prefilter = Prefilter((), normalize=False).check
+
+    def normalize(self, branch, branch_digit='', account='', account_digit=''):
+        iban = normalize_iban(account)
+        if branch == branch_digit == account_digit == '':
+            return None if iban is None else ('', '', iban, '')
+
+        fields = (normalize_field(branch), normalize_field(branch_digit, verifier_digit=True),
+                  normalize_field(account_digit, verifier_digit=True))
+        if iban is None or None in fields:
+            return None
+        return fields[0], fields[1], iban, fields[2]
+
+    def check_digits(self, branch, branch_digit, account, account_digit):
+        if account[:2] != self.bank_class.bank_code or not account[2:4].isdigit() or remainder(account) != 1:
+            return reasons.INVALID_ACCOUNT
+        return reasons.OK
+
+
+class IBANBank(Bank):
+    country = 'IBAN'
+    branch_length = 0
+    account_digit_length = 0
+
+    validator_class = IBANValidator
+
+    def _check_digits(self):
+        return type(self).validator.check_digits(self.branch, self.branch_digit, self.account, self.account_digit)
+
+
+RULES = tuple(
+    {'name': 'IBAN{}'.format(country_code), 'bank_code': country_code, 'account_length': length}
+    for country_code, length in sorted(LENGTHS.items())
+)
+
+globals().update((bank_class.__name__, bank_class) for bank_class in compile_rules(RULES, IBANBank))
+
+
+def check_iban(iban):
+    # Reason code for a single IBAN: reasons.OK when valid, BANK_NOT_IMPLEMENTED for unknown countries.
+    normalized = normalize_iban(iban)
+    if normalized is None:
+        return reasons.INVALID_CHARACTERS
+
+    bank_class = get_bank_class(normalized[:2], 'IBAN')
+    if bank_class is None:
+        return reasons.BANK_NOT_IMPLEMENTED
+
+    validator = bank_class.validator
+    return validator.check_lengths('', '', normalized, '') or validator.check_digits('', '', normalized, '')
+
+
+def is_valid_iban(iban):
+    return check_iban(iban) == reasons.OK
+
+
+def check_ibans(ibans):
+    """
+    Validates a whole column of IBANs, of any countries, returning one reason code per IBAN as a list. IBANs are grouped
+    by country and each group goes through vectorized.check_columns(), which computes all remainders at once as NumPy
+    matrix operations when NumPy is installed.
+    """
+    from bank_account_validator.vectorized import HAS_NUMPY, check_columns
+
+    results = [reasons.BANK_NOT_IMPLEMENTED] * len(ibans)
+    groups = {}
+    for index, iban in enumerate(ibans):
+        normalized = normalize_iban(iban)
+        if normalized is None:
+            results[index] = reasons.INVALID_CHARACTERS
+        else:
+            groups.setdefault(normalized[:2], []).append((index, normalized))
+
+    for country_code, rows in groups.items():
+        bank_class = get_bank_class(country_code, 'IBAN')
+        if bank_class is None:
+            continue
+
+        length = bank_class.account_length
+        column = [row for row in rows if len(row[1]) == length]
+        if len(column) < len(rows):
+            for index, iban in rows:
+                if len(iban) != length:
+                    results[index] = reasons.INVALID_ACCOUNT_LENGTH
+        if not column:
+            continue
+
+        indexes, column = zip(*column)
+        if HAS_NUMPY:
+            empty = [''] * len(column)
+            group_results = check_columns(bank_class, empty, empty, column, empty, normalized=True).tolist()
+        else:
+            check_digits = bank_class.validator.check_digits
+            group_results = [check_digits('', '', iban, '') for iban in column]
+
+        for index, reason in zip(indexes, group_results):
+            results[index] = reason
+    return results
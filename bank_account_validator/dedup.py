@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from bank_account_validator.normalize import TEXT
+
+
+class Deduplicator(object):
+    """
+    Validates each distinct account of a batch once and copies its outcome to the duplicates, for files listing the same
+    accounts over and over (e.g. one beneficiary across many invoices). Opt-in: pass one to
+    batch.validate_many(dedup=...).
+
+    Records of strings are matched on their raw values first, then all records on their normalized ones ('0200040' and
+    '200040' are the same account). Only one chunk is remembered at a time, so memory is bounded by validate_many()'s
+    chunk_size. Once `sample_size` records have been seen with fewer than `min_ratio` of them duplicates, deduplication
+    turns itself off and records pass straight through.
+    """
+
+    def __init__(self, sample_size=10000, min_ratio=0.02):
+        self.sample_size = sample_size
+        self.min_ratio = min_ratio
+        self.active = True
+        self.records = 0
+        self.distinct = 0
+        self._lock = threading.Lock()
+
+    def check_rows(self, validator, rows, check_digits_many=None):
+        # The (index, reason) list of `rows` - (index, (bank_code, branch, branch_digit, account, account_digit)) pairs
+        # of `validator`'s bank. The distinct accounts go through check_digits_many(fields) - a list of reasons for a
+        # list of normalized fields, validator.check_digits() on each by default - all at once.
+        raw_seen = {}
+        normalized_seen = {}
+        distinct = 0
+        keys = []
+        for index, record in rows:
+            if record.__class__ is not tuple:
+                record = tuple(record)  # e.g. lists from JSON, which can't be keys
+            _, branch, branch_digit, account, account_digit = record
+            # Only strings are matched on their raw values: 7, 7.0 and True are equal keys, but not the same input.
+            cls = branch.__class__
+            raw = ((cls is str or cls is bytes or cls is TEXT) and
+                   cls is branch_digit.__class__ is account.__class__ is account_digit.__class__)
+            key = raw_seen.get(record) if raw else None  # the bank code is the same for all rows, so whole records are keys
+
+            if key is None:
+                # The reason when rejected from the raw values (as cheap as a lookup), the normalized fields otherwise.
+                key = validator.screen(branch, branch_digit, account, account_digit)
+                if raw:
+                    raw_seen[record] = key
+                if key.__class__ is int:
+                    distinct += 1
+                elif key not in normalized_seen:
+                    distinct += 1
+                    normalized_seen[key] = None
+            keys.append((index, key))
+
+        if normalized_seen:
+            fields = list(normalized_seen)
+            if check_digits_many is None:
+                check_digits = validator.check_digits
+                normalized_seen = dict((x, check_digits(*x)) for x in fields)
+            else:
+                normalized_seen = dict(zip(fields, check_digits_many(fields)))
+
+        self._count(len(rows), distinct)
+        return [(index, key if key.__class__ is int else normalized_seen[key]) for index, key in keys]
+
+    def _count(self, records, distinct):
+        with self._lock:
+            self.records += records
+            self.distinct += distinct
+            if self.active and self.records >= self.sample_size and self.ratio() < self.min_ratio:
+                self.active = False
+
+    def ratio(self):
+        # Share of the records whose outcome was copied from an earlier duplicate.
+        return 1 - self.distinct / float(self.records) if self.records else 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'records': self.records,
+                'distinct': self.distinct,
+                'duplicates': self.records - self.distinct,
+                'ratio': self.ratio(),
+                'active': self.active,
+            }
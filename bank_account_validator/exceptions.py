@@ -1,80 +1,167 @@
 # -*- coding: utf-8 -*-
+from bank_account_validator import reasons
+from bank_account_validator.normalize import normalize_field
+
+
 class BaseBankAccountValidationError(Exception):
-    def __init__(self, message):
-        self.message = message
+    # Subclasses keep the bank/field context and only build their message (via format_message) when it is read.
+    reason = None
+
+    def __init__(self, message=None):
+        self._message = message
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = self.format_message()
+        return self._message
+
+    @message.setter
+    def message(self, value):
+        self._message = value
+
+    def format_message(self):
+        return ''
+
+    def __str__(self):
+        return self.message
 
 
 class BankNotImplemented(BaseBankAccountValidationError):
+    reason = reasons.BANK_NOT_IMPLEMENTED
+
     def __init__(self, bank_code, country):
-        message = 'Bank code "{}" is not implemented for country "{}"- or it does not exist at all.'.format(bank_code, country)
-        super(BankNotImplemented, self).__init__(message)
+        super(BankNotImplemented, self).__init__()
+        self.bank_code = bank_code
+        self.country = country
 
+    def format_message(self):
+        message = 'Bank code "{}" is not implemented for country "{}"- or it does not exist at all.'
+        return message.format(self.bank_code, self.country)
 
-class MissingBranchDigit(BaseBankAccountValidationError):
+
+class BankPreconditionError(BaseBankAccountValidationError):
     def __init__(self, bank):
-        message = 'For bank code "{}", branches must have a digit, of length {}.'.format(bank.bank_code, bank.branch_digit_length)
-        super(MissingBranchDigit, self).__init__(message)
+        super(BankPreconditionError, self).__init__()
+        self.bank = bank
+        self.bank_code = bank.bank_code
 
 
-class MissingAccountDigit(BaseBankAccountValidationError):
-    def __init__(self, bank):
-        message = 'For bank code "{}", accounts must have a digit, of length {}.'.format(bank.bank_code, bank.account_digit_length)
-        super(MissingAccountDigit, self).__init__(message)
+class MissingBranchDigit(BankPreconditionError):
+    reason = reasons.MISSING_BRANCH_DIGIT
 
+    def format_message(self):
+        message = 'For bank code "{}", branches must have a digit, of length {}.'
+        return message.format(self.bank_code, self.bank.branch_digit_length)
 
-class UnexpectedBranchDigit(BaseBankAccountValidationError):
-    def __init__(self, bank):
-        message = 'For bank code "{}", branches must have {} digits.'.format(bank.bank_code, bank.branch_digit_length)
-        super(UnexpectedBranchDigit, self).__init__(message)
 
+class MissingAccountDigit(BankPreconditionError):
+    reason = reasons.MISSING_ACCOUNT_DIGIT
 
-class UnexpectedAccountDigit(BaseBankAccountValidationError):
-    def __init__(self, bank):
-        message = 'For bank code "{}", accounts must have {} digits.'.format(bank.bank_code, bank.account_digit_length)
-        super(UnexpectedAccountDigit, self).__init__(message)
+    def format_message(self):
+        message = 'For bank code "{}", accounts must have a digit, of length {}.'
+        return message.format(self.bank_code, self.bank.account_digit_length)
 
 
-class InvalidBranchlength(BaseBankAccountValidationError):
-    def __init__(self, bank):
-        message = 'For bank code "{}", branches length must be {}.'.format(bank.bank_code, bank.branch_length)
-        super(InvalidBranchlength, self).__init__(message)
+class UnexpectedBranchDigit(BankPreconditionError):
+    reason = reasons.UNEXPECTED_BRANCH_DIGIT
+
+    def format_message(self):
+        return 'For bank code "{}", branches must have {} digits.'.format(self.bank_code, self.bank.branch_digit_length)
+
+
+class UnexpectedAccountDigit(BankPreconditionError):
+    reason = reasons.UNEXPECTED_ACCOUNT_DIGIT
 
+    def format_message(self):
+        return 'For bank code "{}", accounts must have {} digits.'.format(self.bank_code, self.bank.account_digit_length)
+
+
+class InvalidBranchlength(BankPreconditionError):
+    reason = reasons.INVALID_BRANCH_LENGTH
+
+    def format_message(self):
+        return 'For bank code "{}", branches length must be {}.'.format(self.bank_code, self.bank.branch_length)
+
+
+class InvalidAccountlength(BankPreconditionError):
+    reason = reasons.INVALID_ACCOUNT_LENGTH
+
+    def format_message(self):
+        return 'For bank code "{}", accounts length must be {}.'.format(self.bank_code, self.bank.account_length)
+
+
+class InvalidCharacters(BankPreconditionError):
+    reason = reasons.INVALID_CHARACTERS
 
-class InvalidAccountlength(BaseBankAccountValidationError):
     def __init__(self, bank):
-        message = 'For bank code "{}", accounts length must be {}.'.format(bank.bank_code, bank.account_length)
-        super(InvalidAccountlength, self).__init__(message)
+        super(InvalidCharacters, self).__init__(bank)
+        self.branch = bank.branch
+        self.branch_digit = bank.branch_digit
+        self.account = bank.account
+        self.account_digit = bank.account_digit
+
+    def format_message(self):
+        fields = (
+            ('branch', self.branch, False), ('branch digit', self.branch_digit, True),
+            ('account', self.account, False), ('account digit', self.account_digit, True),
+        )
+        for name, value, verifier_digit in fields:
+            if normalize_field(value, verifier_digit=verifier_digit) is None:
+                return 'For bank code "{}", {} {!r} has invalid characters.'.format(self.bank_code, name, value)
+        return 'For bank code "{}", branch and account digits do not match the ones in branch/account.'.format(self.bank_code)
+
+
+def _with_digit(value, digit):
+    if digit:
+        return '{}-{}'.format(value, digit)
+    return value
 
 
 class InvalidBranch(BaseBankAccountValidationError):
+    reason = reasons.INVALID_BRANCH
+
     def __init__(self, branch, branch_digit):
-        branch_info = branch
-        if branch_digit:
-            branch_info += '-{}'.format(branch_digit)
+        super(InvalidBranch, self).__init__()
+        self.branch = branch
+        self.branch_digit = branch_digit
 
-        message = 'Branch "{}" is wrong.'.format(branch_info)
-        super(InvalidBranch, self).__init__(message)
+    def format_message(self):
+        return 'Branch "{}" is wrong.'.format(_with_digit(self.branch, self.branch_digit))
 
 
 class InvalidAccount(BaseBankAccountValidationError):
+    reason = reasons.INVALID_ACCOUNT
+
     def __init__(self, account, account_digit):
-        account_info = account
-        if account_digit:
-            account_info += '-{}'.format(account_digit)
+        super(InvalidAccount, self).__init__()
+        self.account = account
+        self.account_digit = account_digit
 
-        message = 'Account "{}" is wrong.'.format(account_info)
-        super(InvalidAccount, self).__init__(message)
+    def format_message(self):
+        return 'Account "{}" is wrong.'.format(_with_digit(self.account, self.account_digit))
 
 
 class InvalidBranchAndAccountCombination(BaseBankAccountValidationError):
-    def __init__(self, branch, branch_digit, account, account_digit):
-        branch_info = branch
-        if branch_digit:
-            branch_info += '-{}'.format(branch_digit)
+    reason = reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION
 
-        account_info = account
-        if account_digit:
-            account_info += '-{}'.format(account_digit)
-
-        message = 'Combination (branch="{}", account="{}") does not match.'.format(branch_info, account_info)
-        super(InvalidBranchAndAccountCombination, self).__init__(message)
+    def __init__(self, branch, branch_digit, account, account_digit):
+        super(InvalidBranchAndAccountCombination, self).__init__()
+        self.branch = branch
+        self.branch_digit = branch_digit
+        self.account = account
+        self.account_digit = account_digit
+
+    def format_message(self):
+        return 'Combination (branch="{}", account="{}") does not match.'.format(
+            _with_digit(self.branch, self.branch_digit), _with_digit(self.account, self.account_digit)
+        )
+
+
+EXCEPTIONS_BY_REASON = {
+    exception.reason: exception for exception in (
+        BankNotImplemented, InvalidBranchlength, MissingBranchDigit, UnexpectedBranchDigit, InvalidAccountlength,
+        MissingAccountDigit, UnexpectedAccountDigit, InvalidBranch, InvalidAccount, InvalidBranchAndAccountCombination,
+        InvalidCharacters,
+    )
+}
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+from operator import getitem
+
+METHODS = ('mod10', 'mod11', 'remainder11')
+
+
+def _sum_digits(value):
+    return sum(int(x) for x in str(value))
+
+
+class ChecksumKernel(object):
+    """
+    A verifier digit calculation compiled once, when the bank class is defined: integer weights, a per-position
+    table of each digit's contribution (already digit-summed when `sum_digits` is set) and the bank's remapping
+    of results 10 and 11. Computing a digit is then one table lookup per position.
+
+    Methods: 'mod10' is 10 - (sum % 10), 'mod11' is 11 - (sum % 11) and 'remainder11' is sum % 11.
+    """
+    __slots__ = ('pivot', 'weights', 'method', 'sum_digits', 'remap', 'tables', 'digits', 'lower_digits')
+
+    def __init__(self, pivot, method='mod11', sum_digits=False, remap=None):
+        if method not in METHODS:
+            raise RuntimeError('Invalid method: {}'.format(method))
+
+        self.pivot = pivot
+        self.weights = tuple(int(x) for x in pivot)
+        self.method = method
+        self.sum_digits = sum_digits
+        self.remap = dict(remap or {})
+
+        self.tables = tuple(
+            dict((str(digit), _sum_digits(weight * digit) if sum_digits else weight * digit) for digit in range(10))
+            for weight in self.weights
+        )
+
+        # Result (0..11) -> expected digit; None for results that are not remapped, since those can never match.
+        self.digits = tuple(
+            str(self.remap[result]) if result in self.remap else (str(result) if result < 10 else None)
+            for result in range(12)
+        )
+        self.lower_digits = tuple(digit.lower() if digit is not None else None for digit in self.digits)
+
+    def __repr__(self):
+        return 'ChecksumKernel({!r}, method={!r}, sum_digits={!r}, remap={!r})'.format(
+            self.pivot, self.method, self.sum_digits, self.remap
+        )
+
+    def total(self, data):
+        # Weighted sum of `data`, which must have exactly len(pivot) digits.
+        try:
+            return sum(map(getitem, self.tables, data))
+        except KeyError as e:
+            raise ValueError('Invalid digit: {}'.format(e.args[0]))
+
+    def result(self, total):
+        if self.method == 'mod10':
+            return 10 - total % 10
+        if self.method == 'mod11':
+            return 11 - total % 11
+        return total % 11
+
+    def digit(self, data):
+        return self.digits[self.result(self.total(data))]
+
+    def matches(self, data, digit):
+        return digit.lower() == self.lower_digits[self.result(self.total(data))]
+
+
+class DigitTable(object):
+    """
+    Precomputed verifier digits for every value of a short fixed-length field (e.g. the 10,000 4-digit branches), as one
+    string of `width` characters per value. Built lazily from `compute(value)` on first use; afterwards checking or
+    computing a digit is a single index operation.
+    """
+    __slots__ = ('compute', 'length', 'width', '_table')
+
+    # Stored for values whose digit can't be computed, so they never match.
+    MISSING = '\x00'
+
+    def __init__(self, compute, length=4, width=1):
+        self.compute = compute
+        self.length = length
+        self.width = width
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            missing = self.MISSING * self.width
+            digits = (self.compute(str(value).zfill(self.length)) for value in range(10 ** self.length))
+            # Built locally and assigned once, so concurrent first uses at most build it twice.
+            self._table = ''.join(digit if digit is not None and len(digit) == self.width else missing for digit in digits)
+        return self._table
+
+    def lookup(self, value):
+        # The digit(s) for `value`, a string of exactly `length` digits; None if they can't be computed.
+        if len(value) != self.length or not value.isdigit():
+            raise ValueError('Invalid value: {}'.format(value))
+
+        start = int(value) * self.width
+        digit = self.table[start:start + self.width]
+        return None if digit[0] == self.MISSING else digit
+
+    def matches(self, value, digit):
+        return digit.upper() == self.lookup(value)
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Validation counters and latency histograms per bank, with a snapshot API and a Prometheus text exporter.
+
+    from bank_account_validator import metrics
+
+    metrics.enable()
+    ...
+    metrics.snapshot()
+    metrics.to_prometheus()
+
+Disabled (the default), nothing is measured and nothing costs anything: enable() swaps instrumented versions of
+BankValidator.check(), BankValidator.validate(), ResultCache.check(), PersistentCache.check_many(),
+Deduplicator.check_rows(), Bank.__init__() and Bank.execute() into their classes and disable() puts the originals back.
+That covers check(), is_valid(), Bank(...).execute() and everything built on validate_many(); vectorized.check_columns()
+is not counted, and neither are records of unknown banks. Records validated in bulk are each counted with the batch's
+average latency.
+
+Metrics are per process: validations done in worker processes (parallel.validate_parallel(), the server's process pool)
+are counted there, not in the parent.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from bank_account_validator import reasons
+from bank_account_validator.cache import PersistentCache, ResultCache
+from bank_account_validator.core import Bank, BankValidator
+from bank_account_validator.dedup import Deduplicator
+from bank_account_validator.exceptions import BaseBankAccountValidationError
+
+perf_counter = getattr(time, 'perf_counter', time.time)
+
+# Upper bounds, in seconds, of the latency histogram buckets (plus an implicit +Inf one).
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+
+PREFIX = 'bank_account_validator'
+
+
+class Metrics(object):
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = {}  # (country, bank_code, reason) -> validations
+            self.histograms = {}  # (country, bank_code) -> [count per bucket..., +Inf count, sum of seconds]
+
+    def observe(self, bank_class, reason, seconds):
+        key = (bank_class.country, bank_class.bank_code)
+        with self._lock:
+            count_key = key + (reason,)
+            self.counts[count_key] = self.counts.get(count_key, 0) + 1
+
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            histogram[bisect_left(self.buckets, seconds)] += 1
+            histogram[-1] += seconds
+
+    def observe_many(self, bank_class, outcomes, seconds):
+        # observe() for each reason in `outcomes`, validated together in `seconds`.
+        if not outcomes:
+            return
+        key = (bank_class.country, bank_class.bank_code)
+        bucket = bisect_left(self.buckets, seconds / len(outcomes))
+        with self._lock:
+            for reason in outcomes:
+                count_key = key + (reason,)
+                self.counts[count_key] = self.counts.get(count_key, 0) + 1
+
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            histogram[bucket] += len(outcomes)
+            histogram[-1] += seconds
+
+    def snapshot(self):
+        """
+        {'validations': {country: {bank_code: {outcome: count}}},
+         'latency': {country: {bank_code: {'buckets': {upper bound: cumulative count}, 'count': n, 'sum': seconds}}}}
+
+        Outcomes are 'OK' or the name of the exception the validation raises (or would raise).
+        """
+        with self._lock:
+            counts = dict(self.counts)
+            histograms = dict((key, list(value)) for key, value in self.histograms.items())
+
+        validations = {}
+        for (country, bank_code, reason), count in counts.items():
+            validations.setdefault(country, {}).setdefault(bank_code, {})[reasons.NAMES[reason]] = count
+
+        latency = {}
+        for (country, bank_code), histogram in histograms.items():
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets + (float('inf'),), histogram[:-1]):
+                cumulative += count
+                buckets[_format_bound(bound)] = cumulative
+            latency.setdefault(country, {})[bank_code] = {'buckets': buckets, 'count': cumulative, 'sum': histogram[-1]}
+
+        return {'validations': validations, 'latency': latency}
+
+    def to_prometheus(self):
+        snapshot = self.snapshot()
+        lines = [
+            '# HELP {}_validations_total Account validations by bank and outcome.'.format(PREFIX),
+            '# TYPE {}_validations_total counter'.format(PREFIX),
+        ]
+        for country, banks in sorted(snapshot['validations'].items()):
+            for bank_code, outcomes in sorted(banks.items()):
+                for outcome, count in sorted(outcomes.items()):
+                    lines.append('{}_validations_total{{country="{}",bank_code="{}",outcome="{}"}} {}'.format(
+                        PREFIX, country, bank_code, outcome, count))
+
+        lines.extend([
+            '# HELP {}_validation_seconds Account validation latency by bank.'.format(PREFIX),
+            '# TYPE {}_validation_seconds histogram'.format(PREFIX),
+        ])
+        for country, banks in sorted(snapshot['latency'].items()):
+            for bank_code, histogram in sorted(banks.items()):
+                labels = 'country="{}",bank_code="{}"'.format(country, bank_code)
+                for bound in self.buckets + (float('inf'),):
+                    bound = _format_bound(bound)
+                    lines.append('{}_validation_seconds_bucket{{{},le="{}"}} {}'.format(
+                        PREFIX, labels, bound, histogram['buckets'][bound]))
+                lines.append('{}_validation_seconds_sum{{{}}} {!r}'.format(PREFIX, labels, histogram['sum']))
+                lines.append('{}_validation_seconds_count{{{}}} {}'.format(PREFIX, labels, histogram['count']))
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+_active = None
+_originals = {}
+
+
+def _instrument(metrics):
+    check, validate, cached_check = BankValidator.check, BankValidator.validate, ResultCache.check
+    persistent_check_many, dedup_check_rows = PersistentCache.check_many, Deduplicator.check_rows
+    init, execute = Bank.__init__, Bank.execute
+    observe, observe_many = metrics.observe, metrics.observe_many
+
+    def instrumented_check(self, branch, branch_digit='', account='', account_digit=''):
+        started = perf_counter()
+        reason = check(self, branch, branch_digit, account, account_digit)
+        observe(self.bank_class, reason, perf_counter() - started)
+        return reason
+
+    def instrumented_validate(self, record):
+        started = perf_counter()
+        reason = validate(self, record)
+        observe(self.bank_class, reason, perf_counter() - started)
+        return reason
+
+    def instrumented_cached_check(self, validator, branch, branch_digit, account, account_digit):
+        started = perf_counter()
+        reason = cached_check(self, validator, branch, branch_digit, account, account_digit)
+        observe(validator.bank_class, reason, perf_counter() - started)
+        return reason
+
+    def instrumented_persistent_check_many(self, validator, records):
+        started = perf_counter()
+        results = persistent_check_many(self, validator, records)
+        observe_many(validator.bank_class, results, perf_counter() - started)
+        return results
+
+    def instrumented_dedup_check_rows(self, validator, rows, check_digits_many=None):
+        started = perf_counter()
+        results = dedup_check_rows(self, validator, rows, check_digits_many)
+        observe_many(validator.bank_class, [reason for _, reason in results], perf_counter() - started)
+        return results
+
+    def instrumented_init(self, **kwargs):
+        started = perf_counter()
+        try:
+            init(self, **kwargs)
+        except BaseBankAccountValidationError as e:
+            observe(type(self), e.reason, perf_counter() - started)
+            raise
+        # A validation spans the constructor and execute(); the latter records it.
+        self._metrics_started = started
+
+    def instrumented_execute(self):
+        started = getattr(self, '_metrics_started', None) or perf_counter()
+        try:
+            execute(self)
+        except BaseBankAccountValidationError as e:
+            observe(type(self), e.reason, perf_counter() - started)
+            raise
+        observe(type(self), reasons.OK, perf_counter() - started)
+
+    return {
+        (BankValidator, 'check'): instrumented_check,
+        (BankValidator, 'validate'): instrumented_validate,
+        (ResultCache, 'check'): instrumented_cached_check,
+        (PersistentCache, 'check_many'): instrumented_persistent_check_many,
+        (Deduplicator, 'check_rows'): instrumented_dedup_check_rows,
+        (Bank, '__init__'): instrumented_init,
+        (Bank, 'execute'): instrumented_execute,
+    }
+
+
+def enable(metrics=None):
+    # Starts collecting into `metrics` (a new Metrics by default), which is returned. Enabling twice swaps collectors.
+    global _active
+    disable()
+
+    metrics = metrics if metrics is not None else Metrics()
+    for (cls, name), function in _instrument(metrics).items():
+        _originals[cls, name] = cls.__dict__[name]
+        setattr(cls, name, function)
+    _active = metrics
+    return metrics
+
+
+def disable():
+    global _active
+    for (cls, name), function in _originals.items():
+        setattr(cls, name, function)
+    _originals.clear()
+    _active = None
+
+
+def active():
+    # The Metrics being collected into, or None when disabled.
+    return _active
+
+
+def snapshot():
+    return _active.snapshot() if _active is not None else {'validations': {}, 'latency': {}}
+
+
+def to_prometheus():
+    return _active.to_prometheus() if _active is not None else Metrics().to_prometheus()
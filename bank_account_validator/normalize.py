@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Input normalization for all four account fields at once, without regular expressions. Accepts text, bytes and int
+# values, drops spaces and dots, splits "1769-8"-style values into number and digit and rejects any other character
+# right away (normalize_fields() returns None) instead of failing later on int() conversion.
+SEPARATORS = ' .\t'
+
+_DROP_SEPARATORS = dict((ord(character), None) for character in SEPARATORS)
+
+INVALID = object()
+
+try:  # Python 2: text is unicode, and big ints are longs
+    TEXT = unicode  # noqa: F821
+    INTEGERS = (int, long)  # noqa: F821
+except NameError:
+    TEXT = str
+    INTEGERS = (int,)
+
+
+def _text(value):
+    # text/bytes/non-negative int -> text without separators; None -> ''; INVALID for anything else.
+    if value is None:
+        return ''
+    if isinstance(value, TEXT):
+        text = value
+    elif isinstance(value, bytes):
+        try:
+            text = value.decode('ascii')
+        except UnicodeDecodeError:
+            return INVALID
+    elif isinstance(value, INTEGERS) and not isinstance(value, bool) and value >= 0:
+        text = TEXT(value)
+    else:
+        return INVALID
+
+    if ' ' in text or '.' in text or '\t' in text:
+        return text.translate(_DROP_SEPARATORS)
+    return text
+
+
+def _split_digit(number, digit):
+    # "1769-8" -> ("1769", "8"); the digit may also come separately, as long as both agree.
+    if number is INVALID or '-' not in number:
+        return number, digit
+
+    number, _, embedded = number.rpartition('-')
+    if digit and digit != embedded:
+        return INVALID, INVALID
+    return number, embedded
+
+
+if hasattr(str, 'isascii'):
+    is_ascii = str.isascii
+else:  # pragma: no cover - Python < 3.7
+    def is_ascii(text):
+        try:
+            text.encode('ascii')
+        except UnicodeError:
+            return False
+        return True
+
+
+def _is_number(value):
+    return value.isdigit() and is_ascii(value)
+
+
+def _is_verifier_digit(value):
+    # Verifier digits may be letters too (e.g. Banco do Brasil's 'X').
+    return value.isalnum() and is_ascii(value)
+
+
+def _zfill(value, length):
+    if not value:
+        return ''
+    value = value.lstrip('0')
+    return value.zfill(length) if length else value
+
+
+def _fill(value, length, is_valid):
+    if not value:
+        return value  # '' or INVALID
+    if value is INVALID or not is_valid(value):
+        return INVALID
+    return _zfill(value, length)
+
+
+def normalize_field(value, length=None, verifier_digit=False):
+    # A single field: digits only (or letters too for verifier digits), leading zeroes replaced by zero-filling up to
+    # `length`. Returns None for invalid input.
+    result = _fill(_text(value), length, _is_verifier_digit if verifier_digit else _is_number)
+    return None if result is INVALID else result
+
+
+def normalize_fields(branch, branch_digit, account, account_digit,
+                     branch_length, branch_digit_length, account_length, account_digit_length):
+    """
+    Normalizes a whole record in one go: returns the (branch, branch_digit, account, account_digit) strings, zero-filled
+    like utils.smarter_zfill() does, or None as soon as any field holds an invalid character.
+    """
+    cls = branch.__class__
+    if (cls is str or cls is TEXT) and cls is account.__class__ is branch_digit.__class__ is account_digit.__class__:
+        # Common case, plain strings: validate with a handful of C-level string methods and skip splitting/conversion.
+        digits = branch_digit + account_digit
+        if ((branch + account).isdigit() and is_ascii(branch + account + digits) and
+                (not digits or digits.isalnum())):
+            return (_zfill(branch, branch_length), _zfill(branch_digit, branch_digit_length),
+                    _zfill(account, account_length), _zfill(account_digit, account_digit_length))
+
+    branch, branch_digit = _split_digit(_text(branch), _text(branch_digit))
+    account, account_digit = _split_digit(_text(account), _text(account_digit))
+
+    branch = _fill(branch, branch_length, _is_number)
+    if branch is INVALID:
+        return None
+    branch_digit = _fill(branch_digit, branch_digit_length, _is_verifier_digit)
+    if branch_digit is INVALID:
+        return None
+    account = _fill(account, account_length, _is_number)
+    if account is INVALID:
+        return None
+    account_digit = _fill(account_digit, account_digit_length, _is_verifier_digit)
+    if account_digit is INVALID:
+        return None
+
+    return branch, branch_digit, account, account_digit
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+from collections import deque
+
+from bank_account_validator.batch import _chunks, validate_chunk
+
+
+def _validate_chunk(records, country):
+    # Runs in the workers: reason codes all fit in a byte, so they travel back as one bytearray per chunk.
+    return bytearray(validate_chunk(records, country))
+
+
+def validate_parallel(records, country='BR', workers=None, chunk_size=5000, max_pending=None):
+    """
+    Same as batch.validate_many(), spread over a pool of `workers` processes (default: one per CPU).
+    Records are sent to the workers as plain tuples, `chunk_size` at a time, and reason codes are yielded in input
+    order. At most `max_pending` chunks (default: twice the workers) are in flight or waiting to be yielded, so memory
+    stays flat however long the input is.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    max_pending = max_pending or 2 * workers
+
+    pool = multiprocessing.Pool(workers)
+    pending = deque()
+    try:
+        for chunk in _chunks(records, chunk_size):
+            pending.append(pool.apply_async(_validate_chunk, (chunk, country)))
+
+            while len(pending) >= max_pending:
+                for reason in pending.popleft().get():
+                    yield reason
+
+        while pending:
+            for reason in pending.popleft().get():
+                yield reason
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
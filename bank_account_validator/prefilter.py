@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# First stage of BankValidator.check(): settles the rows most feeds get wrong - oversized junk, wrong lengths, letters
+# where digits belong, missing digits - straight from the raw values. Rows of plain str (or all-bytes, decoded once)
+# digits are normalized and length-checked in the same pass; anything else (separators, ints, None...) is left to
+# normalize.normalize_fields(), whose results the prefilter always agrees with.
+from bank_account_validator import reasons
+from bank_account_validator.normalize import INTEGERS, TEXT, _zfill, is_ascii
+
+# Longest raw value accepted for any field, in characters or bytes. No real branch or account comes close; longer values
+# are rejected before being scanned or copied, so a junk row costs the same as a short one.
+MAX_FIELD_LENGTH = 64
+
+# Reason for an oversized value of each field, in check order.
+OVERSIZED = (reasons.INVALID_BRANCH_LENGTH, reasons.UNEXPECTED_BRANCH_DIGIT,
+             reasons.INVALID_ACCOUNT_LENGTH, reasons.UNEXPECTED_ACCOUNT_DIGIT)
+
+
+def _is_oversized(value, max_length):
+    if isinstance(value, (TEXT, bytes)):
+        return len(value) > max_length
+    if isinstance(value, INTEGERS):  # str() of huge ints is slow, or even refused
+        return value >= 10 ** max_length
+    return False
+
+
+def oversized(values, max_length=MAX_FIELD_LENGTH):
+    # The reason for the first of the four field values that is too long, or reasons.OK.
+    for value, reason in zip(values, OVERSIZED):
+        if _is_oversized(value, max_length):
+            return reason
+    return reasons.OK
+
+
+class Prefilter(object):
+    """
+    One bank's table of field lengths (branch_length, branch_digit_length, account_length, account_digit_length) and
+    the size cap. check() returns a reason code for rows it can reject, the normalized (branch, branch_digit, account,
+    account_digit) tuple for rows that pass every length check, or None when only normalize_fields() can tell.
+
+    With `normalize` off (banks with their own normalization, e.g. IBANs) only the size cap is checked.
+    """
+    __slots__ = ('lengths', 'max_field_length', 'normalize')
+
+    def __init__(self, lengths, max_field_length=MAX_FIELD_LENGTH, normalize=True):
+        self.lengths = tuple(lengths)
+        self.max_field_length = max_field_length
+        self.normalize = normalize
+
+    def __repr__(self):
+        return 'Prefilter({!r}, max_field_length={!r}, normalize={!r})'.format(self.lengths, self.max_field_length, self.normalize)
+
+    def check(self, branch, branch_digit, account, account_digit):
+        cls = branch.__class__
+        max_length = self.max_field_length
+        same_type = cls is branch_digit.__class__ is account.__class__ is account_digit.__class__
+        if not same_type or (cls is not str and cls is not bytes and cls is not TEXT):
+            return oversized((branch, branch_digit, account, account_digit), max_length) or None
+
+        if max(len(branch), len(branch_digit), len(account), len(account_digit)) > max_length:
+            return oversized((branch, branch_digit, account, account_digit), max_length)
+        if not self.normalize:
+            return None
+
+        if cls is bytes:
+            try:
+                branch, branch_digit = branch.decode('ascii'), branch_digit.decode('ascii')
+                account, account_digit = account.decode('ascii'), account_digit.decode('ascii')
+            except UnicodeDecodeError:
+                return reasons.INVALID_CHARACTERS
+
+        number = branch + account
+        digits = branch_digit + account_digit
+        if not (number.isdigit() and is_ascii(number + digits) and (not digits or digits.isalnum())):
+            row = number + digits
+            if not number or '-' in row or ' ' in row or '.' in row or '\t' in row:
+                return None  # separators to drop or split on
+            return reasons.INVALID_CHARACTERS
+
+        branch_length, branch_digit_length, account_length, account_digit_length = self.lengths
+        branch = _zfill(branch, branch_length)
+        if len(branch) != branch_length:
+            return reasons.INVALID_BRANCH_LENGTH
+
+        branch_digit = _zfill(branch_digit, branch_digit_length)
+        if len(branch_digit) != branch_digit_length:
+            return reasons.MISSING_BRANCH_DIGIT if len(branch_digit) < branch_digit_length else reasons.UNEXPECTED_BRANCH_DIGIT
+
+        account = _zfill(account, account_length)
+        if len(account) != account_length:
+            return reasons.INVALID_ACCOUNT_LENGTH
+
+        account_digit = _zfill(account_digit, account_digit_length)
+        if len(account_digit) != account_digit_length:
+            return reasons.MISSING_ACCOUNT_DIGIT if len(account_digit) < account_digit_length else reasons.UNEXPECTED_ACCOUNT_DIGIT
+
+        return branch, branch_digit, account, account_digit
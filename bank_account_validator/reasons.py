@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Compact outcome codes for the non-raising validation paths. Every failure code matches one exception from
+# bank_account_validator.exceptions (see their `reason` attribute); OK means the account is valid.
+OK = 0
+BANK_NOT_IMPLEMENTED = 1
+INVALID_BRANCH_LENGTH = 2
+MISSING_BRANCH_DIGIT = 3
+UNEXPECTED_BRANCH_DIGIT = 4
+INVALID_ACCOUNT_LENGTH = 5
+MISSING_ACCOUNT_DIGIT = 6
+UNEXPECTED_ACCOUNT_DIGIT = 7
+INVALID_BRANCH = 8
+INVALID_ACCOUNT = 9
+INVALID_BRANCH_AND_ACCOUNT_COMBINATION = 10
+INVALID_CHARACTERS = 11
+
+NAMES = {
+    OK: 'OK',
+    BANK_NOT_IMPLEMENTED: 'BankNotImplemented',
+    INVALID_BRANCH_LENGTH: 'InvalidBranchlength',
+    MISSING_BRANCH_DIGIT: 'MissingBranchDigit',
+    UNEXPECTED_BRANCH_DIGIT: 'UnexpectedBranchDigit',
+    INVALID_ACCOUNT_LENGTH: 'InvalidAccountlength',
+    MISSING_ACCOUNT_DIGIT: 'MissingAccountDigit',
+    UNEXPECTED_ACCOUNT_DIGIT: 'UnexpectedAccountDigit',
+    INVALID_BRANCH: 'InvalidBranch',
+    INVALID_ACCOUNT: 'InvalidAccount',
+    INVALID_BRANCH_AND_ACCOUNT_COMBINATION: 'InvalidBranchAndAccountCombination',
+    INVALID_CHARACTERS: 'InvalidCharacters',
+}
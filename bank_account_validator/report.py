@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming summary of a bulk validation run: counts per reason and per bank, plus the branches with the most failures.
+
+    report = ValidationReport()
+    for reason in report.track(records):  # same reason codes as batch.validate_many(records)
+        ...
+    report.to_json()
+
+Memory doesn't grow with the input: counters are per reason and per implemented bank, and failing branches go through a
+Misra-Gries sketch of `capacity` counters. Reports of separate shards or processes merge with merge(), or from their
+to_dict() output via from_dict(). Counts merge exactly, and so do branch failures while the failing branches fit in
+`capacity`. Past that, branch counts may be low by up to `branch_error`, which stays below failures / capacity: any
+branch with more failures than that is still tracked.
+"""
+import json
+from heapq import nlargest, nsmallest
+from itertools import tee
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import _as_tuple, validate_many
+
+
+class ValidationReport(object):
+    def __init__(self, top_k=10, capacity=1000):
+        if not 0 < top_k <= capacity:
+            raise ValueError('top_k must be between 1 and capacity.')
+
+        self.top_k = top_k
+        self.capacity = capacity
+        self.total = 0
+        self.reasons = {}  # reason -> records
+        self.banks = {}  # bank_code -> {reason: records}, for implemented banks only
+        self.branches = {}  # (bank_code, branch) -> failures: the Misra-Gries sketch
+        self.branch_error = 0  # how many failures each branch count may be missing
+
+    def add(self, bank_code, branch, reason):
+        self.total += 1
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        if reason == reasons.BANK_NOT_IMPLEMENTED:
+            return
+
+        bank = self.banks.get(bank_code)
+        if bank is None:
+            bank = self.banks[bank_code] = {}
+        bank[reason] = bank.get(reason, 0) + 1
+
+        if reason == reasons.OK:
+            return
+
+        key = (bank_code, branch)
+        branches = self.branches
+        if key in branches:
+            branches[key] += 1
+        elif len(branches) < self.capacity:
+            branches[key] = 1
+        else:
+            # Misra-Gries: the new failure and one of every tracked branch's cancel out. Counters reaching zero are
+            # dropped, so the work is paid for by the increments that came before.
+            self.branch_error += 1
+            for tracked, failures in list(branches.items()):
+                if failures == 1:
+                    del branches[tracked]
+                else:
+                    branches[tracked] = failures - 1
+
+    def track(self, records, country='BR', **kwargs):
+        # batch.validate_many(records, country, **kwargs), adding every outcome to the report as it is yielded.
+        records, copy = tee(records)
+        for reason, record in zip(validate_many(records, country, **kwargs), copy):
+            record = _as_tuple(record)
+            self.add(record[0], record[1], reason)
+            yield reason
+
+    def merge(self, other):
+        """
+        Adds `other`'s counts to this report, which is returned. Sketches merge as mergeable summaries do: counters
+        are added up and, when more than `capacity` are left, the next largest count is taken off all of them.
+        """
+        self.total += other.total
+        for reason, count in other.reasons.items():
+            self.reasons[reason] = self.reasons.get(reason, 0) + count
+        for bank_code, counts in other.banks.items():
+            bank = self.banks.setdefault(bank_code, {})
+            for reason, count in counts.items():
+                bank[reason] = bank.get(reason, 0) + count
+
+        branches = dict(self.branches)
+        for key, failures in other.branches.items():
+            branches[key] = branches.get(key, 0) + failures
+        self.branch_error += other.branch_error
+
+        if len(branches) > self.capacity:
+            cut = nlargest(self.capacity + 1, branches.values())[-1]
+            branches = dict((key, failures - cut) for key, failures in branches.items() if failures > cut)
+            self.branch_error += cut
+        self.branches = branches
+        return self
+
+    def top_branches(self, k=None):
+        # The `k` (default: top_k) branches with the most failures, as (bank_code, branch, failures) tuples. Ties are
+        # ordered by bank code and branch, so merged and unmerged reports list them alike.
+        entries = nsmallest(k or self.top_k, self.branches.items(), key=lambda item: (-item[1], str(item[0])))
+        return [(bank_code, branch, failures) for (bank_code, branch), failures in entries]
+
+    def to_dict(self):
+        # JSON-ready summary; `sketch` holds every tracked branch, so from_dict() can rebuild the report to merge it.
+        def named(counts):
+            return dict((reasons.NAMES[reason], count) for reason, count in sorted(counts.items()))
+
+        return {
+            'total': self.total,
+            'valid': self.reasons.get(reasons.OK, 0),
+            'invalid': self.total - self.reasons.get(reasons.OK, 0),
+            'reasons': named(self.reasons),
+            'banks': dict(
+                (bank_code, {'total': sum(counts.values()), 'reasons': named(counts)})
+                for bank_code, counts in self.banks.items()
+            ),
+            'top_branches': [
+                {'bank_code': bank_code, 'branch': branch, 'failures': failures}
+                for bank_code, branch, failures in self.top_branches()
+            ],
+            'branch_error': self.branch_error,
+            'top_k': self.top_k,
+            'capacity': self.capacity,
+            'sketch': [list(x) for x in self.top_branches(len(self.branches))],
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_dict(cls, data):
+        codes = dict((name, reason) for reason, name in reasons.NAMES.items())
+
+        report = cls(top_k=data['top_k'], capacity=data['capacity'])
+        report.total = data['total']
+        report.reasons = dict((codes[name], count) for name, count in data['reasons'].items())
+        report.banks = dict(
+            (bank_code, dict((codes[name], count) for name, count in bank['reasons'].items()))
+            for bank_code, bank in data['banks'].items()
+        )
+        report.branches = dict(((bank_code, branch), failures) for bank_code, branch, failures in data['sketch'])
+        report.branch_error = data['branch_error']
+        return report
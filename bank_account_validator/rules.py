@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Declarative bank definitions. A rule is a plain dict:
+
+    {
+        'name': 'Bradesco',
+        'bank_code': '237',
+        'branch_length': 4,          # optional, Bank's defaults otherwise
+        'branch_digit_length': 1,
+        'account_length': 7,
+        'account_digit_length': 1,
+        'checks': [
+            {'fields': ('branch',), 'pivot': '5432', 'remap': {10: '0', 11: '0'}},
+            {'fields': ('account',), 'pivot': '2765432', 'remap': {10: '0', 11: '0'}},
+        ],
+    }
+
+Each check computes a verifier digit over the concatenation of its `fields`: ('branch',) checks the branch digit,
+('account',) the account digit and ('branch', 'account') the account digit against both. Checks take a `pivot` of
+weights plus the optional `method` ('mod11' by default, 'mod10' or 'remainder11'), `sum_digits` and `remap` of results
+10/11 - or, for irregular branch digits, a `compute(branch)` function instead.
+
+compile_rule() turns a rule into a Bank subclass at load time: ChecksumKernels with per-position tables, and a lazily
+built DigitTable for branch checks, so validating never interprets the rule again. rule_version() fingerprints a bank's
+rule and the code checking it, for outcomes stored across runs (see cache.PersistentCache).
+"""
+import hashlib
+import types
+
+from bank_account_validator.kernels import ChecksumKernel, DigitTable
+from bank_account_validator.prefilter import Prefilter
+
+LENGTHS = ('branch_length', 'branch_digit_length', 'account_length', 'account_digit_length')
+RULE_KEYS = frozenset(('name', 'bank_code', 'checks') + LENGTHS)
+CHECK_KEYS = frozenset(('fields', 'pivot', 'method', 'sum_digits', 'remap', 'compute'))
+
+# Check fields -> the Bank attribute holding its kernel.
+KERNEL_ATTRIBUTES = {
+    ('branch',): 'branch_kernel',
+    ('account',): 'account_kernel',
+    ('branch', 'account'): 'combination_kernel',
+}
+
+# Branches up to this many digits get a DigitTable of every branch's digit(s).
+MAX_TABLE_LENGTH = 4
+
+# Part of every rule_version(): bump it whenever core.Bank or core.BankValidator change how outcomes are computed, so
+# outcomes stored by cache.PersistentCache are recomputed.
+ENGINE_VERSION = 1
+
+
+def _compile_check(check, attrs, name):
+    unknown = set(check) - CHECK_KEYS
+    if unknown:
+        raise RuntimeError('{}: unknown check keys: {}'.format(name, ', '.join(sorted(unknown))))
+
+    fields = tuple(check.get('fields', ()))
+    if fields not in KERNEL_ATTRIBUTES:
+        raise RuntimeError('{}: checks must use the fields {}, not {}'.format(
+            name, ' or '.join(repr(x) for x in KERNEL_ATTRIBUTES), fields))
+    if KERNEL_ATTRIBUTES[fields] in attrs or (fields == ('branch',) and 'branch_digit_table' in attrs):
+        raise RuntimeError('{}: more than one check over {}'.format(name, fields))
+
+    branch_length = attrs['branch_length']
+    if 'compute' in check:
+        if fields != ('branch',) or branch_length > MAX_TABLE_LENGTH:
+            raise RuntimeError('{}: compute() is only supported for branches of up to {} digits'.format(name, MAX_TABLE_LENGTH))
+        attrs['branch_digit_table'] = DigitTable(check['compute'], length=branch_length, width=attrs['branch_digit_length'])
+        return
+
+    length = sum(attrs[field + '_length'] for field in fields)
+    pivot = check.get('pivot', '')
+    if len(pivot) != length or not pivot.isdigit():
+        raise RuntimeError('{}: the pivot of {} must have {} digits, not {!r}'.format(name, fields, length, pivot))
+
+    kernel = ChecksumKernel(pivot, method=check.get('method', 'mod11'), sum_digits=check.get('sum_digits', False),
+                            remap=check.get('remap'))
+    attrs[KERNEL_ATTRIBUTES[fields]] = kernel
+    if fields == ('branch',) and branch_length <= MAX_TABLE_LENGTH:
+        attrs['branch_digit_table'] = DigitTable(kernel.digit, length=branch_length)
+
+
+def compile_rule(rule, base):
+    """
+    A `base` subclass (e.g. BrazilianBank) implementing `rule`; defining it registers the bank. The rule itself is kept
+    as the class's `rule` attribute.
+    """
+    name = rule.get('name') or 'Bank{}'.format(rule.get('bank_code'))
+    unknown = set(rule) - RULE_KEYS
+    if unknown:
+        raise RuntimeError('{}: unknown rule keys: {}'.format(name, ', '.join(sorted(unknown))))
+    if not rule.get('bank_code'):
+        raise RuntimeError('{}: rules must have a bank_code'.format(name))
+
+    attrs = dict((key, rule.get(key, getattr(base, key))) for key in LENGTHS)
+    for check in rule.get('checks', ()):
+        _compile_check(check, attrs, name)
+
+    attrs.update({
+        'bank_code': rule['bank_code'],
+        'rule': rule,
+        '__module__': base.__module__,
+    })
+    return type(str(name), (base,), attrs)
+
+
+def compile_rules(rules, base):
+    return [compile_rule(rule, base) for rule in rules]
+
+
+def _fingerprint(value):
+    # A stable stand-in for `value`, whose repr() doesn't depend on memory addresses or hash randomization: functions
+    # are replaced by their bytecode and constants, containers are walked and unordered ones sorted.
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    elif isinstance(value, property):
+        return tuple(_fingerprint(x) for x in (value.fget, value.fset, value.fdel))
+    code = getattr(value, '__code__', value)
+
+    if isinstance(code, types.CodeType):
+        return code.co_code, _fingerprint(code.co_consts), code.co_names
+    if isinstance(value, dict):
+        return tuple(sorted((repr(key), _fingerprint(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint(x) for x in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_fingerprint(x)) for x in value))
+    if isinstance(value, type) or callable(value):
+        return getattr(value, '__module__', None), getattr(value, '__qualname__', getattr(value, '__name__', None))
+    return value
+
+
+def _code_fingerprint(klass, base):
+    # The code of every method `klass` and its bases define below `base`: what a bank adds to the shared classes.
+    mro = klass.__mro__
+    return tuple(
+        (name, _fingerprint(attr))
+        for cls in mro[:mro.index(base)]
+        for name, attr in sorted(vars(cls).items())
+        if isinstance(attr, (types.FunctionType, classmethod, staticmethod, property))
+    )
+
+
+def rule_version(bank_class):
+    """
+    Short hash of everything deciding `bank_class`'s outcomes: its rule, lengths, the code its own bank and validator
+    classes add to Bank and BankValidator, the kernel and prefilter code, and ENGINE_VERSION. Changing one bank's rule
+    only changes that bank's version; bumping ENGINE_VERSION (or changing the Python version, whose bytecode differs)
+    changes them all.
+
+    Bank and BankValidator themselves are left out on purpose: metrics.enable() swaps their methods at run time, which
+    must not change any version.
+    """
+    from bank_account_validator.core import Bank, BankValidator
+
+    description = (
+        ENGINE_VERSION, bank_class.country, bank_class.bank_code, tuple(getattr(bank_class, key) for key in LENGTHS),
+        _fingerprint(bank_class.rule),
+        _code_fingerprint(bank_class, Bank), _code_fingerprint(bank_class.validator_class, BankValidator),
+        tuple(_code_fingerprint(klass, object) for klass in (ChecksumKernel, DigitTable, Prefilter)),
+    )
+    return hashlib.sha1(repr(description).encode('utf-8')).hexdigest()[:16]
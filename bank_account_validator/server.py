@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+A small HTTP/JSON validation service built on asyncio (Python 3 only, no dependencies).
+
+    python -m bank_account_validator.server --port 8080
+
+POST /validate        {"bank_code": "237", "branch": "1769", "branch_digit": "8", "account": "200040", "account_digit": "7"}
+POST /validate/batch  {"country": "BR", "accounts": [{...}, ["237", "1769", "8", "200040", "7"], ...]}
+GET  /health
+GET  /metrics         Prometheus text format (start with --metrics; see bank_account_validator.metrics)
+
+Batches bigger than `offload_threshold` accounts are validated in a process pool, so the event loop keeps answering
+small requests while they run.
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from bank_account_validator import metrics, reasons
+from bank_account_validator.batch import _as_tuple, validate_chunk
+from bank_account_validator.parallel import _validate_chunk
+
+STATUS_LINES = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error',
+}
+
+ROUTES = {
+    '/health': 'GET',
+    '/metrics': 'GET',
+    '/validate': 'POST',
+    '/validate/batch': 'POST',
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super(HTTPError, self).__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _result(reason):
+    return {'valid': reason == reasons.OK, 'reason': reasons.NAMES[reason], 'reason_code': reason}
+
+
+def _records(accounts):
+    records = []
+    for account in accounts:
+        if isinstance(account, dict) and all(key in account for key in ('bank_code', 'branch', 'account')):
+            record = _as_tuple(account)
+        elif isinstance(account, (list, tuple)) and len(account) == 5:
+            record = tuple(account)
+        else:
+            raise HTTPError(400, 'Accounts must be objects with bank_code, branch and account, or 5-item lists.')
+        if isinstance(record[0], (list, dict)):
+            raise HTTPError(400, 'bank_code must be a string.')
+        records.append(record)
+    return records
+
+
+async def _read_headers(reader):
+    headers = {}
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:  # longer than the reader's limit (64 KiB)
+            raise HTTPError(431, 'Request header fields are too large.')
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+class ValidationServer(object):
+    def __init__(self, host='127.0.0.1', port=8080, workers=None, offload_threshold=1000, max_body_size=16 * 1024 * 1024):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.offload_threshold = offload_threshold
+        self.max_body_size = max_body_size
+        self.executor = None
+        self.server = None
+
+    async def start(self):
+        if self.workers != 0:
+            self.executor = ProcessPoolExecutor(self.workers)
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def validate(self, records, country):
+        if self.executor is not None and len(records) > self.offload_threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _validate_chunk, records, country)
+        return validate_chunk(records, country)
+
+    async def dispatch(self, method, path, body):
+        if path not in ROUTES:
+            raise HTTPError(404, 'Not found.')
+        if method != ROUTES[path]:
+            raise HTTPError(405, 'Use {}.'.format(ROUTES[path]))
+
+        if path == '/health':
+            return {'status': 'ok'}
+
+        if path == '/metrics':
+            return metrics.to_prometheus()  # text, not JSON
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except ValueError:
+            raise HTTPError(400, 'Request body must be JSON.')
+        if not isinstance(payload, dict):
+            raise HTTPError(400, 'Request body must be a JSON object.')
+
+        country = payload.get('country', 'BR')
+        if not isinstance(country, str):
+            raise HTTPError(400, '"country" must be a string.')
+        if path == '/validate':
+            reason, = await self.validate(_records([payload]), country)
+            return _result(reason)
+
+        accounts = payload.get('accounts')
+        if not isinstance(accounts, list):
+            raise HTTPError(400, '"accounts" must be a list.')
+        results = await self.validate(_records(accounts), country)
+        return {'results': [_result(reason) for reason in results]}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    headers = await _read_headers(reader)
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+
+                    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                    length = int(headers.get('content-length', 0))
+                    if length > self.max_body_size:
+                        keep_alive = False
+                        raise HTTPError(413, 'Request body is too large.')
+                    body = await reader.readexactly(length)
+                    status, response = 200, await self.dispatch(method, path.split('?', 1)[0], body)
+                except HTTPError as e:
+                    status, response = e.status, {'error': e.message}
+                except ValueError:
+                    status, response, keep_alive = 400, {'error': 'Malformed request.'}, False
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception:  # a bug, but the client still gets an answer
+                    status, response, keep_alive = 500, {'error': 'Internal server error.'}, False
+
+                self.write_response(writer, status, response, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:  # server shutting down with the connection still open
+            pass
+        finally:
+            writer.close()
+
+    def write_response(self, writer, status, payload, keep_alive):
+        if isinstance(payload, str):
+            body, content_type = payload.encode('utf-8'), 'text/plain; version=0.0.4'
+        else:
+            body, content_type = json.dumps(payload).encode('utf-8'), 'application/json'
+        head = 'HTTP/1.1 {} {}\r\nContent-Type: {}\r\nContent-Length: {}\r\nConnection: {}\r\n\r\n'.format(
+            status, STATUS_LINES[status], content_type, len(body), 'keep-alive' if keep_alive else 'close'
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+async def serve(**kwargs):
+    server = await ValidationServer(**kwargs).start()
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m bank_account_validator.server',
+                                     description='Bank account validation HTTP service.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help='processes for large batches (default: one per CPU; 0 disables)')
+    parser.add_argument('--offload-threshold', type=int, default=1000, help='batches bigger than this go to the process pool')
+    parser.add_argument('--metrics', action='store_true', help='collect validation metrics, served at /metrics')
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        metrics.enable()
+
+    try:
+        asyncio.run(serve(host=args.host, port=args.port, workers=args.workers, offload_threshold=args.offload_threshold))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Likely intended values for accounts that fail their check digits: one changed digit or two swapped adjacent digits in
+the branch, the account or the verifier digit itself.
+
+Candidates are scored against the bank's compiled ChecksumKernel incrementally: the weighted sum of the original value
+is computed once, and each candidate's sum is that total minus the contributions of the changed positions plus their
+new ones. All candidates of a record cost O(n) instead of a full checksum each.
+"""
+from bank_account_validator import reasons
+from bank_account_validator.batch import _as_tuple
+from bank_account_validator.core import DIGIT_CANDIDATES, AccountRecord, get_bank_class
+
+DIGITS = '0123456789'
+
+
+def _edits(value, alphabet=DIGITS):
+    # Every single-character substitution, then every adjacent transposition, of `value`.
+    for index, current in enumerate(value):
+        for digit in alphabet:
+            if digit != current:
+                yield value[:index] + digit + value[index + 1:]
+
+    for index in range(len(value) - 1):
+        if value[index] != value[index + 1]:
+            yield value[:index] + value[index + 1] + value[index] + value[index + 2:]
+
+
+def kernel_edits(kernel, data, digit):
+    """
+    The single-digit substitutions and adjacent transpositions of `data` that `kernel` accepts with verifier `digit`,
+    computed as deltas of data's weighted sum.
+    """
+    tables = kernel.tables
+    contributions = [table[character] for table, character in zip(tables, data)]
+    total = sum(contributions)
+    expected = digit.lower()
+    lower_digits, result = kernel.lower_digits, kernel.result
+
+    for index, table in enumerate(tables):
+        base = total - contributions[index]
+        current = data[index]
+        for candidate in DIGITS:
+            if candidate != current and lower_digits[result(base + table[candidate])] == expected:
+                yield data[:index] + candidate + data[index + 1:]
+
+    for index in range(len(data) - 1):
+        first, second = data[index], data[index + 1]
+        if first == second:
+            continue
+
+        swapped = (total - contributions[index] - contributions[index + 1] +
+                   tables[index][second] + tables[index + 1][first])
+        if lower_digits[result(swapped)] == expected:
+            yield data[:index] + second + first + data[index + 2:]
+
+
+def _brute_force(validator, branch, branch_digit, account, account_digit, reason):
+    # Fallback for banks without kernels for the failing check, or with their own validate*() methods.
+    check = validator.check_digits
+    if reason == reasons.INVALID_BRANCH:
+        candidates = [(x, branch_digit, account, account_digit) for x in _edits(branch)]
+        candidates += [(branch, x, account, account_digit) for x in _edits(branch_digit, DIGIT_CANDIDATES)]
+    else:
+        candidates = [(x, branch_digit, account, account_digit) for x in _edits(branch)] if validator.combination_matches else []
+        candidates += [(branch, branch_digit, x, account_digit) for x in _edits(account)]
+        candidates += [(branch, branch_digit, account, x) for x in _edits(account_digit, DIGIT_CANDIDATES)]
+    return [AccountRecord(*fields) for fields in candidates if check(*fields) == reasons.OK]
+
+
+def _kernel_suggestions(validator, branch, branch_digit, account, account_digit, reason):
+    bank_class = validator.bank_class
+    results = []
+
+    if reason == reasons.INVALID_ACCOUNT:
+        kernel = bank_class.account_kernel
+        for candidate in kernel_edits(kernel, account, account_digit):
+            if validator.combination_matches is None or validator.combination_matches(branch + candidate, account_digit):
+                results.append(AccountRecord(branch, branch_digit, candidate, account_digit))
+        data = account
+    else:
+        kernel = bank_class.combination_kernel
+        split = len(branch)
+        for candidate in kernel_edits(kernel, branch + account, account_digit):
+            new_branch, new_account = candidate[:split], candidate[split:]
+            if new_branch != branch:
+                if new_account != account:  # digits swapped across the two fields: not a typo in either
+                    continue
+                if validator.branch_matches is not None and not validator.branch_matches(new_branch, branch_digit):
+                    continue
+            if validator.account_matches is not None and not validator.account_matches(new_account, account_digit):
+                continue
+            results.append(AccountRecord(new_branch, branch_digit, new_account, account_digit))
+        data = branch + account
+
+    # The verifier digit itself may be the typo.
+    digit = kernel.digit(data)
+    if digit is not None and validator.check_digits(branch, branch_digit, account, digit) == reasons.OK:
+        results.append(AccountRecord(branch, branch_digit, account, digit))
+    return results
+
+
+def suggest(bank_code, branch, branch_digit, account, account_digit, country='BR'):
+    """
+    Returns the AccountRecords (normalized) one typo away from the given account that pass validation. Only accounts
+    rejected by their check digits (InvalidBranch, InvalidAccount, InvalidBranchAndAccountCombination) get suggestions;
+    anything else, valid accounts included, gets an empty list.
+    """
+    bank_class = get_bank_class(bank_code, country)
+    if bank_class is None:
+        return []
+
+    validator = bank_class.validator
+    fields = validator.normalize(branch, branch_digit, account, account_digit)
+    if fields is None or validator.check_lengths(*fields):
+        return []
+
+    reason = validator.check_digits(*fields)
+    if reason == reasons.OK:
+        return []
+
+    use_kernel = not validator.custom and (
+        (reason == reasons.INVALID_ACCOUNT and bank_class.account_kernel is not None) or
+        (reason == reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION and bank_class.combination_kernel is not None)
+    )
+    if use_kernel:
+        return _kernel_suggestions(validator, *(fields + (reason,)))
+    return _brute_force(validator, *(fields + (reason,)))
+
+
+def suggest_many(records, country='BR'):
+    # suggest() for an iterable of records (tuples or dicts, as in batch.validate_many), yielding one list per record.
+    for record in records:
+        bank_code, branch, branch_digit, account, account_digit = _as_tuple(record)
+        yield suggest(bank_code, branch, branch_digit, account, account_digit, country)
@@ -1,12 +1,9 @@
 # -*- coding: utf-8 -*-
-import re
-
-
 def smarter_zfill(value, expected_length=None):
     if not value:
         return ''
 
-    result = re.sub('^0+', '', str(value))
+    result = str(value).lstrip('0')
 
     if expected_length:
         result = result.zfill(expected_length)
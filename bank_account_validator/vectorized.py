@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Column-wise validation. With NumPy installed, N fixed-width digit strings become an (N, width) uint8 matrix and every
+# bank's checksum kernels (see bank_account_validator.kernels) run as matrix operations against their weights.
+# Without NumPy the same functions fall back to plain Python.
+from bank_account_validator import reasons
+from bank_account_validator.kernels import ChecksumKernel
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+HAS_NUMPY = numpy is not None
+
+
+def to_digit_matrix(values, width):
+    # N digit strings (left-padded to `width`) -> (N, width) uint8 matrix of digit values.
+    data = ''.join(value.zfill(width) for value in values).encode('ascii')
+    return (numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, width) - ord('0')).astype(numpy.uint8)
+
+
+def _results(matrix, kernel):
+    products = matrix.astype(numpy.int64) * numpy.array(kernel.weights, dtype=numpy.int64)
+    if kernel.sum_digits:
+        products = products // 10 + products % 10
+    total = products.sum(axis=1)
+
+    if kernel.method == 'mod10':
+        return 10 - total % 10
+    if kernel.method == 'mod11':
+        return 11 - total % 11
+    return total % 11
+
+
+def calculate_verifier_digits(values, pivot, method='mod11', sum_digits=False):
+    # Column version of utils.calculate_verifier_digit (plus the kernels' 'remainder11' method).
+    kernel = ChecksumKernel(pivot, method, sum_digits)
+    if not HAS_NUMPY:
+        return [kernel.result(kernel.total(value.zfill(len(pivot)))) for value in values]
+
+    return _results(to_digit_matrix(values, len(pivot)), kernel)
+
+
+def _expected_codes(kernel):
+    # Raw result (0..11) -> lowercased ASCII code of the expected digit; 0 for results that can never match.
+    codes = numpy.zeros(12, dtype=numpy.uint8)
+    for result, digit in enumerate(kernel.lower_digits):
+        if digit is not None:
+            codes[result] = ord(digit)
+    return codes
+
+
+def _digit_codes(digits):
+    return numpy.frombuffer(''.join(digits).lower().encode('ascii'), dtype=numpy.uint8)
+
+
+def _non_digit_rows(matrix):
+    return (matrix > 9).any(axis=1)
+
+
+def _checksum_matches(data, digits, kernel):
+    matrix = to_digit_matrix(data, len(kernel.weights))
+    expected = _expected_codes(kernel)[_results(matrix, kernel)]
+    return (expected == _digit_codes(digits)) & ~_non_digit_rows(matrix)
+
+
+def _banrisul_branch_matches(branches, branch_digits):
+    b = to_digit_matrix(branches, 4).astype(numpy.int64)
+    digits = to_digit_matrix(branch_digits, 2).astype(numpy.int64)
+
+    doubled = b * numpy.array([1, 2, 1, 2])
+    first = 10 - (doubled // 10 + doubled % 10).sum(axis=1) % 10
+    first[first == 10] = 0
+
+    base = (b * numpy.array([6, 5, 4, 3])).sum(axis=1)
+    second = 11 - (base + first * 2) % 11
+
+    ten = second == 10
+    first = numpy.where(ten, (first + 1) % 10, first)
+    second = numpy.where(ten, 11 - (base + first * 2) % 11, numpy.where(second == 11, 0, second))
+
+    return (digits[:, 0] == first) & (digits[:, 1] == second) & ~_non_digit_rows(b)
+
+
+# Branch checks that are not a single checksum kernel, by (country, bank_code).
+BRANCH_DIGIT_FUNCTIONS = {
+    ('BR', '041'): _banrisul_branch_matches,
+}
+
+
+def _iban_matches(ibans, country_code):
+    # Horner's rule over the rearranged IBANs (all of the same length by now), one character position at a time for
+    # every row at once: digits shift the remainder mod 97 one decimal place, letters (10..35) two.
+    data = ''.join(iban[4:] + iban[:4] for iban in ibans).encode('ascii')
+    codes = numpy.frombuffer(data, dtype=numpy.uint8).reshape(len(ibans), -1).astype(numpy.int64)
+    values = numpy.where(codes >= ord('A'), codes - (ord('A') - 10), codes - ord('0'))
+
+    remainders = numpy.zeros(len(ibans), dtype=numpy.int64)
+    for column in values.T:
+        remainders = (remainders * numpy.where(column < 10, 10, 100) + column) % 97
+
+    heads = numpy.array([iban[:2] == country_code and iban[2:4].isdigit() for iban in ibans], dtype=bool)
+    return heads & (remainders == 1)
+
+
+# Account checks that replace the checksum kernels for a whole country, by country.
+ACCOUNT_FUNCTIONS = {
+    'IBAN': _iban_matches,
+}
+
+
+def _numpy_check(bank_class, indexes, branches, branch_digits, accounts, account_digits, results):
+    branch_function = BRANCH_DIGIT_FUNCTIONS.get((bank_class.country, bank_class.bank_code))
+
+    # Same order as Bank.execute(): branch digit, then account digit, then the combination.
+    ok = numpy.ones(len(indexes), dtype=bool)
+    if branch_function is not None:
+        branch_ok = branch_function(branches, branch_digits)
+        results[indexes[~branch_ok]] = reasons.INVALID_BRANCH
+        ok &= branch_ok
+    elif bank_class.branch_kernel is not None:
+        branch_ok = _checksum_matches(branches, branch_digits, bank_class.branch_kernel)
+        results[indexes[~branch_ok]] = reasons.INVALID_BRANCH
+        ok &= branch_ok
+
+    account_function = ACCOUNT_FUNCTIONS.get(bank_class.country)
+    if account_function is not None:
+        account_ok = account_function(accounts, bank_class.bank_code)
+        results[indexes[ok & ~account_ok]] = reasons.INVALID_ACCOUNT
+        ok &= account_ok
+    elif bank_class.account_kernel is not None:
+        account_ok = _checksum_matches(accounts, account_digits, bank_class.account_kernel)
+        results[indexes[ok & ~account_ok]] = reasons.INVALID_ACCOUNT
+        ok &= account_ok
+
+    if bank_class.combination_kernel is not None:
+        data = [branch + account for branch, account in zip(branches, accounts)]
+        combination_ok = _checksum_matches(data, account_digits, bank_class.combination_kernel)
+        results[indexes[ok & ~combination_ok]] = reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION
+
+
+def check_columns(bank_class, branches, branch_digits, accounts, account_digits, normalized=False):
+    """
+    Validates whole columns of a single bank, returning one reason code per row (a NumPy array when NumPy is
+    available, a list otherwise). Rows are normalized and length-checked just like Bank() does, unless `normalized`
+    says the columns already hold zero-filled values of the bank's exact lengths.
+    """
+    bank = bank_class.__new__(bank_class)
+    load, check_lengths = bank._load, bank._check_lengths
+
+    if not HAS_NUMPY or bank_class.validator.custom:
+        # Banks overriding the validate*() methods are checked row by row, so their code still runs.
+        check_digits = bank._check_digits
+        results = []
+        for row in zip(branches, branch_digits, accounts, account_digits):
+            results.append(load(*row) or check_lengths() or check_digits())
+        return numpy.array(results, dtype=numpy.uint8) if HAS_NUMPY else results
+
+    size = len(branches)
+    results = numpy.zeros(size, dtype=numpy.uint8)
+    if normalized:
+        columns = (branches, branch_digits, accounts, account_digits)
+        indexes = numpy.arange(size)
+    else:
+        rows = []
+        for index, row in enumerate(zip(branches, branch_digits, accounts, account_digits)):
+            reason = load(*row) or check_lengths()
+            if reason:
+                results[index] = reason
+            else:
+                rows.append((index, bank.branch, bank.branch_digit, bank.account, bank.account_digit))
+        if not rows:
+            return results
+        columns = list(zip(*rows))
+        indexes = numpy.array(columns.pop(0), dtype=numpy.int64)
+
+    _numpy_check(bank_class, indexes, *(list(column) for column in columns), results=results)
+    return results
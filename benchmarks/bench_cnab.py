@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+CNAB 240 file validation: memory-mapped reader (cnab.validate_file) versus reading and decoding every line.
+
+    python -m benchmarks.bench_cnab [records]
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from bank_account_validator import reasons
+from bank_account_validator.cnab import read_accounts, validate_file
+from bank_account_validator.core import BrazilianBank, check
+from benchmarks.run import BANK_CODES, bank_records
+
+
+def write_remittance(path, size):
+    # Alternating segment A / segment B detail records, between file and batch headers and trailers.
+    records = []
+    for bank_code in BANK_CODES:
+        bank_class = BrazilianBank.get(bank_code)
+        records.extend((bank_code,) + record for record in bank_records(bank_class, 1000))
+
+    with io.open(path, 'wb') as f:
+        f.write(('2370000' + '0').ljust(240).encode('ascii') + b'\r\n')
+        f.write(('2370001' + '1').ljust(240).encode('ascii') + b'\r\n')
+        for i in range(size):
+            bank_code, branch, branch_digit, account, account_digit = records[i % len(records)]
+            head = '2370001' + '3' + '{:05d}'.format(i % 100000) + 'A' + '000000' + bank_code
+            head += branch.zfill(5) + (branch_digit or ' ')[:1] + account.zfill(12) + account_digit + ' '
+            f.write(head.ljust(240, '0').encode('ascii') + b'\r\n')
+            f.write(('2370001' + '3' + '{:05d}'.format(i % 100000) + 'B').ljust(240, '0').encode('ascii') + b'\r\n')
+        f.write(('2370001' + '5').ljust(240).encode('ascii') + b'\r\n')
+        f.write(('2370000' + '9').ljust(240).encode('ascii') + b'\r\n')
+
+
+def line_by_line(path, country='BR'):
+    with io.open(path, encoding='latin-1') as f:
+        for line_number, line in enumerate(f, 1):
+            if line[7] == '3' and line[13] == 'A':
+                account_digit = line[41].strip() or line[42].strip()
+                reason = check(line[20:23], line[23:28], line[28].strip(), line[29:41], account_digit, country)
+                yield line_number, reason
+
+
+def read_line_by_line(path):
+    with io.open(path, encoding='latin-1') as f:
+        for line_number, line in enumerate(f, 1):
+            if line[7] == '3' and line[13] == 'A':
+                account_digit = line[41].strip() or line[42].strip()
+                yield line_number, (line[20:23], line[23:28], line[28].strip(), line[29:41], account_digit), None
+
+
+def timed(name, results, size):
+    started = time.time()
+    invalid = sum(1 for result in results if result[-1] not in (reasons.OK, None))
+    elapsed = time.time() - started
+    print('{:<32} {:>8.2f}s {:>12,.0f} records/s ({} invalid)'.format(name, elapsed, size / elapsed, invalid))
+
+
+def run(size=200000):
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'remessa.rem')
+        write_remittance(path, size)
+        print('{} segment A records, {:.1f} MB'.format(size, os.path.getsize(path) / 1e6))
+
+        timed('read, line by line decoded', read_line_by_line(path), size)
+        timed('read, cnab.read_accounts', (item + (None,) for item in read_accounts(path)), size)
+        timed('validate, line by line decoded', line_by_line(path), size)
+        timed('validate, cnab.validate_file', validate_file(path), size)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    run(*[int(x) for x in sys.argv[1:]])
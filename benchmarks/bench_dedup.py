@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+validate_many() throughput with and without a Deduplicator, over inputs whose chunks hold from no duplicates at all to
+mostly duplicates. Without duplicates the deduplicator should cost little, then turn itself off.
+
+    python -m benchmarks.bench_dedup
+"""
+from __future__ import print_function
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.core import BrazilianBank
+from bank_account_validator.dedup import Deduplicator
+from benchmarks.bench_parallel import throughput
+from benchmarks.run import bank_records
+
+SIZE = 200000
+CHUNK_SIZE = 1000
+
+
+def records_with_duplicates(size, distinct_per_chunk):
+    # Each chunk of CHUNK_SIZE records cycles through `distinct_per_chunk` accounts, different in every chunk.
+    pool = [('237',) + record for record in bank_records(BrazilianBank.get('237'), size)]
+    return [pool[i // CHUNK_SIZE * distinct_per_chunk % size + i % distinct_per_chunk] for i in range(size)]
+
+
+def run():
+    for distinct in (CHUNK_SIZE, 500, 100, 10):
+        records = records_with_duplicates(SIZE, distinct)
+        baseline = throughput(lambda x: validate_many(x, chunk_size=CHUNK_SIZE), records)
+        dedup = Deduplicator()
+        rate = throughput(lambda x: validate_many(x, chunk_size=CHUNK_SIZE, dedup=dedup), records)
+        print('{:>5} distinct/chunk {:>12,.0f} records/s {:>12,.0f} deduplicated {:>6.2f}x (ratio {:.0%}{})'.format(
+            distinct, baseline, rate, rate / baseline, dedup.ratio(), '' if dedup.active else ', turned off'))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+IBAN mod-97 checks: the naive big integer conversion versus the per-character remainder table, per IBAN and for whole
+columns (check_ibans(), NumPy when installed).
+
+    python -m benchmarks.bench_iban
+"""
+from __future__ import print_function
+
+import random
+
+from bank_account_validator.countries.iban import LENGTHS, check_iban, check_ibans, compute_check_digits, remainder
+from bank_account_validator.vectorized import HAS_NUMPY
+from benchmarks.common import measure, report
+
+SIZE = 100000
+COUNTRIES = ('DE', 'FR', 'GB', 'IT', 'NL', 'ES', 'BR', 'MT')
+
+
+def naive_remainder(iban):
+    # The textbook version: every letter becomes its two-digit value and the whole string one big integer.
+    return int(''.join(str(int(character, 36)) for character in iban[4:] + iban[:4])) % 97
+
+
+def ibans(size, seed=0):
+    generator = random.Random(seed)
+    result = []
+    for i in range(size):
+        country_code = COUNTRIES[i % len(COUNTRIES)]
+        bban = ''.join(generator.choice('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ' if j % 5 == 0 else '0123456789')
+                       for j in range(LENGTHS[country_code] - 4))
+        result.append(country_code + compute_check_digits(country_code, bban) + bban)
+    return result
+
+
+def run():
+    column = ibans(SIZE)
+    assert all(naive_remainder(iban) == remainder(iban) == 1 for iban in column[:1000])
+
+    iban = column[0]
+    report('naive big integer, one IBAN', measure(lambda: naive_remainder(iban)))
+    report('remainder table, one IBAN', measure(lambda: remainder(iban)))
+    report('check_iban (normalize + lookup + check)', measure(lambda: check_iban(iban)))
+
+    print('NumPy available: {}'.format(HAS_NUMPY))
+    report('naive big integer (per IBAN)',
+           measure(lambda: [naive_remainder(x) == 1 for x in column], number=1, repeat=3) / SIZE)
+    report('check_iban loop (per IBAN)', measure(lambda: [check_iban(x) for x in column], number=1, repeat=3) / SIZE)
+    report('check_ibans (per IBAN)', measure(lambda: check_ibans(column), number=1, repeat=3) / SIZE)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of the metrics layer: never enabled, enabled then disabled again (must match) and enabled.
+
+    python -m benchmarks.bench_metrics
+"""
+from bank_account_validator import metrics
+from bank_account_validator.batch import validate_many
+from bank_account_validator.core import Bradesco, is_valid
+from benchmarks.common import fixture_records, measure, report
+
+RECORDS = fixture_records(1000)
+
+
+def execute():
+    Bradesco(branch='1769', branch_digit='8', account='200040', account_digit='7').execute()
+
+
+def run():
+    cases = [
+        ('is_valid', lambda: is_valid('237', '1769', '8', '200040', '7'), 10000, 1),
+        ('Bank(...).execute()', execute, 10000, 1),
+        ('validate_many, per record', lambda: list(validate_many(RECORDS)), 20, len(RECORDS)),
+    ]
+
+    for state in ('never enabled', 'disabled', 'enabled'):
+        if state == 'disabled':
+            metrics.enable()
+            metrics.disable()
+        elif state == 'enabled':
+            metrics.enable()
+
+        for name, func, number, operations in cases:
+            report('{} (metrics {})'.format(name, state), measure(func, number=number) / operations)
+
+    metrics.disable()
+
+
+if __name__ == '__main__':
+    run()
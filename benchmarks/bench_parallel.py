@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+validate_parallel() throughput from 1 to N worker processes (default: one per CPU), against single-process validate_many().
+
+    python -m benchmarks.bench_parallel [max_workers]
+"""
+from __future__ import print_function
+
+import multiprocessing
+import sys
+import time
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.parallel import validate_parallel
+from benchmarks.common import fixture_records
+
+SIZE = 500000
+
+
+def throughput(func, records):
+    started = time.time()
+    for _ in func(records):
+        pass
+    return len(records) / (time.time() - started)
+
+
+def run(max_workers=None):
+    max_workers = max_workers or multiprocessing.cpu_count()
+    records = fixture_records(SIZE)
+
+    baseline = throughput(validate_many, records)
+    print('{:<30} {:>12,.0f} records/s'.format('validate_many', baseline))
+
+    counts = sorted(set([2 ** i for i in range(max_workers.bit_length()) if 2 ** i <= max_workers] + [max_workers]))
+    for workers in counts:
+        rate = throughput(lambda x: validate_parallel(x, workers=workers), records)
+        print('{:<30} {:>12,.0f} records/s {:>6.2f}x'.format('validate_parallel x{}'.format(workers), rate, rate / baseline))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else None)
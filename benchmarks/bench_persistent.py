@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+validate_many() throughput with a cache.PersistentCache, as in a nightly re-validation: a first run filling the cache,
+then a run over the same accounts reading it back, against no cache at all.
+
+    python -m benchmarks.bench_persistent [size]
+"""
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.cache import PersistentCache
+from bank_account_validator.core import BrazilianBank
+from benchmarks.bench_parallel import throughput
+from benchmarks.run import BANK_CODES, bank_records
+
+SIZE = 200000
+
+
+def records(size):
+    # Distinct valid accounts, spread over the benchmarked banks.
+    per_bank = size // len(BANK_CODES)
+    return [(bank_code,) + record for bank_code in BANK_CODES for record in bank_records(BrazilianBank.get(bank_code), per_bank)]
+
+
+def run(size=SIZE):
+    accounts = records(size)
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'cache.sqlite3')
+        baseline = throughput(validate_many, accounts)
+        print('{:<20} {:>12,.0f} records/s'.format('no cache', baseline))
+
+        for name in ('cold', 'warm'):
+            with PersistentCache(path) as cache:
+                rate = throughput(lambda x: validate_many(x, cache=cache), accounts)
+                print('{:<20} {:>12,.0f} records/s {:>6.2f}x ({hits:,} hits, {misses:,} misses)'.format(
+                    name, rate, rate / baseline, **cache.stats()))
+        print('{:<20} {:>12,.0f} bytes'.format('database', os.path.getsize(path)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Bank.get() lookup cost as more banks get registered.
+
+    python -m benchmarks.bench_registry
+"""
+from bank_account_validator.core import Bank, BankMeta, BrazilianBank
+from bank_account_validator.exceptions import BankNotImplemented
+from benchmarks.common import measure, report
+
+FAKE_COUNTRY = 'ZZ'
+
+
+def register_fake_banks(total):
+    registered = sum(1 for country, _ in BankMeta.registry if country == FAKE_COUNTRY)
+    for i in range(registered, total):
+        type(str('FakeBank{}'.format(i)), (Bank,), {'country': FAKE_COUNTRY, 'bank_code': '{:05d}'.format(i)})
+
+
+def lookup_hit():
+    Bank.get('237', 'BR')
+
+
+def lookup_miss():
+    try:
+        Bank.get('999', 'BR')
+    except BankNotImplemented:
+        pass
+
+
+def run():
+    codes = ['001', '033', '041', '104', '237', '341', '399', '745', '999'] * 1000
+
+    for total in (0, 100, 1000, 10000):
+        register_fake_banks(total)
+        report('Bank.get hit ({} extra banks)'.format(total), measure(lookup_hit))
+        report('Bank.get miss ({} extra banks)'.format(total), measure(lookup_miss))
+        report('BrazilianBank.get_many x{} ({} extra banks)'.format(len(codes), total),
+               measure(lambda: BrazilianBank.get_many(codes), number=100))
+
+
+if __name__ == '__main__':
+    run()
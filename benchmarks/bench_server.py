@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Local load test of the validation server: many keep-alive clients sending single-account requests while a few send
+big batches. Starts its own server on a random port.
+
+    python -m benchmarks.bench_server [seconds]
+"""
+from __future__ import print_function
+
+import asyncio
+import json
+import sys
+import time
+
+from bank_account_validator.server import ValidationServer
+from benchmarks.common import fixture_records
+
+SINGLE_CLIENTS = 50
+BATCH_CLIENTS = 2
+BATCH_SIZE = 5000
+
+
+async def client(port, body, deadline, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    request = 'POST {} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\n\r\n'.format(body[0], len(body[1])).encode() + body[1]
+    while time.time() < deadline:
+        started = time.time()
+        writer.write(request)
+        await writer.drain()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b'\r\n':
+                break
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+        await reader.readexactly(length)
+        latencies.append(time.time() - started)
+    writer.close()
+
+
+def summary(name, latencies, seconds, per_request=1):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0
+    print('{:<8} {:>8} requests {:>10,.0f} accounts/s  p50 {:>8.2f} ms  p99 {:>8.2f} ms'.format(
+        name, len(latencies), len(latencies) * per_request / seconds,
+        latencies[len(latencies) // 2] * 1000 if latencies else 0, p99 * 1000))
+
+
+async def run(seconds):
+    server = await ValidationServer(port=0).start()
+    records = [list(record) for record in fixture_records(BATCH_SIZE)]
+    single = ('/validate', json.dumps(dict(zip(['bank_code', 'branch', 'branch_digit', 'account', 'account_digit'],
+                                               records[1]))).encode())
+    batch = ('/validate/batch', json.dumps({'accounts': records}).encode())
+
+    single_latencies, batch_latencies = [], []
+    deadline = time.time() + seconds
+    await asyncio.gather(
+        *[client(server.port, single, deadline, single_latencies) for _ in range(SINGLE_CLIENTS)] +
+        [client(server.port, batch, deadline, batch_latencies) for _ in range(BATCH_CLIENTS)]
+    )
+    await server.close()
+
+    summary('single', single_latencies, seconds)
+    summary('batch', batch_latencies, seconds, BATCH_SIZE)
+
+
+if __name__ == '__main__':
+    asyncio.run(run(float(sys.argv[1]) if len(sys.argv) > 1 else 5))
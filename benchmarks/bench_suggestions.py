@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Typo suggestions: incremental checksum deltas (suggestions.suggest) versus re-validating every candidate.
+
+    python -m benchmarks.bench_suggestions
+"""
+from bank_account_validator import reasons
+from bank_account_validator.core import BrazilianBank
+from bank_account_validator.suggestions import _brute_force, suggest
+from benchmarks.common import measure, report
+from benchmarks.run import BANK_CODES, bank_records
+
+
+def invalid_record(bank_class):
+    # A valid record with its last account digit changed, so the account (or combination) check fails.
+    for branch, branch_digit, account, account_digit in bank_records(bank_class, 100):
+        account = account[:-1] + str((int(account[-1]) + 1) % 10)
+        fields = bank_class.validator.normalize(branch, branch_digit, account, account_digit)
+        reason = bank_class.validator.check_digits(*fields)
+        if reason in (reasons.INVALID_ACCOUNT, reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION):
+            return fields, reason
+
+
+def run():
+    for bank_code in BANK_CODES:
+        bank_class = BrazilianBank.get(bank_code)
+        fields, reason = invalid_record(bank_class)
+        name = '{} ({} digits)'.format(bank_class.__name__, len(fields[0]) + len(fields[2]))
+
+        report('suggest, incremental: ' + name, measure(lambda: suggest(bank_code, *fields), number=1000))
+        report('suggest, full checksums: ' + name,
+               measure(lambda: _brute_force(bank_class.validator, *(fields + (reason,))), number=1000))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+validate_many(executor='threads') throughput from 1 to N threads (default: one per CPU), against single-threaded
+validate_many(). Run it on a regular and on a free-threaded (3.13t+) interpreter to compare scaling: with the GIL,
+more threads only add overhead.
+
+    python -m benchmarks.bench_threads [max_workers]
+"""
+from __future__ import print_function
+
+import multiprocessing
+import platform
+import sys
+
+from bank_account_validator.batch import validate_many
+from benchmarks.bench_parallel import throughput
+from benchmarks.common import fixture_records
+
+SIZE = 500000
+
+
+def gil_enabled():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run(max_workers=None):
+    max_workers = max_workers or multiprocessing.cpu_count()
+    records = fixture_records(SIZE)
+
+    print('{} {} ({})'.format(platform.python_implementation(), platform.python_version(),
+                              'GIL' if gil_enabled() else 'free-threaded'))
+
+    baseline = throughput(validate_many, records)
+    print('{:<30} {:>12,.0f} records/s'.format('validate_many', baseline))
+
+    counts = sorted(set([2 ** i for i in range(max_workers.bit_length()) if 2 ** i <= max_workers] + [max_workers]))
+    for workers in counts:
+        rate = throughput(lambda x: validate_many(x, executor='threads', workers=workers), records)
+        print('{:<30} {:>12,.0f} records/s {:>6.2f}x'.format('threads x{}'.format(workers), rate, rate / baseline))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk validation throughput: the usual try/except loop over Bank.get(...)(...).execute() versus validate_many().
+
+    python -m benchmarks.bench_validate_many
+"""
+from __future__ import print_function
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.core import Bank
+from bank_account_validator.exceptions import BaseBankAccountValidationError
+from benchmarks.common import fixture_records, measure, report
+
+SIZE = 10000
+
+
+def exception_loop(records):
+    results = []
+    for bank_code, branch, branch_digit, account, account_digit in records:
+        try:
+            Bank.get(bank_code, 'BR')(branch=branch, branch_digit=branch_digit,
+                                      account=account, account_digit=account_digit).execute()
+            results.append(None)
+        except BaseBankAccountValidationError as e:
+            results.append(e)
+    return results
+
+
+def run():
+    records = fixture_records(SIZE)
+
+    loop = measure(lambda: exception_loop(records), number=1, repeat=3) / SIZE
+    batch = measure(lambda: list(validate_many(records)), number=1, repeat=3) / SIZE
+    report('try/except execute() loop (per record)', loop)
+    report('validate_many (per record)', batch)
+    print('speedup: {:.2f}x'.format(loop / batch))
+
+
+if __name__ == '__main__':
+    run()
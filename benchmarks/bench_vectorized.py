@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Column validation with bank_account_validator.vectorized (NumPy when installed) versus validate_many().
+
+    python -m benchmarks.bench_vectorized
+"""
+from __future__ import print_function
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.core import BrazilianBank
+from bank_account_validator.vectorized import HAS_NUMPY, check_columns
+from benchmarks.common import measure, report
+
+SIZE = 100000
+
+
+def run():
+    bank_class = BrazilianBank.get('237')
+    rows = [('{:04d}'.format(i % 10000), str(i % 10), '{:07d}'.format(i * 31 % 10000000), str(i % 7)) for i in range(SIZE)]
+    columns = [list(column) for column in zip(*rows)]
+    records = [('237',) + row for row in rows]
+
+    print('NumPy available: {}'.format(HAS_NUMPY))
+    report('validate_many (per record)', measure(lambda: list(validate_many(records)), number=1, repeat=3) / SIZE)
+    report('check_columns (per record)', measure(lambda: check_columns(bank_class, *columns), number=1, repeat=3) / SIZE)
+    report('check_columns, normalized (per record)',
+           measure(lambda: check_columns(bank_class, *columns, normalized=True), number=1, repeat=3) / SIZE)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+import timeit
+
+
+def measure(func, number=10000, repeat=5):
+    # Best-of-`repeat` cost of a single call, in seconds.
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name, seconds_per_call):
+    print('{:<50} {:>12.3f} us/call {:>14,.0f} calls/s'.format(name, seconds_per_call * 1e6, 1 / seconds_per_call))
+
+
+def fixture_records(size, invalid_every=12):
+    # Records from the test fixtures, scaled up to `size`, with roughly one invalid record every `invalid_every`.
+    from tests.data import BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+    banks = (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER)
+    valid = [data for bank in banks for data in bank['valid_combinations']]
+    invalid = [data for bank in banks for data in bank['invalid_combinations']]
+
+    records = []
+    for i in range(size):
+        if i % invalid_every == 0:
+            data = invalid[i % len(invalid)]
+        else:
+            data = valid[i % len(valid)]
+        records.append((data['bank_code'], data['branch'], data['branch_digit'], data['account'], data['account_digit']))
+    return records
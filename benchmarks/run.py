@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the validation hot paths: per-bank single-record latency and bulk throughput, Bank.get() lookups,
+the invalid-record/exception path and the utils helpers.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.1
+
+With --compare, every benchmark slower than the baseline by more than the threshold is flagged and the exit status
+is 1. The bench_*.py modules next to this one are standalone, more specific comparisons.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.cache import ResultCache
+from bank_account_validator.core import Bank, BrazilianBank, is_valid
+from bank_account_validator.dedup import Deduplicator
+from bank_account_validator.exceptions import BankNotImplemented, BaseBankAccountValidationError
+from bank_account_validator.utils import calculate_verifier_digit, smarter_zfill
+from benchmarks.common import fixture_records
+
+BANK_CODES = ('001', '033', '041', '104', '237', '341', '399', '745')
+BULK_SIZE = 10000
+
+
+def bank_records(bank_class, size, seed=0):
+    # Valid (branch, branch_digit, account, account_digit) records for any bank, computed from its own check digits.
+    generator = random.Random(seed)
+    records = []
+    while len(records) < size:
+        branch = '{:04d}'.format(generator.randint(0, 9999))
+        account = str(generator.randint(1, 10 ** bank_class.account_length - 1)).zfill(bank_class.account_length)
+
+        branch_digit = ''
+        if bank_class.branch_digit_length:
+            branch_digit = bank_class.compute_branch_digit(branch)
+
+        if bank_class.account_kernel is not None or bank_class.combination_kernel is not None:
+            account_digit = bank_class.compute_account_digit(branch, account)
+        else:
+            account_digit = str(generator.randint(0, 9))
+
+        if branch_digit is not None and account_digit is not None:
+            records.append((branch, branch_digit, account, account_digit))
+    return records
+
+
+def _execute(bank_class, record):
+    branch, branch_digit, account, account_digit = record
+    bank_class(branch=branch, branch_digit=branch_digit, account=account, account_digit=account_digit).execute()
+
+
+def _raising(bank_class, record):
+    try:
+        _execute(bank_class, record)
+    except BaseBankAccountValidationError:
+        pass
+
+
+def _lookup_miss():
+    try:
+        Bank.get('999', 'BR')
+    except BankNotImplemented:
+        pass
+
+
+def benchmarks():
+    # name -> (callable, operations per call)
+    suite = {
+        'lookup.Bank.get.hit': (lambda: Bank.get('237', 'BR'), 1),
+        'lookup.Bank.get.miss': (_lookup_miss, 1),
+        'lookup.Bank.get_many': (lambda codes=list(BANK_CODES) * 125: BrazilianBank.get_many(codes), 1000),
+        'utils.smarter_zfill': (lambda: smarter_zfill('000200040', 7), 1),
+        'utils.calculate_verifier_digit': (lambda: calculate_verifier_digit('00200040', '98765432'), 1),
+    }
+
+    for bank_code in BANK_CODES:
+        bank_class = BrazilianBank.get(bank_code)
+        records = bank_records(bank_class, BULK_SIZE)
+        record = records[0]
+        invalid = record[:3] + (str((int(record[3]) + 1) % 10) if record[3].isdigit() else '0',)
+        bulk = [(bank_code,) + x for x in records]
+
+        name = 'bank.{}'.format(bank_class.__name__)
+        suite[name + '.single'] = (lambda bank_class=bank_class, record=record: _execute(bank_class, record), 1)
+        suite[name + '.invalid'] = (lambda bank_class=bank_class, record=invalid: _raising(bank_class, record), 1)
+        suite[name + '.is_valid'] = (lambda bank_code=bank_code, record=record: is_valid(bank_code, *record), 1)
+        suite[name + '.compute_account_digit'] = (
+            lambda bank_class=bank_class, record=record: bank_class.compute_account_digit(record[0], record[2]), 1
+        )
+        suite[name + '.bulk'] = (lambda bulk=bulk: list(validate_many(bulk)), len(bulk))
+
+    fixtures = fixture_records(BULK_SIZE)
+    invalid_fixtures = fixture_records(BULK_SIZE, invalid_every=1)
+    suite['bulk.fixtures.validate_many'] = (lambda: list(validate_many(fixtures)), len(fixtures))
+    # Fixture records repeat, so after the first call every record is a cache hit.
+    suite['bulk.fixtures.validate_many.cached'] = (
+        lambda cache=ResultCache(): list(validate_many(fixtures, cache=cache)), len(fixtures)
+    )
+    suite['bulk.fixtures.validate_many.dedup'] = (
+        lambda: list(validate_many(fixtures, dedup=Deduplicator())), len(fixtures)
+    )
+    suite['invalid.fixtures.validate_many'] = (lambda: list(validate_many(invalid_fixtures)), len(invalid_fixtures))
+    suite['invalid.fixtures.exceptions'] = (
+        lambda: [_raising(BrazilianBank.get(x[0]), x[1:]) for x in invalid_fixtures], len(invalid_fixtures)
+    )
+    return suite
+
+
+def measure(func, operations, min_time=0.2, repeat=5):
+    # Calibrates the number of calls so each repetition lasts about `min_time`; returns the best seconds/operation.
+    timer = timeit.Timer(func)
+    number, elapsed = 1, 0
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / max(elapsed * 10, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number / operations
+
+
+def run(selected=None, min_time=0.2, repeat=5):
+    results = {}
+    for name, (func, operations) in sorted(benchmarks().items()):
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        seconds = measure(func, operations, min_time, repeat)
+        results[name] = {'seconds_per_op': seconds, 'ops_per_second': 1 / seconds}
+        print('{:<45} {:>12.3f} us/op {:>14,.0f} ops/s'.format(name, seconds * 1e6, 1 / seconds))
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    print('\n{:<45} {:>12} {:>12} {:>9}'.format('benchmark', 'baseline us', 'current us', 'change'))
+    for name in sorted(set(results) & set(baseline)):
+        before, after = baseline[name]['seconds_per_op'], results[name]['seconds_per_op']
+        change = after / before - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('{:<45} {:>12.3f} {:>12.3f} {:>+8.1%}{}'.format(name, before * 1e6, after * 1e6, change, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('benchmarks', nargs='*', help='only run benchmarks whose name contains one of these')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', help='baseline JSON file (from --output) to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown flagged as regression (default: 0.1 = 10%%)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per repetition (default: 0.2)')
+    parser.add_argument('--repeat', type=int, default=5, help='repetitions, the best one is kept (default: 5)')
+    args = parser.parse_args(argv)
+
+    results = run(args.benchmarks, args.min_time, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'timestamp': time.time(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('\n{} regression(s) above {:.0%}.'.format(len(regressions), args.threshold))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
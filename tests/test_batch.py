@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import validate_many
+
+from tests.data import BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+ALL_BANKS = (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER)
+
+
+class ValidateManyTestCase(unittest.TestCase):
+    def test_valid_accounts(self):
+        records = [data for bank in ALL_BANKS for data in bank['valid_combinations']]
+        self.assertEqual(set(validate_many(records)), {reasons.OK})
+
+    def test_invalid_accounts(self):
+        records = [data for bank in ALL_BANKS for data in bank['invalid_combinations']]
+        self.assertNotIn(reasons.OK, list(validate_many(records)))
+
+    def test_mixed_records_keep_input_order(self):
+        records = [
+            ('237', '1769', '8', '200040', '7'),
+            {'bank_code': '033', 'branch': '2006', 'account': '01008407', 'account_digit': '1'},
+            ('999', '1769', '8', '200040', '7'),
+            ('237', '1769', '1', '200040', '7'),
+            ('237', '1769', '8', '200040', '1'),
+            ('237', '17695', '8', '200040', '7'),
+            ('237', '1769', '', '200040', '7'),
+            ('237', '1769', '12', '200040', '7'),
+            ('237', '1769', '8', '12000408', '7'),
+            ('237', '1769', '8', '200040', ''),
+            ('237', '1769', '8', '200040', '12'),
+            {'bank_code': '033', 'branch': '2006', 'account': '01008407', 'account_digit': '4'},
+        ]
+        expected = [
+            reasons.OK,
+            reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION,
+            reasons.BANK_NOT_IMPLEMENTED,
+            reasons.INVALID_BRANCH,
+            reasons.INVALID_ACCOUNT,
+            reasons.INVALID_BRANCH_LENGTH,
+            reasons.MISSING_BRANCH_DIGIT,
+            reasons.UNEXPECTED_BRANCH_DIGIT,
+            reasons.INVALID_ACCOUNT_LENGTH,
+            reasons.MISSING_ACCOUNT_DIGIT,
+            reasons.UNEXPECTED_ACCOUNT_DIGIT,
+            reasons.OK,
+        ]
+        self.assertEqual(list(validate_many(records, chunk_size=5)), expected)
+
+    def test_generator_input(self):
+        records = (('237', '1769', '8', '200040', '7') for _ in range(2500))
+        self.assertEqual(list(validate_many(records)), [reasons.OK] * 2500)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import validate_many
+from bank_account_validator.cache import MAX_PARAMETERS, PersistentCache, ResultCache
+from bank_account_validator.core import Bradesco
+from bank_account_validator.dedup import Deduplicator
+from bank_account_validator.rules import compile_rule
+
+from tests.test_rules import RulesTestBank
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = ResultCache()
+        self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '200040', '7'), reasons.OK)
+        self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '0200040', '7'), reasons.OK)
+        self.assertEqual(cache.stats(), {'size': 1, 'maxsize': 100000, 'hits': 1, 'misses': 1, 'evictions': 0})
+
+    def test_negative_results_are_cached(self):
+        cache = ResultCache()
+        for _ in range(2):
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '200040', '1'), reasons.INVALID_ACCOUNT)
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '', '200040', '7'), reasons.MISSING_BRANCH_DIGIT)
+        # Rows failing normalization or the length checks are rejected up front, without going through the cache.
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '2000x0', '7'), reasons.INVALID_CHARACTERS)
+        self.assertEqual(len(cache), 1)
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.evictions, 1)
+
+        cache.clear()
+        self.assertEqual(cache.stats(), {'size': 0, 'maxsize': 2, 'hits': 0, 'misses': 0, 'evictions': 0})
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+
+    def test_threads(self):
+        cache = ResultCache(maxsize=50)
+        records = [('237', '1769', '8', str(200000 + i), '7') for i in range(100)]
+        expected = list(validate_many(records))
+        errors = []
+
+        def work():
+            for _ in range(20):
+                if list(validate_many(records, cache=cache)) != expected:
+                    errors.append(True)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(cache.hits + cache.misses, 4 * 20 * 100)
+        self.assertEqual(len(cache), 50)
+        self.assertGreaterEqual(cache.misses - cache.evictions, 50)  # concurrent misses of one key store it once
+
+    def test_validate_many(self):
+        records = [('237', '1769', '8', '200040', '7'), ('999', '1769', '8', '200040', '7')] * 3
+        cache = ResultCache()
+        self.assertEqual(list(validate_many(records, cache=cache)), list(validate_many(records)))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+
+class PersistentCacheTestCase(unittest.TestCase):
+    RULE = {'name': 'Persisted', 'bank_code': '905', 'account_length': 6, 'checks': ({'fields': ('account',), 'pivot': '765432'},)}
+
+    def setUp(self):
+        super(PersistentCacheTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cache.sqlite3')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(PersistentCacheTestCase, self).tearDown()
+
+    def test_kept_across_instances(self):
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '200040', '7'), reasons.OK)
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '200040', '1'), reasons.INVALID_ACCOUNT)
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '', '200040', '7'), reasons.MISSING_BRANCH_DIGIT)
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '0200040', '7'), reasons.OK)
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '200040', '1'), reasons.INVALID_ACCOUNT)
+            self.assertEqual(cache.stats(), {'size': 2, 'hits': 2, 'misses': 0, 'evictions': 0, 'pending': 0})
+
+    def test_batched_writes(self):
+        cache = PersistentCache(self.path, batch_size=3)
+        accounts = [('1769', '8', str(200040 + i), '7') for i in range(4)]
+        cache.check_many(Bradesco.validator, accounts[:2])
+        self.assertEqual(cache.stats()['pending'], 2)
+        self.assertEqual(cache.check_many(Bradesco.validator, accounts[:2]), [reasons.OK, reasons.INVALID_ACCOUNT])
+        self.assertEqual((cache.hits, cache.misses), (2, 2))  # pending outcomes are found as well
+
+        cache.check_many(Bradesco.validator, accounts[2:])
+        self.assertEqual(cache.stats()['pending'], 0)
+        cache.check_many(Bradesco.validator, accounts[:1])
+        cache.close()
+
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(len(cache), 4)
+
+    def test_bulk_lookups(self):
+        accounts = [('1769', '8', str(100000 + i), '7') for i in range(MAX_PARAMETERS * 2 + 1)]
+        expected = [Bradesco.validator.check(*account) for account in accounts]
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.check_many(Bradesco.validator, accounts + accounts[:5]), expected + expected[:5])
+            self.assertEqual((cache.hits, cache.misses), (5, len(accounts)))
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(cache.check_many(Bradesco.validator, accounts), expected)
+            self.assertEqual((cache.hits, cache.misses), (len(accounts), 0))
+
+    def test_rule_changes_invalidate_their_bank_only(self):
+        bank_class = compile_rule(self.RULE, RulesTestBank)
+        with PersistentCache(self.path) as cache:
+            cache.check(bank_class.validator, '0001', '', '000001', '9')
+            cache.check(Bradesco.validator, '1769', '8', '200040', '7')
+
+        bank_class = compile_rule(self.RULE, RulesTestBank)
+        with PersistentCache(self.path) as cache:
+            cache.check(bank_class.validator, '0001', '', '000001', '9')
+            cache.check(Bradesco.validator, '1769', '8', '200040', '7')
+            self.assertEqual((cache.hits, cache.misses, cache.evictions), (2, 0, 0))
+
+        bank_class = compile_rule(dict(self.RULE, checks=({'fields': ('account',), 'pivot': '765439'},)), RulesTestBank)
+        with PersistentCache(self.path) as cache:
+            cache.check(bank_class.validator, '0001', '', '000001', '9')
+            cache.check(Bradesco.validator, '1769', '8', '200040', '7')
+            self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 1))
+
+    def test_validate_many(self):
+        records = [('237', '1769', '8', '200040', '7'), ('999', '1769', '8', '200040', '7'),
+                   ('001', '1234', 'X', '1234', '5'), ('237', '1769', '0', '0200040', '7')] * 3
+        expected = list(validate_many(records))
+        with PersistentCache(self.path) as cache:
+            self.assertEqual(list(validate_many(records, cache=cache)), expected)
+            self.assertEqual(list(validate_many(records, cache=cache, dedup=Deduplicator())), expected)
+            self.assertEqual(list(validate_many(records, cache=cache, executor='threads', workers=2, chunk_size=3)), expected)
+            self.assertEqual(len(cache), 3)
+
+    def test_clear(self):
+        with PersistentCache(self.path) as cache:
+            cache.check(Bradesco.validator, '1769', '8', '200040', '7')
+            cache.clear()
+            self.assertEqual(cache.stats(), {'size': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'pending': 0})
+            self.assertEqual(cache.check(Bradesco.validator, '1769', '8', '200040', '7'), reasons.OK)
+            self.assertEqual(cache.misses, 1)
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            PersistentCache(self.path, batch_size=0)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.cnab import main, read_accounts, validate_file
+
+
+def segment(kind='A', bank_code='237', branch='01769', branch_digit='8', account='000000200040', account_digit='7',
+            branch_account_digit=' '):
+    head = '2370001' + '3' + '00001' + kind + '000' + '000' + bank_code + branch + branch_digit + account + account_digit
+    return (head + branch_account_digit).ljust(240, 'X')
+
+
+def header(record_type):
+    return ('237' + '0000' + record_type).ljust(240, ' ')
+
+
+class ReadAccountsTestCase(unittest.TestCase):
+    def setUp(self):
+        super(ReadAccountsTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(ReadAccountsTestCase, self).tearDown()
+
+    def write(self, lines, terminator='\r\n', trailing=''):
+        path = os.path.join(self.directory, 'remessa.rem')
+        with io.open(path, 'wb') as f:
+            f.write((terminator.join(lines) + trailing).encode('latin-1'))
+        return path
+
+    def remittance(self):
+        return [
+            header('0'),
+            header('1'),
+            segment(),
+            segment('B'),
+            segment(account='000000200041'),
+            segment(bank_code='341', branch='02545', branch_digit=' ', account='000000002366', account_digit=' ',
+                    branch_account_digit='0'),
+            segment(bank_code='999'),
+            header('5'),
+            header('9'),
+        ]
+
+    def test_read_accounts(self):
+        path = self.write(self.remittance())
+        self.assertEqual(list(read_accounts(path)), [
+            (3, ('237', '01769', '8', '000000200040', '7')),
+            (5, ('237', '01769', '8', '000000200041', '7')),
+            (6, ('341', '02545', '', '000000002366', '0')),
+            (7, ('999', '01769', '8', '000000200040', '7')),
+        ])
+
+    def test_validate_file(self):
+        for terminator, trailing in (('\r\n', '\r\n'), ('\n', ''), ('', ''), ('\r\n', '\x1a')):
+            path = self.write(self.remittance(), terminator, trailing)
+            self.assertEqual([(line, reason) for line, _, reason in validate_file(path)], [
+                (3, reasons.OK),
+                (5, reasons.INVALID_ACCOUNT),
+                (6, reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION),
+                (7, reasons.BANK_NOT_IMPLEMENTED),
+            ])
+
+    def test_empty_file(self):
+        self.assertEqual(list(read_accounts(self.write([]))), [])
+
+    def test_wrong_record_length(self):
+        lines = self.remittance()
+        lines[4] = lines[4][:-1]
+        with self.assertRaises(ValueError):
+            list(read_accounts(self.write(lines)))
+
+        with self.assertRaises(ValueError):
+            list(read_accounts(self.write(self.remittance(), trailing='\r\n123')))
+
+    def test_main(self):
+        path = self.write(self.remittance()[:3])
+        self.assertEqual(main([path]), 0)
+        self.assertEqual(main([self.write(self.remittance())]), 1)
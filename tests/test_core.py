@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 import unittest
 
-from bank_account_validator.core import BrazilianBank
+from bank_account_validator import core, reasons
+from bank_account_validator.core import AccountRecord, Bank, Bradesco, BrazilianBank, check, get_bank_class, is_valid
 from bank_account_validator.exceptions import (
-    BankNotImplemented, InvalidAccount, InvalidAccountlength, InvalidBranch, InvalidBranchAndAccountCombination,
-    InvalidBranchlength, MissingAccountDigit, MissingBranchDigit, UnexpectedAccountDigit, UnexpectedBranchDigit
+    EXCEPTIONS_BY_REASON, BankNotImplemented, InvalidAccount, InvalidAccountlength, InvalidBranch,
+    InvalidBranchAndAccountCombination, InvalidBranchlength, InvalidCharacters, MissingAccountDigit, MissingBranchDigit,
+    UnexpectedAccountDigit, UnexpectedBranchDigit
 )
 
 from tests.data import BANCO_DO_BRASIL, BANRISUL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
@@ -23,6 +25,40 @@ class BanrisulValidateBranchDigitTestCase(unittest.TestCase):
             )
 
 
+class BankGetTestCase(unittest.TestCase):
+    def test_get(self):
+        self.assertIs(Bank.get('237', 'BR'), Bradesco)
+        self.assertIs(BrazilianBank.get('237'), Bradesco)
+
+    def test_get_from_unrelated_class(self):
+        with self.assertRaises(BankNotImplemented):
+            Bradesco.get('001')
+
+    def test_get_unhashable_code(self):
+        with self.assertRaises(BankNotImplemented):
+            BrazilianBank.get(['237'])
+
+    def test_subclass_does_not_replace_registered_bank(self):
+        class CustomBradesco(Bradesco):
+            pass
+
+        self.assertIs(BrazilianBank.get('237'), Bradesco)
+
+    def test_get_bank_class(self):
+        self.assertIs(get_bank_class('237', 'BR'), Bradesco)
+        self.assertIsNone(get_bank_class('237', 'XX'))
+        self.assertIsNone(get_bank_class(['237'], 'BR'))
+
+    def test_banks_are_importable_from_core(self):
+        self.assertIs(core.Bradesco, Bradesco)
+        with self.assertRaises(AttributeError):
+            core.NotABank
+
+    def test_get_many(self):
+        self.assertEqual(BrazilianBank.get_many(['237', '999', '237']), [Bradesco, None, Bradesco])
+        self.assertEqual(Bank.get_many(['237'], 'XX'), [None])
+
+
 class BankAccountValidatorBaseTestCase(object):
     def test_valid_accounts(self):
         errors = []
@@ -153,6 +189,19 @@ class PreconditionExceptionsTestCase(unittest.TestCase):
             self.bank(**self.valid_data)
         self.assertEqual(e.exception.message, 'For bank code "237", accounts length must be 7.')
 
+    def test_invalid_characters(self):
+        self.valid_data['account'] = '2000A0'
+
+        with self.assertRaises(InvalidCharacters) as e:
+            self.bank(**self.valid_data)
+        self.assertEqual(e.exception.message, 'For bank code "237", account \'2000A0\' has invalid characters.')
+
+    def test_embedded_digits_and_separators(self):
+        self.bank(branch='1769-8', account='0.200.040-7').execute()  # nothing has raised
+
+    def test_unicode(self):
+        self.bank(branch=u'1769', branch_digit=u'8', account=u'200040', account_digit=u'7').execute()  # nothing has raised
+
     def test_zeroes_at_left_doesnt_count(self):
         self.valid_data['branch'] = '000000001768'
         self.valid_data['account'] = '00000200040'
@@ -198,3 +247,99 @@ class InvalidAccountExceptionsTestCase(unittest.TestCase):
         with self.assertRaises(InvalidBranchAndAccountCombination) as e:
             BrazilianBank.get(data['bank_code'])(**data).execute()
         self.assertEqual(e.exception.message, 'Combination (branch="2006", account="01008407-1") does not match.')
+
+
+class CheckTestCase(unittest.TestCase):
+    def setUp(self):
+        super(CheckTestCase, self).setUp()
+        self.valid_data = {'branch': '1769', 'branch_digit': '8', 'account': '200040', 'account_digit': '7'}
+
+    def test_valid(self):
+        self.assertEqual(BrazilianBank.get('237').check(**self.valid_data), reasons.OK)
+        self.assertEqual(check('237', country='BR', **self.valid_data), reasons.OK)
+
+    def test_reasons(self):
+        cases = [
+            ({'branch': '17695'}, reasons.INVALID_BRANCH_LENGTH),
+            ({'branch_digit': ''}, reasons.MISSING_BRANCH_DIGIT),
+            ({'branch_digit': '12'}, reasons.UNEXPECTED_BRANCH_DIGIT),
+            ({'account': '12000408'}, reasons.INVALID_ACCOUNT_LENGTH),
+            ({'account_digit': ''}, reasons.MISSING_ACCOUNT_DIGIT),
+            ({'account_digit': '12'}, reasons.UNEXPECTED_ACCOUNT_DIGIT),
+            ({'branch_digit': '1'}, reasons.INVALID_BRANCH),
+            ({'account_digit': '1'}, reasons.INVALID_ACCOUNT),
+            ({'branch': '17 69a'}, reasons.INVALID_CHARACTERS),
+        ]
+        for changes, expected in cases:
+            data = dict(self.valid_data, **changes)
+            self.assertEqual(BrazilianBank.get('237').check(**data), expected)
+
+            with self.assertRaises(EXCEPTIONS_BY_REASON[expected]):
+                BrazilianBank.get('237')(**data).execute()
+
+    def test_unknown_bank(self):
+        self.assertEqual(check('999', **self.valid_data), reasons.BANK_NOT_IMPLEMENTED)
+
+
+class BankValidatorTestCase(unittest.TestCase):
+    def test_singleton(self):
+        self.assertIs(Bradesco.validator, BrazilianBank.get('237').validator)
+        self.assertIs(Bradesco.validator.bank_class, Bradesco)
+
+    def test_abstract_bank(self):
+        with self.assertRaises(RuntimeError):
+            BrazilianBank.validator
+
+    def test_parse_and_validate(self):
+        validator = Bradesco.validator
+        record = validator.parse('1769', '8', '0.200.040', '7')
+        self.assertEqual(record, AccountRecord('1769', '8', '0200040', '7'))
+        self.assertEqual(validator.validate(record), reasons.OK)
+        self.assertIsNone(validator.parse('17a9', '8', '200040', '7'))
+
+        record.account_digit = '1'
+        self.assertEqual(validator.validate(record), reasons.INVALID_ACCOUNT)
+        self.assertEqual(validator.validate(AccountRecord('1769', '8', '200040', '7')), reasons.INVALID_ACCOUNT_LENGTH)
+
+    def test_check(self):
+        self.assertEqual(Bradesco.validator.check('1769', '8', '200040', '7'), reasons.OK)
+        self.assertEqual(Bradesco.validator.check('1769', '0', '200040', '7'), reasons.INVALID_BRANCH)
+        self.assertEqual(Bradesco.validator.check('1769', '8', '20004x', '7'), reasons.INVALID_CHARACTERS)
+        self.assertTrue(Bradesco.validator.is_valid('1769', '8', '200040', '7'))
+
+    def test_custom_validation_methods_are_used(self):
+        class StrictBank(BrazilianBank):
+            country = 'ZZ'
+            bank_code = '237'
+            account_length = 7
+
+            def validate(self):
+                return self.account != '0000001'
+
+        self.assertEqual(StrictBank.validator.check('1', '', '1', '0'), reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION)
+        self.assertEqual(StrictBank.validator.check('1', '', '2', '0'), reasons.OK)
+
+    def test_is_valid(self):
+        self.assertTrue(is_valid('237', '1769', '8', '200040', '7'))
+        self.assertFalse(is_valid('237', '1769', '8', '200040', '1'))
+        self.assertFalse(is_valid('999', '1769', '8', '200040', '7'))
+        self.assertFalse(is_valid('237', '1769', '8', '200040', '7', country='XX'))
+
+
+class LazyMessageTestCase(unittest.TestCase):
+    def test_message_is_built_when_read(self):
+        error = InvalidAccount('0200040', '1')
+        self.assertIsNone(error._message)
+        self.assertEqual(str(error), 'Account "0200040-1" is wrong.')
+        self.assertEqual(error._message, 'Account "0200040-1" is wrong.')
+
+    def test_context_is_kept(self):
+        with self.assertRaises(InvalidBranchlength) as e:
+            BrazilianBank.get('237')(branch='17695', branch_digit='8', account='200040', account_digit='7')
+        self.assertEqual(e.exception.bank_code, '237')
+        self.assertEqual(e.exception.reason, reasons.INVALID_BRANCH_LENGTH)
+
+    def test_explicit_message(self):
+        error = BankNotImplemented('999', 'BR')
+        error.message = 'custom'
+        self.assertEqual(error.message, 'custom')
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import validate_chunk, validate_many
+from bank_account_validator.cache import ResultCache
+from bank_account_validator.core import BrazilianBank
+from bank_account_validator.dedup import Deduplicator
+
+from tests.test_threads import _records
+
+
+class CountingValidator(object):
+    # Wraps a bank's validator, counting the accounts that actually get checked.
+    def __init__(self, bank_class):
+        self.validator = bank_class.validator
+        self.checked = []
+
+    def check_digits_many(self, fields):
+        self.checked.extend(fields)
+        return [self.validator.check_digits(*x) for x in fields]
+
+
+class DeduplicatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = _records()
+
+    def test_same_results(self):
+        records = self.records * 3
+        dedup = Deduplicator()
+        self.assertEqual(list(validate_many(records, dedup=dedup, chunk_size=len(records))), list(validate_many(records)))
+        self.assertEqual(dedup.stats(), {
+            'records': len(records),
+            'distinct': len(set(self.records)),
+            'duplicates': len(records) - len(set(self.records)),
+            'ratio': 1 - len(set(self.records)) / float(len(records)),
+            'active': True,
+        })
+
+    def test_results_in_input_order(self):
+        records = [
+            ('237', '1769', '8', '200040', '7'),
+            ('237', '1769', '0', '200040', '7'),
+            ('999', '1769', '8', '200040', '7'),
+            ('237', '1769', '8', '200040', '7'),
+            ('237', '1769', '0', '200040', '7'),
+        ]
+        self.assertEqual(validate_chunk(records, dedup=Deduplicator()), [
+            reasons.OK, reasons.INVALID_BRANCH, reasons.BANK_NOT_IMPLEMENTED, reasons.OK, reasons.INVALID_BRANCH,
+        ])
+
+    def test_checks_each_distinct_account_once(self):
+        bank_class = BrazilianBank.get('237')
+        counting = CountingValidator(bank_class)
+        rows = list(enumerate([
+            ('237', '1769', '8', '200040', '7'),
+            ('237', '1769', '8', '0200040', '7'),  # same account once normalized
+            ('237', '1769', '8', '200040', '7'),
+            ('237', '1769', '0', '200040', '7'),
+            ('237', '1769', '8', '2000400000', '7'),  # rejected before any check
+        ]))
+        dedup = Deduplicator()
+        results = list(dedup.check_rows(bank_class.validator, rows, counting.check_digits_many))
+
+        self.assertEqual(results, [
+            (0, reasons.OK), (1, reasons.OK), (2, reasons.OK), (3, reasons.INVALID_BRANCH),
+            (4, reasons.INVALID_ACCOUNT_LENGTH),
+        ])
+        self.assertEqual(sorted(counting.checked), [('1769', '0', '0200040', '7'), ('1769', '8', '0200040', '7')])
+        self.assertEqual((dedup.records, dedup.distinct), (5, 3))
+        self.assertAlmostEqual(dedup.ratio(), 0.4)
+
+    def test_unhashable_values(self):
+        records = [('237', '1769', '8', ['200040'], '7')] * 2 + [('237', '1769', '8', '200040', '7')]
+        dedup = Deduplicator()
+        self.assertEqual(validate_chunk(records, dedup=dedup), validate_chunk(records))
+        self.assertEqual(dedup.distinct, 3)
+
+    def test_list_records(self):
+        records = [['237', '1769', '8', '200040', '7'], ['237', '1769', '0', '200040', '7']] * 2
+        dedup = Deduplicator()
+        self.assertEqual(validate_chunk(records, dedup=dedup), validate_chunk(records))
+        self.assertEqual(dedup.distinct, 2)
+
+    def test_equal_values_of_other_types(self):
+        records = [('237', '1769', '8', 200040, 7), ('237', '1769', '8', 200040, 7.0), ('237', '1769', '8', 200040, True),
+                   (b'237', b'1769', b'8', b'200040', b'7'), ('237', '1769', '8', '200040', '7')]
+        self.assertEqual(validate_chunk(records, dedup=Deduplicator()), validate_chunk(records))
+
+    def test_turns_off_without_duplicates(self):
+        records = list(set(self.records))
+        dedup = Deduplicator(sample_size=100)
+        self.assertEqual(list(validate_many(records, dedup=dedup, chunk_size=50)), list(validate_many(records)))
+        self.assertFalse(dedup.active)
+        self.assertEqual(dedup.records, 100)
+
+    def test_stays_on_with_duplicates(self):
+        dedup = Deduplicator(sample_size=100)
+        list(validate_many(self.records * 2, dedup=dedup, chunk_size=len(self.records) * 2))
+        self.assertTrue(dedup.active)
+
+    def test_empty_input(self):
+        dedup = Deduplicator()
+        self.assertEqual(list(validate_many([], dedup=dedup)), [])
+        self.assertEqual(dedup.ratio(), 0.0)
+
+    def test_with_cache(self):
+        records = self.records * 2
+        cache = ResultCache()
+        dedup = Deduplicator()
+        self.assertEqual(list(validate_many(records, cache=cache, dedup=dedup, chunk_size=len(records))),
+                         list(validate_many(records)))
+        self.assertLess(cache.hits + cache.misses, len(self.records))
+
+    def test_threads(self):
+        records = self.records * 4
+        dedup = Deduplicator()
+        self.assertEqual(list(validate_many(records, executor='threads', workers=4, chunk_size=len(self.records),
+                                            dedup=dedup)),
+                         list(validate_many(records)))
+        self.assertEqual(dedup.records, len(records))
+
+    def test_processes_cannot_share_a_deduplicator(self):
+        with self.assertRaises(ValueError):
+            validate_many([], executor='processes', dedup=Deduplicator())
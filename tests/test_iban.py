@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import validate_many
+from bank_account_validator.core import Bank
+from bank_account_validator.countries.iban import (
+    LENGTHS, IBANBank, check_iban, check_ibans, compute_check_digits, is_valid_iban, remainder
+)
+from bank_account_validator.exceptions import BankNotImplemented, InvalidAccount, InvalidAccountlength
+from bank_account_validator.vectorized import check_columns
+
+# Examples published by each country's banking association or in the IBAN registry.
+VALID = [
+    'DE89370400440532013000', 'GB82WEST12345698765432', 'FR1420041010050500013M02606', 'NL91ABNA0417164300',
+    'BE68539007547034', 'ES9121000418450200051332', 'IT60X0542811101000000123456', 'CH9300762011623852957',
+    'AT611904300234573201', 'BR1800360305000010009795493C1', 'BI4210000100010000332045181', 'DJ2100010000000154000100186',
+    'FK88SC123456789012', 'HN88CABF00000000000250005469', 'LY83002048000020100120361', 'MN121234123456789123',
+    'NI45BAPR00000013000003558124', 'OM810180000001299123456', 'RU0204452560040702810412345678901', 'SD2129010501234001',
+    'SO211000001001000100141', 'YE15CBYE0001018861234567891234',
+]
+
+
+def _naive_remainder(iban):
+    return int(''.join(str(int(character, 36)) for character in iban[4:] + iban[:4])) % 97
+
+
+class IBANTestCase(unittest.TestCase):
+    def test_valid(self):
+        for iban in VALID:
+            self.assertEqual(check_iban(iban), reasons.OK, iban)
+        self.assertTrue(is_valid_iban('de89 3704 0044 0532 0130 00'))
+        self.assertTrue(is_valid_iban(b'DE89370400440532013000'))
+
+    def test_invalid(self):
+        self.assertEqual(check_iban('DE88370400440532013000'), reasons.INVALID_ACCOUNT)
+        self.assertEqual(check_iban('DE89370400440532013001'), reasons.INVALID_ACCOUNT)
+        self.assertEqual(check_iban('DEXX370400440532013000'), reasons.INVALID_ACCOUNT)
+        self.assertEqual(check_iban('DE8937040044053201300'), reasons.INVALID_ACCOUNT_LENGTH)
+        self.assertEqual(check_iban('XX89370400440532013000'), reasons.BANK_NOT_IMPLEMENTED)
+        self.assertEqual(check_iban(''), reasons.BANK_NOT_IMPLEMENTED)
+        self.assertEqual(check_iban('DE89-3704-0044'), reasons.INVALID_CHARACTERS)
+        self.assertEqual(check_iban(None), reasons.INVALID_CHARACTERS)
+
+    def test_remainder_matches_big_integers(self):
+        generator = random.Random(0)
+        for _ in range(500):
+            iban = ''.join(generator.choice('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(generator.randint(5, 34)))
+            self.assertEqual(remainder(iban), _naive_remainder(iban), iban)
+
+    def test_compute_check_digits(self):
+        self.assertEqual(compute_check_digits('DE', '370400440532013000'), '89')
+        self.assertEqual(compute_check_digits('GB', 'WEST12345698765432'), '82')
+
+    def test_every_country_is_a_bank(self):
+        for country_code, length in LENGTHS.items():
+            bank_class = Bank.get(country_code, 'IBAN')
+            self.assertTrue(issubclass(bank_class, IBANBank))
+            self.assertEqual(bank_class.account_length, length)
+        with self.assertRaises(BankNotImplemented):
+            Bank.get('XX', 'IBAN')
+
+
+class IBANBankTestCase(unittest.TestCase):
+    def setUp(self):
+        self.bank_class = Bank.get('DE', 'IBAN')
+
+    def test_check(self):
+        self.assertEqual(self.bank_class.check(branch='', account='DE89 3704 0044 0532 0130 00'), reasons.OK)
+        self.assertEqual(self.bank_class.check(branch='', account='GB82WEST12345698765432'), reasons.INVALID_ACCOUNT)
+        self.assertEqual(Bank.get('NL', 'IBAN').check(branch='', account='DE89370400440532013000'),
+                         reasons.INVALID_ACCOUNT_LENGTH)
+        self.assertEqual(self.bank_class.check(branch='1', account='DE89370400440532013000'), reasons.INVALID_BRANCH_LENGTH)
+
+    def test_exceptions(self):
+        self.bank_class(branch='', account='DE89370400440532013000').execute()
+        with self.assertRaises(InvalidAccount):
+            self.bank_class(branch='', account='DE88370400440532013000').execute()
+        with self.assertRaises(InvalidAccountlength):
+            self.bank_class(branch='', account='DE893704004405320130')
+
+    def test_validate_many(self):
+        records = [('DE', '', '', 'DE89370400440532013000', ''), ('GB', '', '', 'GB82WEST12345698765432', ''),
+                   ('GB', '', '', 'GB83WEST12345698765432', ''), ('XX', '', '', 'XX83WEST12345698765432', '')]
+        self.assertEqual(list(validate_many(records, country='IBAN')),
+                         [reasons.OK, reasons.OK, reasons.INVALID_ACCOUNT, reasons.BANK_NOT_IMPLEMENTED])
+
+
+class CheckIBANsTestCase(unittest.TestCase):
+    def test_same_results_as_check_iban(self):
+        generator = random.Random(1)
+        ibans = list(VALID) + ['de89 3704 0044 0532 0130 00', 'DE8937040044053201300', 'XX89370400440532013000', '',
+                               'DE89-3704', None, b'NL91ABNA0417164300', 'DEXX370400440532013000']
+        for country_code in ('DE', 'FR', 'GB', 'MT'):
+            for _ in range(50):
+                bban = ''.join(generator.choice('0123456789AB') for _ in range(LENGTHS[country_code] - 4))
+                digits = compute_check_digits(country_code, bban)
+                ibans.append(country_code + digits + bban)
+                ibans.append(country_code + '{:02d}'.format((int(digits) + 1) % 100) + bban)
+
+        self.assertEqual(check_ibans(ibans), [check_iban(iban) for iban in ibans])
+        self.assertEqual(check_ibans([]), [])
+
+    def test_check_columns(self):
+        ibans = ['DE89370400440532013000', 'DE88370400440532013000', 'DE8937040044053201300']
+        empty = [''] * len(ibans)
+        self.assertEqual(list(check_columns(Bank.get('DE', 'IBAN'), empty, empty, ibans, empty)),
+                         [reasons.OK, reasons.INVALID_ACCOUNT, reasons.INVALID_ACCOUNT_LENGTH])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+import unittest
+
+# Seconds `import bank_account_validator.core` may take in a fresh interpreter (best of a few runs). Generous on
+# purpose, so slow machines pass; importing banks, kernels or heavy modules eagerly would still break it.
+IMPORT_TIME_BUDGET = 0.1
+
+SCRIPT = '''
+import sys, time
+before = set(sys.modules)
+started = time.time()
+import bank_account_validator.core
+elapsed = time.time() - started
+imported = set(sys.modules) - before
+print(elapsed)
+print(' '.join(sorted(name for name in imported if name.startswith('bank_account_validator'))))
+print(' '.join(name for name in ('re', 'numpy', 'threading') if name in imported))
+'''
+
+
+def _import_core():
+    output = subprocess.check_output([sys.executable, '-c', SCRIPT]).decode('utf-8').split('\n')
+    return float(output[0]), output[1].split(), output[2].split()
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    def test_budget(self):
+        elapsed = min(_import_core()[0] for _ in range(3))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'no module __getattr__ (PEP 562): core loads the banks eagerly')
+    def test_banks_load_lazily(self):
+        _, modules, heavy = _import_core()
+        self.assertNotIn('bank_account_validator.countries.br', modules)
+        self.assertNotIn('bank_account_validator.kernels', modules)
+        self.assertEqual(heavy, [])
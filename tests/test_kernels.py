@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bank_account_validator.core import Bank, BrazilianBank
+from bank_account_validator.kernels import ChecksumKernel, DigitTable
+from bank_account_validator.utils import calculate_verifier_digit
+
+from tests.data import BANCO_DO_BRASIL, BANRISUL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+
+class ChecksumKernelTestCase(unittest.TestCase):
+    def test_matches_calculate_verifier_digit(self):
+        values = ['{:09d}'.format(i * 7919) for i in range(500)]
+        for method in ('mod10', 'mod11'):
+            for sum_digits in (False, True):
+                kernel = ChecksumKernel('212121212', method=method, sum_digits=sum_digits)
+                for value in values:
+                    self.assertEqual(kernel.result(kernel.total(value)),
+                                     calculate_verifier_digit(value, '212121212', method, sum_digits))
+
+    def test_remainder11(self):
+        kernel = ChecksumKernel('8923456789', method='remainder11')
+        self.assertEqual([kernel.result(kernel.total(x)) for x in ('0000000000', '0000000001', '0000000002')], [0, 9, 7])
+
+    def test_remap(self):
+        kernel = ChecksumKernel('98765432', remap={10: 'X', 11: '0'})
+        self.assertEqual(kernel.digit('00008428'), 'X')
+        self.assertTrue(kernel.matches('00008428', 'x'))
+        self.assertEqual(kernel.digit('00000000'), '0')
+
+    def test_unmapped_results_never_match(self):
+        kernel = ChecksumKernel('1')
+        self.assertIsNone(kernel.digit('1'))  # 10
+        self.assertIsNone(kernel.digit('0'))  # 11
+        self.assertFalse(kernel.matches('0', '1'))
+
+    def test_invalid_method(self):
+        with self.assertRaises(RuntimeError):
+            ChecksumKernel('1234', method='mod7')
+
+    def test_invalid_digit(self):
+        with self.assertRaises(ValueError):
+            ChecksumKernel('1234').total('12a4')
+
+
+class BankKernelsTestCase(unittest.TestCase):
+    def test_every_bank_has_a_check(self):
+        for bank_code in ('001', '033', '041', '104', '237', '341', '399', '745'):
+            bank_class = BrazilianBank.get(bank_code)
+            kernels = [bank_class.branch_kernel, bank_class.account_kernel, bank_class.combination_kernel]
+            self.assertTrue(any(isinstance(kernel, ChecksumKernel) for kernel in kernels))
+
+    def test_abstract_bank_has_no_kernels(self):
+        self.assertIsNone(Bank.account_kernel)
+
+
+class DigitTableTestCase(unittest.TestCase):
+    def test_lazy_build(self):
+        table = DigitTable(ChecksumKernel('5432', remap={10: 'X', 11: '0'}).digit)
+        self.assertIsNone(table._table)
+        self.assertEqual(table.lookup('1769'), '8')
+        self.assertEqual(len(table._table), 10000)
+
+    def test_matches_kernel(self):
+        kernel = ChecksumKernel('5432', remap={10: 'X', 11: '0'})
+        table = DigitTable(kernel.digit)
+        for branch in ('{:04d}'.format(i) for i in range(0, 10000, 7)):
+            self.assertEqual(table.lookup(branch), kernel.digit(branch))
+
+    def test_missing_digits(self):
+        table = DigitTable(lambda value: None if value == '0001' else '12', width=2)
+        self.assertIsNone(table.lookup('0001'))
+        self.assertEqual(table.lookup('0002'), '12')
+        self.assertFalse(table.matches('0001', '\x00\x00'))
+
+    def test_invalid_values(self):
+        table = DigitTable(lambda value: '1')
+        for value in ('123', '12345', '-123', '+123', '12a4'):
+            with self.assertRaises(ValueError):
+                table.lookup(value)
+
+
+class ComputeBranchDigitTestCase(unittest.TestCase):
+    def test_banrisul(self):
+        for branch, expected in BANRISUL['correct_data']:
+            self.assertEqual(BrazilianBank.get('041').compute_branch_digit(branch), expected)
+
+    def test_banco_do_brasil_and_bradesco(self):
+        for bank in (BANCO_DO_BRASIL, BRADESCO):
+            for data in bank['valid_combinations']:
+                digit = BrazilianBank.get(data['bank_code']).compute_branch_digit(data['branch'])
+                self.assertEqual(digit, data['branch_digit'].upper())
+
+    def test_leading_zeroes(self):
+        self.assertEqual(BrazilianBank.get('237').compute_branch_digit('01769'), '8')
+
+    def test_no_branch_digit(self):
+        self.assertIsNone(BrazilianBank.get('341').compute_branch_digit('1769'))
+
+
+class ComputeAccountDigitTestCase(unittest.TestCase):
+    def test_valid_combinations(self):
+        for bank in (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER):
+            for data in bank['valid_combinations']:
+                digit = BrazilianBank.get(data['bank_code']).compute_account_digit(data['branch'], data['account'])
+                self.assertEqual(digit, data['account_digit'].upper(), data)
+
+    def test_invalid_values(self):
+        bank_class = BrazilianBank.get('237')
+        for branch, account in (('1769', '20004x'), ('17690', '200040'), ('1769', '12000408')):
+            with self.assertRaises(ValueError):
+                bank_class.compute_account_digit(branch, account)
+
+    def test_columns(self):
+        bank_class = BrazilianBank.get('237')
+        self.assertEqual(bank_class.compute_branch_digits(['1769', '17a9', '01769']), ['8', None, '8'])
+        self.assertEqual(bank_class.compute_account_digits(['1769', '1769', '1769'], ['200040', '2000400x', '0200040']),
+                         ['7', None, '7'])
+
+    def test_custom_validation_methods(self):
+        class OddBank(BrazilianBank):
+            country = 'ZZ'
+            bank_code = '341'
+            branch_digit_length = 1
+            account_length = 5
+
+            def validate_branch_digit(self):
+                return self.branch_digit == 'X'
+
+            def validate(self):
+                return int(self.account_digit) == int(self.account) % 7
+
+        self.assertEqual(OddBank.compute_branch_digit('1'), 'X')
+        self.assertEqual(OddBank.compute_account_digit('1', '12'), '5')
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from bank_account_validator.__main__ import main
+from bank_account_validator.cache import PersistentCache
+
+
+class MainTestCase(unittest.TestCase):
+    def setUp(self):
+        super(MainTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.accepted = self.path('accepted.csv')
+        self.rejected = self.path('rejected.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(MainTestCase, self).tearDown()
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def read_csv(self, path):
+        with io.open(path, encoding='utf-8', newline='') as f:
+            return list(csv.DictReader(f))
+
+    def write(self, name, content, compress=False):
+        path = self.path(name)
+        with (gzip.open(path, 'wb') if compress else io.open(path, 'wb')) as f:
+            f.write(content.encode('utf-8'))
+        return path
+
+    def run_main(self, *args):
+        return main(list(args) + ['--accepted', self.accepted, '--rejected', self.rejected, '--quiet'])
+
+    def test_csv(self):
+        path = self.write('input.csv', (
+            'id,bank_code,branch,branch_digit,account,account_digit\n'
+            '1,237,1769,8,200040,7\n'
+            '2,237,1769,0,200040,7\n'
+            '3,999,1769,8,200040,7\n'
+            '4,033,2006,,01008407,4\n'
+        ))
+        self.assertEqual(self.run_main(path), 0)
+
+        self.assertEqual([row['id'] for row in self.read_csv(self.accepted)], ['1', '4'])
+        rejected = self.read_csv(self.rejected)
+        self.assertEqual([(row['id'], row['reason'], row['reason_code']) for row in rejected],
+                         [('2', 'InvalidBranch', '8'), ('3', 'BankNotImplemented', '1')])
+
+    def test_gzipped_csv_with_column_mapping(self):
+        path = self.write('input.csv.gz', (
+            'banco,agencia,dv_agencia,conta,dv_conta\n'
+            '237,1769,8,200040,7\n'
+            '237,1769,8,200040,1\n'
+        ), compress=True)
+        columns = 'bank_code=banco,branch=agencia,branch_digit=dv_agencia,account=conta,account_digit=dv_conta'
+        self.run_main(path, '--columns', columns)
+
+        self.assertEqual(len(self.read_csv(self.accepted)), 1)
+        self.assertEqual([row['reason'] for row in self.read_csv(self.rejected)], ['InvalidAccount'])
+
+    def test_json_lines(self):
+        path = self.write('input.jsonl', (
+            '{"bank_code": "237", "branch": "1769", "branch_digit": "8", "account": 200040, "account_digit": "7"}\n'
+            '\n'
+            '{"bank_code": "237", "branch": "1769", "account": "200040", "account_digit": "7"}\n'
+        ))
+        self.accepted, self.rejected = self.path('accepted.jsonl.gz'), self.path('rejected.jsonl')
+        self.run_main(path, '--chunk-size', '1')
+
+        with gzip.open(self.accepted, 'rt') as f:
+            self.assertEqual([json.loads(line)['account'] for line in f], [200040])
+        with io.open(self.rejected, encoding='utf-8') as f:
+            self.assertEqual([json.loads(line)['reason'] for line in f], ['MissingBranchDigit'])
+
+    def test_missing_columns(self):
+        path = self.write('input.csv', 'bank_code,branch\n237,1769\n')
+        with self.assertRaises(SystemExit):
+            self.run_main(path)
+
+    def test_cache_size(self):
+        path = self.write('input.csv', 'bank_code,branch,branch_digit,account,account_digit\n' + (
+            '237,1769,8,200040,7\n'
+            '237,1769,0,200040,7\n'
+        ) * 3)
+        self.run_main(path, '--cache-size', '10')
+
+        self.assertEqual(len(self.read_csv(self.accepted)), 3)
+        self.assertEqual([row['reason'] for row in self.read_csv(self.rejected)], ['InvalidBranch'] * 3)
+
+    def test_cache_file(self):
+        path = self.write('input.csv', 'bank_code,branch,branch_digit,account,account_digit\n' + (
+            '237,1769,8,200040,7\n'
+            '237,1769,0,200040,7\n'
+        ) * 3)
+        cache_path = self.path('cache.sqlite3')
+        for _ in range(2):
+            self.run_main(path, '--cache-file', cache_path)
+            self.assertEqual(len(self.read_csv(self.accepted)), 3)
+            self.assertEqual([row['reason'] for row in self.read_csv(self.rejected)], ['InvalidBranch'] * 3)
+
+        with PersistentCache(cache_path) as cache:
+            self.assertEqual(len(cache), 2)
+
+    def test_cache_size_and_file(self):
+        path = self.write('input.csv', 'bank_code,branch\n')
+        with self.assertRaises(SystemExit):
+            self.run_main(path, '--cache-size', '10', '--cache-file', self.path('cache.sqlite3'))
+
+    def test_dedup(self):
+        path = self.write('input.csv', 'bank_code,branch,branch_digit,account,account_digit\n' + (
+            '237,1769,8,200040,7\n'
+            '237,1769,8,0200040,7\n'
+            '237,1769,0,200040,7\n'
+        ) * 3)
+        self.run_main(path, '--dedup')
+
+        self.assertEqual(len(self.read_csv(self.accepted)), 6)
+        self.assertEqual([row['reason'] for row in self.read_csv(self.rejected)], ['InvalidBranch'] * 3)
+
+    def test_suggest(self):
+        path = self.write('input.csv', (
+            'bank_code,branch,branch_digit,account,account_digit\n'
+            '237,1769,8,200040,7\n'
+            '237,1769,8,200041,7\n'
+            '999,1769,8,200040,7\n'
+        ))
+        self.run_main(path, '--suggest')
+
+        suggestions = [row['suggestions'].split() for row in self.read_csv(self.rejected)]
+        self.assertIn('1769-8/0200040-7', suggestions[0])
+        self.assertEqual(suggestions[1], [])
+
+        # Rejected files can be fed back in: reason columns are overwritten, not duplicated.
+        rejected = self.path('again.csv')
+        main([self.rejected, '--accepted', self.accepted, '--rejected', rejected, '--suggest', '--quiet'])
+        self.assertEqual(self.read_csv(rejected), self.read_csv(self.rejected))
+
+    def test_report(self):
+        path = self.write('input.csv', 'bank_code,branch,branch_digit,account,account_digit\n' + (
+            '237,1769,8,200040,7\n'
+            '237,1769,0,200040,7\n'
+            '999,1769,8,200040,7\n'
+        ) * 2)
+        report_path = self.path('report.json')
+        self.run_main(path, '--report', report_path)
+
+        with io.open(report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report['total'], 6)
+        self.assertEqual(report['reasons'], {'OK': 2, 'InvalidBranch': 2, 'BankNotImplemented': 2})
+        self.assertEqual(report['top_branches'], [{'bank_code': '237', 'branch': '1769', 'failures': 2}])
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+from bank_account_validator import metrics
+from bank_account_validator.batch import validate_many
+from bank_account_validator.cache import PersistentCache, ResultCache
+from bank_account_validator.core import Bank, BankValidator, BrazilianBank, is_valid
+from bank_account_validator.dedup import Deduplicator
+from bank_account_validator.exceptions import InvalidAccount, MissingBranchDigit
+
+
+class MetricsTestCase(unittest.TestCase):
+    def setUp(self):
+        super(MetricsTestCase, self).setUp()
+        self.originals = (BankValidator.__dict__['check'], Bank.__dict__['execute'], Bank.__dict__['__init__'])
+        self.metrics = metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        super(MetricsTestCase, self).tearDown()
+
+    def test_counts(self):
+        is_valid('237', '1769', '8', '200040', '7')
+        is_valid('237', '1769', '8', '200040', '1')
+        list(validate_many([('001', '0395', '6', '45939', '9')] * 3, cache=ResultCache()))
+
+        bank_class = BrazilianBank.get('237')
+        with self.assertRaises(InvalidAccount):
+            bank_class(branch='1769', branch_digit='8', account='200040', account_digit='1').execute()
+        with self.assertRaises(MissingBranchDigit):
+            bank_class(branch='1769', branch_digit='', account='200040', account_digit='7')
+        bank_class(branch='1769', branch_digit='8', account='200040', account_digit='7').execute()
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['validations'], {'BR': {
+            '237': {'OK': 2, 'InvalidAccount': 2, 'MissingBranchDigit': 1},
+            '001': {'OK': 3},
+        }})
+        latency = snapshot['latency']['BR']['237']
+        self.assertEqual(latency['count'], 5)
+        self.assertEqual(latency['buckets']['+Inf'], 5)
+        self.assertGreater(latency['sum'], 0)
+
+    def test_persistent_cache(self):
+        records = [('237', '1769', '8', '200040', '7'), ('237', '1769', '8', '200040', '1'), ('237', '1769', '', '200040', '7')]
+        directory = tempfile.mkdtemp()
+        try:
+            for _ in range(2):
+                with PersistentCache(os.path.join(directory, 'cache.sqlite3')) as cache:
+                    list(validate_many(records, cache=cache))
+        finally:
+            shutil.rmtree(directory)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['validations'], {'BR': {'237': {'OK': 2, 'InvalidAccount': 2, 'MissingBranchDigit': 2}}})
+        self.assertEqual(snapshot['latency']['BR']['237']['count'], 6)
+
+    def test_dedup(self):
+        records = [('237', '1769', '8', '200040', '7'), ('237', '1769', '8', '0200040', '7'), ('237', '1769', '', '200040', '7')]
+        list(validate_many(records * 2, dedup=Deduplicator()))
+        list(validate_many(records, dedup=Deduplicator(), cache=ResultCache()))
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['validations'], {'BR': {'237': {'OK': 6, 'MissingBranchDigit': 3}}})
+        self.assertEqual(snapshot['latency']['BR']['237']['count'], 9)
+
+    def test_prometheus(self):
+        is_valid('237', '1769', '8', '200040', '7')
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE bank_account_validator_validations_total counter\n', text)
+        self.assertIn('bank_account_validator_validations_total{country="BR",bank_code="237",outcome="OK"} 1\n', text)
+        self.assertIn('bank_account_validator_validation_seconds_bucket{country="BR",bank_code="237",le="+Inf"} 1\n', text)
+        self.assertIn('bank_account_validator_validation_seconds_count{country="BR",bank_code="237"} 1\n', text)
+
+    def test_disable_restores_originals(self):
+        self.assertIsNot(BankValidator.__dict__['check'], self.originals[0])
+        metrics.enable()  # enabling twice doesn't wrap twice
+        metrics.disable()
+
+        self.assertEqual((BankValidator.__dict__['check'], Bank.__dict__['execute'], Bank.__dict__['__init__']), self.originals)
+        self.assertIsNone(metrics.active())
+        self.assertEqual(metrics.snapshot(), {'validations': {}, 'latency': {}})
+
+    def test_reset(self):
+        is_valid('237', '1769', '8', '200040', '7')
+        self.metrics.reset()
+        self.assertEqual(metrics.snapshot(), {'validations': {}, 'latency': {}})
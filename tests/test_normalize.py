@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bank_account_validator.normalize import normalize_field, normalize_fields
+from bank_account_validator.utils import smarter_zfill
+
+LENGTHS = (4, 1, 7, 1)
+
+
+class NormalizeFieldsTestCase(unittest.TestCase):
+    def assertNormalized(self, fields, expected):
+        self.assertEqual(normalize_fields(*(tuple(fields) + LENGTHS)), expected)
+
+    def test_plain(self):
+        self.assertNormalized(('1769', '8', '200040', '7'), ('1769', '8', '0200040', '7'))
+
+    def test_same_as_smarter_zfill(self):
+        values = ['', '0', '00', '1', '01', '0001', '1769', '000000001768', '00200040', '12000408']
+        for value in values:
+            expected = tuple(smarter_zfill(value, length) for length in LENGTHS)
+            self.assertEqual(normalize_fields(value, value, value, value, *LENGTHS), expected)
+
+    def test_no_expected_length(self):
+        self.assertEqual(normalize_fields('0001', '0', '00', '', 0, 0, 0, 0), ('1', '', '', ''))
+
+    def test_embedded_digits(self):
+        self.assertNormalized(('1769-8', '', '0200040-7', ''), ('1769', '8', '0200040', '7'))
+        self.assertNormalized(('1769-8', '8', '0200040-7', '7'), ('1769', '8', '0200040', '7'))
+
+    def test_conflicting_embedded_digits(self):
+        self.assertNormalized(('1769-8', '9', '200040', '7'), None)
+
+    def test_separators(self):
+        self.assertNormalized((' 1.769 ', '8', '200.040', '\t7'), ('1769', '8', '0200040', '7'))
+
+    def test_ints_and_bytes(self):
+        self.assertNormalized((1769, 8, b'200040', b'7'), ('1769', '8', '0200040', '7'))
+        self.assertNormalized((1769, None, 200040, 0), ('1769', '', '0200040', '0'))
+
+    def test_unicode(self):
+        self.assertNormalized((u'1769', u'8', u'200040', u'7'), ('1769', '8', '0200040', '7'))
+        self.assertNormalized((u'1.769-8', u'', u'200040', b'7'), ('1769', '8', '0200040', '7'))
+
+    def test_letters_in_verifier_digits(self):
+        self.assertNormalized(('1769', 'x', '200040', 'X'), ('1769', 'x', '0200040', 'X'))
+
+    def test_invalid_characters(self):
+        for fields in (('17a9', '8', '200040', '7'), ('1769', '8', '2000/0', '7'), ('1769', '?', '200040', '7'),
+                       ('1769', '8', '200040', '7!'), ('١٧٦٩', '8', '200040', '7'), ('1769', '8', b'\xff', '7'),
+                       (1.5, '8', '200040', '7'), (-1769, '8', '200040', '7'), (True, '8', '200040', '7'),
+                       ('17-69-8', '', '200040', '7')):
+            self.assertNormalized(fields, None)
+
+
+class NormalizeFieldTestCase(unittest.TestCase):
+    def test_common(self):
+        self.assertEqual(normalize_field('0000000000001', 4), '0001')
+        self.assertEqual(normalize_field(None, 4), '')
+        self.assertEqual(normalize_field('x', 1, verifier_digit=True), 'x')
+
+    def test_invalid(self):
+        self.assertIsNone(normalize_field('x', 1))
+        self.assertIsNone(normalize_field('1-2', 4))
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bank_account_validator.batch import validate_many
+from bank_account_validator.parallel import validate_parallel
+
+from tests.data import BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+
+class ValidateParallelTestCase(unittest.TestCase):
+    def test_same_results_as_validate_many(self):
+        records = [
+            data
+            for bank in (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER)
+            for data in bank['valid_combinations'] + bank['invalid_combinations']
+        ]
+        records += [('999', '1769', '8', '200040', '7'), ('237', '17695', '8', '200040', '7')]
+        records *= 3
+
+        expected = list(validate_many(records))
+        self.assertEqual(list(validate_parallel(records, workers=2, chunk_size=7, max_pending=3)), expected)
+
+    def test_empty_input(self):
+        self.assertEqual(list(validate_parallel([], workers=1)), [])
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.core import Bank, BrazilianBank
+from bank_account_validator.exceptions import InvalidAccountlength, InvalidBranchlength
+from bank_account_validator.normalize import TEXT, is_ascii
+from bank_account_validator.prefilter import MAX_FIELD_LENGTH, Prefilter
+
+PIECES = ['', '0', '00', '1', '7', '12', '1769', '01769', '200040', '0200040', '12345678901', 'x', 'X', '-', '-8', ' ',
+          '.', '\t', u'١', u'\xb2', u'é']
+
+
+def _reference(validator, row):
+    # What check() returned before the prefilter: normalization, then the length checks.
+    fields = validator.normalize(*row)
+    if fields is None:
+        return reasons.INVALID_CHARACTERS
+    return validator.check_lengths(*fields) or fields
+
+
+def _value(generator):
+    value = ''.join(generator.choice(PIECES) for _ in range(generator.randint(0, 3)))
+    kind = generator.random()
+    if kind < 0.15:
+        return value.encode('utf-8')
+    if kind < 0.2 and value.isdigit() and is_ascii(value):
+        return int(value)
+    return value
+
+
+class PrefilterTestCase(unittest.TestCase):
+    def test_agrees_with_normalization(self):
+        generator = random.Random(0)
+        for bank_code in ('001', '033', '041', '104', '237', '341', '399', '745'):
+            validator = BrazilianBank.get(bank_code).validator
+            for _ in range(3000):
+                row = tuple(_value(generator) for _ in range(4))
+                if generator.random() < 0.5:
+                    row = tuple(x.encode('ascii', 'replace') if isinstance(x, TEXT) else x for x in row)
+                self.assertEqual(validator.screen(*row), _reference(validator, row), (bank_code, row))
+
+    def test_common_rejects(self):
+        prefilter = Prefilter((4, 1, 7, 1)).check
+        self.assertEqual(prefilter('17695', '8', '200040', '7'), reasons.INVALID_BRANCH_LENGTH)
+        self.assertEqual(prefilter('1769', '', '200040', '7'), reasons.MISSING_BRANCH_DIGIT)
+        self.assertEqual(prefilter('1769', '8', '2000400000', '7'), reasons.INVALID_ACCOUNT_LENGTH)
+        self.assertEqual(prefilter('1769', '8', '200040', ''), reasons.MISSING_ACCOUNT_DIGIT)
+        self.assertEqual(prefilter('1769', '8', '20004A', '7'), reasons.INVALID_CHARACTERS)
+        self.assertEqual(prefilter(b'1769', b'8', b'20004\xc3', b'7'), reasons.INVALID_CHARACTERS)
+        self.assertEqual(prefilter(b'1769', b'8', b'200040', b'7'), ('1769', '8', '0200040', '7'))
+        self.assertEqual(prefilter(u'1769', u'8', u'200040', u'7'), ('1769', '8', '0200040', '7'))
+        self.assertIsNone(prefilter('1769-8', '', '200040-7', ''))
+        self.assertIsNone(prefilter(1769, '8', '200040', '7'))
+
+    def test_size_cap(self):
+        huge = '0' * (MAX_FIELD_LENGTH + 1)
+        validator = BrazilianBank.get('237').validator
+        self.assertEqual(validator.check(huge + '1769', '8', '200040', '7'), reasons.INVALID_BRANCH_LENGTH)
+        self.assertEqual(validator.check('1769', huge, '200040', '7'), reasons.UNEXPECTED_BRANCH_DIGIT)
+        self.assertEqual(validator.check('1769', '8', huge + '200040', '7'), reasons.INVALID_ACCOUNT_LENGTH)
+        self.assertEqual(validator.check('1769', '8', '200040', huge.encode('ascii')), reasons.UNEXPECTED_ACCOUNT_DIGIT)
+        self.assertEqual(validator.check('1769', '8', 10 ** (MAX_FIELD_LENGTH * 100), '7'), reasons.INVALID_ACCOUNT_LENGTH)
+        self.assertEqual(validator.check('1769', '8', '0' * (MAX_FIELD_LENGTH - 6) + '200040', '7'), reasons.OK)
+
+        with self.assertRaises(InvalidBranchlength):
+            Bank.get('237', 'BR')(branch=huge, branch_digit='8', account='200040', account_digit='7')
+        with self.assertRaises(InvalidAccountlength):
+            Bank.get('DE', 'IBAN')(branch='', account='DE89' + '0' * MAX_FIELD_LENGTH)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import json
+import random
+import unittest
+from collections import Counter
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import validate_many
+from bank_account_validator.report import ValidationReport
+
+from tests.data import BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+RECORDS = [
+    data
+    for bank in (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER)
+    for data in bank['valid_combinations'] + bank['invalid_combinations']
+] + [('999', '1769', '8', '200040', '7'), ('237', '17695', '8', '200040', '7'), ('237', '1769', '', '200040', '7')]
+
+
+def _failures(stream):
+    # (bank_code, branch) -> exact failures, for a stream of (bank_code, branch, reason).
+    return Counter(
+        (bank_code, branch) for bank_code, branch, reason in stream if reason not in (reasons.OK, reasons.BANK_NOT_IMPLEMENTED)
+    )
+
+
+def _stream(size, branches, seed):
+    generator = random.Random(seed)
+    return [
+        (generator.choice(['237', '341']), '{:04d}'.format(int(generator.paretovariate(1.2)) % branches),
+         generator.choice([reasons.OK, reasons.INVALID_BRANCH, reasons.INVALID_ACCOUNT]))
+        for _ in range(size)
+    ]
+
+
+def _report(stream, **kwargs):
+    report = ValidationReport(**kwargs)
+    for bank_code, branch, reason in stream:
+        report.add(bank_code, branch, reason)
+    return report
+
+
+class ValidationReportTestCase(unittest.TestCase):
+    def test_track(self):
+        report = ValidationReport()
+        results = list(report.track(iter(RECORDS), chunk_size=7))
+        self.assertEqual(results, list(validate_many(RECORDS)))
+
+        summary = report.to_dict()
+        self.assertEqual(summary['total'], len(RECORDS))
+        self.assertEqual(summary['valid'], results.count(reasons.OK))
+        self.assertEqual(sum(summary['reasons'].values()), len(RECORDS))
+        self.assertEqual(summary['reasons']['BankNotImplemented'], 1)
+        self.assertEqual(summary['reasons']['InvalidBranchlength'], 1)
+        self.assertEqual(summary['reasons']['MissingBranchDigit'], 1)
+        self.assertNotIn('999', summary['banks'])
+        self.assertEqual(sum(bank['total'] for bank in summary['banks'].values()), len(RECORDS) - 1)
+
+    def test_exact_top_branches(self):
+        stream = _stream(5000, 50, seed=0)
+        report = _report(stream, top_k=5)
+        expected = _failures(stream)
+
+        self.assertEqual(report.branch_error, 0)
+        self.assertEqual(dict(((bank_code, branch), failures) for bank_code, branch, failures in report.top_branches()),
+                         dict(expected.most_common(5)))
+
+    def test_bounded_sketch(self):
+        stream = _stream(20000, 5000, seed=1)
+        report = _report(stream, top_k=5, capacity=50)
+        expected = _failures(stream)
+
+        self.assertLessEqual(len(report.branches), 50)
+        self.assertLess(report.branch_error, sum(expected.values()) / 50.0)
+        for key, failures in expected.items():
+            tracked = report.branches.get(key, 0)
+            self.assertTrue(failures - report.branch_error <= tracked <= failures, key)
+
+    def test_merge(self):
+        stream = _stream(6000, 40, seed=2)
+        whole = _report(stream)
+        shards = [_report(stream[i::3]) for i in range(3)]
+
+        merged = shards[0].merge(shards[1]).merge(shards[2])
+        self.assertEqual(merged.to_dict(), whole.to_dict())
+
+    def test_merge_bounded(self):
+        stream = _stream(20000, 5000, seed=3)
+        expected = _failures(stream)
+        merged = _report(stream[:10000], capacity=50).merge(_report(stream[10000:], capacity=50))
+
+        self.assertLessEqual(len(merged.branches), 50)
+        for key, failures in expected.items():
+            self.assertTrue(failures - merged.branch_error <= merged.branches.get(key, 0) <= failures, key)
+
+    def test_json_round_trip(self):
+        stream = _stream(3000, 500, seed=4)
+        first, second = _report(stream[:1500], capacity=100), _report(stream[1500:], capacity=100)
+
+        restored = ValidationReport.from_dict(json.loads(first.to_json()))
+        self.assertEqual(restored.to_dict(), first.to_dict())
+        self.assertEqual(restored.merge(second).to_dict(), first.merge(second).to_dict())
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            ValidationReport(top_k=0)
+        with self.assertRaises(ValueError):
+            ValidationReport(top_k=20, capacity=10)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import re
+import unittest
+
+from bank_account_validator import metrics, reasons
+from bank_account_validator.core import Bank, BankMeta, BrazilianBank, check
+from bank_account_validator.countries.br import RULES
+from bank_account_validator.kernels import ChecksumKernel, DigitTable
+from bank_account_validator.rules import compile_rule, rule_version
+
+from tests.data import BANCO_DO_BRASIL, BANRISUL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+
+class RulesTestBank(Bank):
+    country = 'ZZ'
+
+
+class CompileRuleTestCase(unittest.TestCase):
+    def test_compiles_kernels(self):
+        bank_class = compile_rule({
+            'name': 'Compiled',
+            'bank_code': '901',
+            'branch_digit_length': 1,
+            'account_length': 6,
+            'checks': (
+                {'fields': ('branch',), 'pivot': '5432', 'remap': {10: 'X', 11: '0'}},
+                {'fields': ('account',), 'pivot': '765432', 'method': 'mod10'},
+            ),
+        }, RulesTestBank)
+
+        self.assertEqual(bank_class.__name__, 'Compiled')
+        self.assertIs(Bank.get('901', 'ZZ'), bank_class)
+        self.assertEqual(bank_class.account_length, 6)
+        self.assertEqual(bank_class.branch_kernel.pivot, '5432')
+        self.assertIsInstance(bank_class.branch_digit_table, DigitTable)
+        self.assertEqual(bank_class.account_kernel.method, 'mod10')
+        self.assertIsNone(bank_class.combination_kernel)
+        self.assertEqual(bank_class.rule['bank_code'], '901')
+
+    def test_length_only(self):
+        bank_class = compile_rule({'bank_code': '902'}, RulesTestBank)
+        self.assertEqual(bank_class.__name__, 'Bank902')
+        self.assertEqual(bank_class.check(branch='1', account='123', account_digit='5'), reasons.OK)
+        self.assertEqual(bank_class.check(branch='1', account='123'), reasons.MISSING_ACCOUNT_DIGIT)
+
+    def test_invalid_rules(self):
+        invalid = [
+            {'name': 'NoCode'},
+            {'bank_code': '903', 'acount_length': 5},
+            {'bank_code': '903', 'checks': ({'fields': ('account',), 'pivot': '12345'},)},
+            {'bank_code': '903', 'checks': ({'fields': ('account', 'branch'), 'pivot': '1' * 14},)},
+            {'bank_code': '903', 'checks': ({'fields': ('account',), 'pivot': '1' * 10, 'modulo': 11},)},
+            {'bank_code': '903', 'checks': ({'fields': ('account',), 'pivot': '1' * 10, 'method': 'mod7'},)},
+            {'bank_code': '903', 'checks': ({'fields': ('account',), 'compute': len},)},
+            {'bank_code': '903', 'checks': ({'fields': ('account',), 'pivot': '1' * 10},) * 2},
+        ]
+        for rule in invalid:
+            with self.assertRaises(RuntimeError):
+                compile_rule(rule, RulesTestBank)
+        self.assertNotIn(('ZZ', '903'), BankMeta.registry)
+
+
+class BrazilianRulesTestCase(unittest.TestCase):
+    def test_every_rule_is_registered(self):
+        for rule in RULES:
+            bank_class = BrazilianBank.get(rule['bank_code'])
+            self.assertEqual(bank_class.__name__, rule['name'])
+            self.assertIs(bank_class.rule, rule)
+            self.assertEqual(bank_class.__module__, 'bank_account_validator.countries.br')
+
+    def test_fixtures(self):
+        for data in (BANCO_DO_BRASIL, SANTANDER, CAIXA_ECONOMICA_FEDERAL, BRADESCO, ITAU):
+            for expected, key in ((True, 'valid_combinations'), (False, 'invalid_combinations')):
+                for account in data[key]:
+                    account = dict(account)
+                    validator = BrazilianBank.get(account.pop('bank_code')).validator
+                    self.assertEqual(validator.is_valid(**account), expected, account)
+
+        for branch, branch_digits in BANRISUL['correct_data']:
+            self.assertEqual(BrazilianBank.get('041').compute_branch_digit(branch), branch_digits)
+
+    def test_checksum_banks_match_their_kernels(self):
+        self.assertEqual(BrazilianBank.get('237').account_kernel.pivot, '2765432')
+        self.assertIsInstance(BrazilianBank.get('341').combination_kernel, ChecksumKernel)
+        self.assertEqual(BrazilianBank.get('041').branch_digit_table.width, 2)
+
+    def test_banks_without_rules_are_not_implemented(self):
+        self.assertEqual(check('999', '0001', '', '1', '0'), reasons.BANK_NOT_IMPLEMENTED)
+
+
+class RuleVersionTestCase(unittest.TestCase):
+    RULE = {
+        'name': 'Versioned',
+        'bank_code': '903',
+        'branch_digit_length': 1,
+        'account_length': 6,
+        'checks': (
+            {'fields': ('branch',), 'pivot': '5432', 'remap': {10: 'X', 11: '0'}},
+            {'fields': ('account',), 'pivot': '765432'},
+        ),
+    }
+
+    def version(self, **changes):
+        rule = dict(self.RULE, **changes)
+        return rule_version(compile_rule(rule, RulesTestBank))
+
+    def test_same_rule_same_version(self):
+        self.assertEqual(self.version(), self.version())
+        self.assertEqual(self.version(checks=list(self.RULE['checks'])), self.version())
+        self.assertTrue(re.match('^[0-9a-f]{16}$', self.version()))
+
+    def test_rule_changes(self):
+        versions = set([
+            self.version(),
+            self.version(bank_code='904'),
+            self.version(account_length=7, checks=self.RULE['checks'][:1]),
+            self.version(checks=self.RULE['checks'][:1]),
+            self.version(checks=self.RULE['checks'][:1] + ({'fields': ('account',), 'pivot': '765439'},)),
+            self.version(checks=self.RULE['checks'][:1] + ({'fields': ('account',), 'pivot': '765432', 'method': 'mod10'},)),
+            self.version(checks=({'fields': ('branch',), 'pivot': '5432', 'remap': {10: '0', 11: '0'}},)),
+        ])
+        self.assertEqual(len(versions), 7)
+
+    def test_compute_functions(self):
+        def first(branch):
+            return branch[0]
+
+        def last(branch):
+            return branch[-1]
+
+        def version(compute):
+            return self.version(checks=({'fields': ('branch',), 'compute': compute},))
+
+        self.assertEqual(version(first), version(first))
+        self.assertNotEqual(version(first), version(last))
+
+    def test_every_bank_has_its_own_version(self):
+        bank_classes = [BrazilianBank.get(rule['bank_code']) for rule in RULES]
+        versions = [rule_version(bank_class) for bank_class in bank_classes]
+        self.assertEqual(len(set(versions)), len(versions))
+        self.assertEqual([rule_version(bank_class) for bank_class in bank_classes], versions)
+
+    def test_metrics_leave_versions_alone(self):
+        bank_class = BrazilianBank.get('237')
+        version = rule_version(bank_class)
+        metrics.enable()
+        try:
+            self.assertEqual(rule_version(bank_class), version)
+        finally:
+            metrics.disable()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import json
+import socket
+import sys
+import threading
+import unittest
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest('The validation server needs Python 3.7+')
+
+import asyncio  # noqa: E402
+import http.client  # noqa: E402
+
+from bank_account_validator import metrics  # noqa: E402
+from bank_account_validator.server import ValidationServer  # noqa: E402
+
+
+class ValidationServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = asyncio.new_event_loop()
+        cls.server = cls.loop.run_until_complete(ValidationServer(port=0, workers=1, offload_threshold=10).start())
+        cls.thread = threading.Thread(target=cls.loop.run_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        asyncio.run_coroutine_threadsafe(cls.server.close(), cls.loop).result()
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join()
+        cls.loop.close()
+
+    def request(self, method, path, payload=None, body=None):
+        connection = http.client.HTTPConnection('127.0.0.1', self.server.port, timeout=10)
+        try:
+            if payload is not None:
+                body = json.dumps(payload)
+            connection.request(method, path, body=body, headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read().decode('utf-8'))
+        finally:
+            connection.close()
+
+    def test_health(self):
+        self.assertEqual(self.request('GET', '/health'), (200, {'status': 'ok'}))
+
+    def test_metrics(self):
+        metrics.enable()
+        try:
+            account = {'bank_code': '237', 'branch': '1769', 'branch_digit': '8', 'account': '200040', 'account_digit': '7'}
+            self.request('POST', '/validate', account)
+
+            connection = http.client.HTTPConnection('127.0.0.1', self.server.port, timeout=10)
+            connection.request('GET', '/metrics')
+            response = connection.getresponse()
+            body = response.read().decode('utf-8')
+            connection.close()
+        finally:
+            metrics.disable()
+
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.getheader('Content-Type').startswith('text/plain'))
+        self.assertIn('bank_account_validator_validations_total{country="BR",bank_code="237",outcome="OK"} 1', body)
+
+    def test_single_account(self):
+        account = {'bank_code': '237', 'branch': '1769', 'branch_digit': '8', 'account': '200040', 'account_digit': '7'}
+        self.assertEqual(self.request('POST', '/validate', account),
+                         (200, {'valid': True, 'reason': 'OK', 'reason_code': 0}))
+
+        account['branch_digit'] = '0'
+        self.assertEqual(self.request('POST', '/validate', account),
+                         (200, {'valid': False, 'reason': 'InvalidBranch', 'reason_code': 8}))
+
+    def test_batch(self):
+        for size in (3, 30):  # below and above the offload threshold
+            accounts = [['237', '1769', '8', '200040', '7'], ['999', '1769', '8', '200040', '7'],
+                        {'bank_code': '033', 'branch': '2006', 'account': '01008407', 'account_digit': '4'}] * (size // 3)
+            status, payload = self.request('POST', '/validate/batch', {'accounts': accounts})
+
+            self.assertEqual(status, 200)
+            self.assertEqual([result['reason'] for result in payload['results']], ['OK', 'BankNotImplemented', 'OK'] * (size // 3))
+
+    def test_keep_alive(self):
+        connection = http.client.HTTPConnection('127.0.0.1', self.server.port, timeout=10)
+        try:
+            for _ in range(3):
+                connection.request('GET', '/health')
+                response = connection.getresponse()
+                self.assertEqual(response.status, 200)
+                response.read()
+        finally:
+            connection.close()
+
+    def test_errors(self):
+        self.assertEqual(self.request('GET', '/nope')[0], 404)
+        self.assertEqual(self.request('GET', '/validate')[0], 405)
+        self.assertEqual(self.request('POST', '/validate', body='not json')[0], 400)
+        self.assertEqual(self.request('POST', '/validate/batch', {'accounts': 'nope'})[0], 400)
+        self.assertEqual(self.request('POST', '/validate/batch', {'accounts': [{'branch': '1'}]})[0], 400)
+        self.assertEqual(self.request('POST', '/validate', {'bank_code': ['x'], 'branch': '1', 'account': '1'})[0], 400)
+        self.assertEqual(self.request('POST', '/validate/batch', {'accounts': [[{}, '1', '', '1', '']]})[0], 400)
+        for account in ([], ['237', '1769'], '23717', 237, None):
+            self.assertEqual(self.request('POST', '/validate/batch', {'accounts': [account]})[0], 400, account)
+        self.assertEqual(self.request('POST', '/validate', {'country': ['BR'], 'bank_code': '237', 'branch': '1',
+                                                            'account': '1'})[0], 400)
+
+    def raw_request(self, data):
+        with socket.create_connection(('127.0.0.1', self.server.port), timeout=10) as connection:
+            connection.sendall(data)
+            return connection.makefile('rb').readline()
+
+    def test_oversized_headers(self):
+        huge = b'x' * (128 * 1024)
+        self.assertEqual(self.raw_request(b'GET /health HTTP/1.1\r\nX-Huge: ' + huge + b'\r\n\r\n'),
+                         b'HTTP/1.1 431 Request Header Fields Too Large\r\n')
+        self.assertEqual(self.raw_request(b'GET /' + huge + b' HTTP/1.1\r\n\r\n'), b'HTTP/1.1 400 Bad Request\r\n')
+        self.assertEqual(self.request('GET', '/health')[0], 200)
+
+    def test_unexpected_errors(self):
+        async def dispatch(method, path, body):
+            raise RuntimeError('bug')
+
+        self.server.dispatch = dispatch
+        try:
+            self.assertEqual(self.request('POST', '/validate', {}), (500, {'error': 'Internal server error.'}))
+        finally:
+            del self.server.dispatch
+        self.assertEqual(self.request('GET', '/health')[0], 200)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import random
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.core import AccountRecord, BrazilianBank, check
+from bank_account_validator.suggestions import _brute_force, _kernel_suggestions, suggest, suggest_many
+
+
+def _fields(records):
+    return sorted((x.branch, x.branch_digit, x.account, x.account_digit) for x in records)
+
+
+class SuggestTestCase(unittest.TestCase):
+    def test_changed_account_digit(self):
+        suggestions = suggest('237', '1769', '8', '200041', '7')
+        self.assertIn(AccountRecord('1769', '8', '0200040', '7'), suggestions)
+        self.assertIn(AccountRecord('1769', '8', '0200041', '5'), suggestions)
+
+    def test_swapped_digits(self):
+        self.assertIn(AccountRecord('2006', '', '01008407', '4'), suggest('033', '2006', '', '01004807', '4'))
+        self.assertIn(AccountRecord('2006', '', '01008407', '4'), suggest('033', '2060', '', '01008407', '4'))
+
+    def test_branch(self):
+        self.assertIn(AccountRecord('1769', '8', '0200040', '7'), suggest('237', '1769', '1', '200040', '7'))
+
+    def test_every_suggestion_is_valid(self):
+        records = [('001', '0395', '6', '45938', '9'), ('341', '2545', '', '02366', '2'), ('041', '0100', '18', '358507671', '8')]
+        for record in records:
+            suggestions = suggest(*record)
+            self.assertTrue(suggestions)
+            for suggestion in suggestions:
+                self.assertEqual(check(record[0], suggestion.branch, suggestion.branch_digit, suggestion.account,
+                                       suggestion.account_digit), reasons.OK)
+
+    def test_no_suggestions(self):
+        self.assertEqual(suggest('237', '1769', '8', '200040', '7'), [])  # valid
+        self.assertEqual(suggest('237', '1769', '', '200040', '7'), [])  # missing digit
+        self.assertEqual(suggest('999', '1769', '8', '200040', '7'), [])
+
+    def test_incremental_matches_brute_force(self):
+        generator = random.Random(0)
+        for bank_code in ('001', '033', '041', '104', '237', '341', '399', '745'):
+            validator = BrazilianBank.get(bank_code).validator
+            tested = 0
+            while tested < 30:
+                fields = (
+                    str(generator.randint(0, 9999)).zfill(validator.branch_length),
+                    ''.join(generator.choice('0123456789') for _ in range(validator.branch_digit_length)),
+                    str(generator.randint(0, 10 ** validator.account_length - 1)).zfill(validator.account_length),
+                    generator.choice('0123456789'),
+                )
+                reason = validator.check_digits(*fields)
+                if reason not in (reasons.INVALID_ACCOUNT, reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION):
+                    continue
+
+                tested += 1
+                self.assertEqual(_fields(_kernel_suggestions(validator, *(fields + (reason,)))),
+                                 _fields(_brute_force(validator, *(fields + (reason,)))))
+
+    def test_suggest_many(self):
+        records = [('237', '1769', '8', '200040', '7'), {'bank_code': '237', 'branch': '1769', 'branch_digit': '8',
+                                                         'account': '200041', 'account_digit': '7'}]
+        results = list(suggest_many(records))
+        self.assertEqual(results[0], [])
+        self.assertIn(AccountRecord('1769', '8', '0200040', '7'), results[1])
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+import threading
+import unittest
+
+from bank_account_validator import reasons
+from bank_account_validator.batch import validate_chunk, validate_many
+from bank_account_validator.cache import ResultCache
+from bank_account_validator.core import BankMeta, BrazilianBank
+from bank_account_validator.exceptions import BaseBankAccountValidationError
+
+from tests.data import BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+THREADS = 8
+
+FIRST_LOOKUPS = '''
+import threading
+from bank_account_validator.core import Bank
+
+barrier = threading.Barrier(16)
+results = []
+
+def lookup():
+    barrier.wait()
+    results.append(Bank.get('237', 'BR').check(branch='1769', branch_digit='8', account='200040', account_digit='7'))
+
+threads = [threading.Thread(target=lookup) for _ in range(16)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(' '.join(str(x) for x in results))
+'''
+
+
+def _records():
+    # Fixture records plus, for every Brazilian bank, accounts with computed (valid) and shifted (invalid) digits.
+    records = [
+        (data['bank_code'], data['branch'], data['branch_digit'], data['account'], data['account_digit'])
+        for bank in (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER)
+        for data in bank['valid_combinations'] + bank['invalid_combinations']
+    ]
+
+    for (country, bank_code), bank_class in sorted(BankMeta.registry.items()):
+        if country != 'BR':
+            continue
+        for i in range(1, 40):
+            branch = '{:04d}'.format(i * 251 % 10000)
+            account = '{}'.format(i * 7919).zfill(bank_class.account_length)[-bank_class.account_length:]
+            branch_digit = ''
+            if bank_class.branch_digit_length:
+                branch_digit = bank_class.compute_branch_digit(branch) or ''
+            account_digit = bank_class.compute_account_digit(branch, account) or '0'
+            records.append((bank_code, branch, branch_digit, account, account_digit))
+            records.append((bank_code, branch, branch_digit, account, str((i + 3) % 10)))
+    return records
+
+
+def _reset_lazy_state():
+    # Drops every validator and digit table built so far, so the threads race to build them again.
+    for bank_class in BankMeta.registry.values():
+        if '_validator' in vars(bank_class):
+            delattr(bank_class, '_validator')
+        if bank_class.branch_digit_table is not None:
+            bank_class.branch_digit_table._table = None
+
+
+def _execute(bank_class, record):
+    try:
+        bank_class(branch=record[1], branch_digit=record[2], account=record[3], account_digit=record[4]).execute()
+    except BaseBankAccountValidationError as e:
+        return type(e)
+    return None
+
+
+def _run_concurrently(func, threads=THREADS):
+    # Calls func(thread_number) from `threads` threads released at the same time; returns their results in order.
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+    errors = []
+
+    def target(number):
+        try:
+            barrier.wait()
+            results[number] = func(number)
+        except Exception as e:  # pragma: no cover - reported by the assertion below
+            errors.append(e)
+
+    workers = [threading.Thread(target=target, args=(number,)) for number in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+class ValidateManyThreadsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = _records() * 3
+
+    def test_same_results_as_sequential(self):
+        expected = list(validate_many(self.records))
+        self.assertEqual(list(validate_many(self.records, executor='threads', workers=4, chunk_size=7, max_pending=3)),
+                         expected)
+
+    def test_shared_cache(self):
+        cache = ResultCache()
+        expected = list(validate_many(self.records))
+        self.assertEqual(list(validate_many(self.records, executor='threads', workers=4, chunk_size=11, cache=cache)),
+                         expected)
+        self.assertEqual(cache.hits + cache.misses, len(self.records))
+
+    def test_processes(self):
+        expected = list(validate_many(self.records))
+        self.assertEqual(list(validate_many(self.records, executor='processes', workers=2, chunk_size=50)), expected)
+
+    def test_empty_input(self):
+        self.assertEqual(list(validate_many([], executor='threads')), [])
+
+    def test_invalid_executor(self):
+        with self.assertRaises(ValueError):
+            validate_many([], executor='fibers')
+
+    def test_processes_cannot_share_a_cache(self):
+        with self.assertRaises(ValueError):
+            validate_many([], executor='processes', cache=ResultCache())
+
+
+class ThreadSafetyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = _records()
+        self.expected = validate_chunk(self.records)
+
+    def test_validators_built_concurrently(self):
+        _reset_lazy_state()
+        results = _run_concurrently(lambda number: validate_chunk(self.records[number:] + self.records[:number]))
+        for number, result in enumerate(results):
+            self.assertEqual(result, self.expected[number:] + self.expected[:number])
+
+    def test_bank_instances(self):
+        expected = [_execute(BrazilianBank.get(record[0]), record) for record in self.records]
+        _reset_lazy_state()
+        results = _run_concurrently(lambda number: [_execute(BrazilianBank.get(record[0]), record) for record in self.records])
+        self.assertEqual(results, [expected] * THREADS)
+
+    def test_compute_digits(self):
+        bank_classes = [bank_class for (country, _), bank_class in sorted(BankMeta.registry.items()) if country == 'BR']
+        branches = ['{:04d}'.format(i * 37) for i in range(200)]
+        expected = [bank_class.compute_branch_digits(branches) for bank_class in bank_classes]
+        _reset_lazy_state()
+        results = _run_concurrently(lambda number: [bank_class.compute_branch_digits(branches) for bank_class in bank_classes])
+        self.assertEqual(results, [expected] * THREADS)
+
+    def test_shared_cache(self):
+        cache = ResultCache(maxsize=len(self.records) // 2)
+        results = _run_concurrently(lambda number: validate_chunk(self.records, cache=cache))
+        self.assertEqual(results, [self.expected] * THREADS)
+        self.assertEqual(cache.hits + cache.misses, len(self.records) * THREADS)
+        self.assertLessEqual(len(cache), len(self.records) // 2)
+
+    def test_first_lookups_load_the_country_once(self):
+        output = subprocess.check_output([sys.executable, '-c', FIRST_LOOKUPS]).decode('utf-8').split()
+        self.assertEqual(output, [str(reasons.OK)] * 16)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bank_account_validator import reasons, vectorized
+from bank_account_validator.batch import validate_many
+from bank_account_validator.core import BrazilianBank
+from bank_account_validator.utils import calculate_verifier_digit
+
+from tests.data import BANCO_DO_BRASIL, BANRISUL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER
+
+
+class CheckColumnsTestCase(unittest.TestCase):
+    def assertMatchesScalarPath(self, bank_code, records):
+        columns = [list(column) for column in zip(*records)]
+        expected = list(validate_many([(bank_code,) + tuple(record) for record in records]))
+        self.assertEqual([int(x) for x in vectorized.check_columns(BrazilianBank.get(bank_code), *columns)], expected)
+
+    def test_fixtures(self):
+        for bank in (BANCO_DO_BRASIL, BRADESCO, CAIXA_ECONOMICA_FEDERAL, ITAU, SANTANDER):
+            combinations = bank['valid_combinations'] + bank['invalid_combinations']
+            records = [(x['branch'], x['branch_digit'], x['account'], x['account_digit']) for x in combinations]
+            self.assertMatchesScalarPath(combinations[0]['bank_code'], records)
+
+    def test_every_bank(self):
+        records = [
+            ('1769', '8', '200040', '7'),
+            ('1769', '0', '200040', '7'),
+            ('1769', '8', '200040', '0'),
+            ('0196', '66', '1', '1'),
+            ('0196', '66', '12345678', '0'),
+            ('0196', '66', '12345678', '6'),
+            ('2006', '', '01008407', '4'),
+            ('17695', '8', '200040', '7'),
+            ('1769', '8', '2000407777777', '7'),
+            ('1769', '', '200040', ''),
+        ]
+        for bank_code in ('001', '033', '041', '104', '237', '341', '399', '745'):
+            bank_class = BrazilianBank.get(bank_code)
+            fitting = [
+                (branch, branch_digit[:bank_class.branch_digit_length] or '1' * bank_class.branch_digit_length,
+                 account, account_digit)
+                for branch, branch_digit, account, account_digit in records
+            ]
+            self.assertMatchesScalarPath(bank_code, records + fitting)
+
+    def test_banrisul_branches(self):
+        records = [(branch, digits, '1', '1') for branch, digits in BANRISUL['correct_data']]
+        records += [('{:04d}'.format(i), '{:02d}'.format(i % 100), '1', '1') for i in range(0, 10000, 37)]
+        self.assertMatchesScalarPath('041', records)
+
+    def test_length_errors(self):
+        results = vectorized.check_columns(BrazilianBank.get('237'), ['17695', '1769'], ['8', '8'], ['200040', '200040'],
+                                           ['7', ''])
+        self.assertEqual([int(x) for x in results], [reasons.INVALID_BRANCH_LENGTH, reasons.MISSING_ACCOUNT_DIGIT])
+
+    def test_normalized_columns(self):
+        results = vectorized.check_columns(BrazilianBank.get('237'), ['1769', '1769'], ['8', '8'], ['0200040', '0200040'],
+                                           ['7', '1'], normalized=True)
+        self.assertEqual([int(x) for x in results], [reasons.OK, reasons.INVALID_ACCOUNT])
+
+    def test_custom_validation_methods_are_used(self):
+        class StrictBank(BrazilianBank):
+            country = 'ZZ'
+            bank_code = '904'
+            account_length = 7
+
+            def validate(self):
+                return self.account != '0000001'
+
+        results = vectorized.check_columns(StrictBank, ['1', '1'], ['', ''], ['1', '2'], ['0', '0'])
+        self.assertEqual([int(x) for x in results], [reasons.INVALID_BRANCH_AND_ACCOUNT_COMBINATION, reasons.OK])
+
+
+class CalculateVerifierDigitsTestCase(unittest.TestCase):
+    def test_matches_calculate_verifier_digit(self):
+        values = ['{:09d}'.format(i * 7919) for i in range(500)]
+        for method in ('mod10', 'mod11'):
+            for sum_digits in (False, True):
+                expected = [calculate_verifier_digit(value, '212121212', method, sum_digits) for value in values]
+                result = vectorized.calculate_verifier_digits(values, '212121212', method, sum_digits)
+                self.assertEqual([int(x) for x in result], expected)
+
+    def test_remainder11(self):
+        result = vectorized.calculate_verifier_digits(['0000000000', '0000000001', '0000000002'], '8923456789', 'remainder11')
+        self.assertEqual([int(x) for x in result], [0, 9, 7])
+
+
+@unittest.skipIf(vectorized.HAS_NUMPY, 'NumPy is installed')
+class PurePythonFallbackTestCase(unittest.TestCase):
+    def test_returns_lists(self):
+        self.assertIsInstance(vectorized.check_columns(BrazilianBank.get('237'), ['1769'], ['8'], ['200040'], ['7']), list)